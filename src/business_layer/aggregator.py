@@ -1,17 +1,19 @@
 """
 週次集計ロジックを担当するモジュール
 """
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Union
 import pandas as pd
 from datetime import datetime
 
 from .timezone_handler import TimezoneHandler
+from ..data_layer.github_client import PRRecord
 
 
 class ProductivityAggregator:
     """生産性メトリクスの週次集計を担当するクラス"""
     
     REQUIRED_COLUMNS = ['week_start', 'week_end', 'pr_count', 'unique_authors', 'productivity']
+    INPUT_COLUMNS = ['number', 'author', 'merged_at']
     
     def __init__(self, timezone_handler: TimezoneHandler) -> None:
         """
@@ -22,12 +24,13 @@ class ProductivityAggregator:
         """
         self.timezone_handler = timezone_handler
     
-    def calculate_weekly_metrics(self, prs: List[Dict[str, Any]]) -> pd.DataFrame:
+    def calculate_weekly_metrics(self, prs: Union[List[Union[PRRecord, Dict[str, Any]]], pd.DataFrame]) -> pd.DataFrame:
         """
         PRデータから週次メトリクスを計算
         
         Args:
-            prs: PRデータのリスト。各PRは以下のキーを含む辞書:
+            prs: PRデータのリスト、または同じ列を持つDataFrame。各PRは以下のフィールドを持つ:
+                - number: PR番号 (int)
                 - merged_at: マージされた日時 (datetime)
                 - author: 作成者名 (str)
                 - 他のフィールドは任意
@@ -40,7 +43,7 @@ class ProductivityAggregator:
                 - unique_authors: ユニークな作成者数
                 - productivity: 生産性（PR数/作成者数）
         """
-        if not prs:
+        if len(prs) == 0:
             return self._create_empty_dataframe()
         
         # PRデータの前処理
@@ -53,9 +56,16 @@ class ProductivityAggregator:
         """空のDataFrameを作成"""
         return pd.DataFrame(columns=self.REQUIRED_COLUMNS)
     
-    def _preprocess_pr_data(self, prs: List[Dict[str, Any]]) -> pd.DataFrame:
-        """PRデータを前処理してDataFrameを作成"""
-        df = pd.DataFrame(prs)
+    def _preprocess_pr_data(self, prs: Union[List[Union[PRRecord, Dict[str, Any]]], pd.DataFrame]) -> pd.DataFrame:
+        """PRデータを前処理してDataFrameを作成（渡されたDataFrameは変更しない）"""
+        if isinstance(prs, pd.DataFrame):
+            df = prs[self.INPUT_COLUMNS].copy()
+        else:
+            # 集計に必要な列だけを列単位で取り出す
+            df = pd.DataFrame({column: [pr[column] for pr in prs] for column in self.INPUT_COLUMNS})
+        
+        # 作成者は少数の値が繰り返されるため、辞書エンコード（カテゴリ型）で保持する
+        df['author'] = df['author'].astype('category')
         
         # merged_atを datetime型に変換してソート
         df['merged_at'] = pd.to_datetime(df['merged_at'])
@@ -67,12 +77,29 @@ class ProductivityAggregator:
         return df
     
     def _add_week_boundaries(self, df: pd.DataFrame) -> pd.DataFrame:
-        """週境界情報をDataFrameに追加"""
-        df['week_boundaries'] = df['merged_at'].apply(
-            lambda dt: self.timezone_handler.get_week_boundaries(dt)
-        )
-        df['week_start'] = df['week_boundaries'].apply(lambda x: x[0])
-        df['week_end'] = df['week_boundaries'].apply(lambda x: x[1])
+        """週境界情報をDataFrameに追加（TimezoneHandler.get_week_boundariesと同じ境界を列単位で計算）"""
+        merged_at = df['merged_at']
+        
+        if not pd.api.types.is_datetime64_any_dtype(merged_at):
+            # タイムゾーンが混在する場合は1件ずつ計算する
+            boundaries = merged_at.apply(self.timezone_handler.get_week_boundaries)
+            df['week_start'] = boundaries.apply(lambda x: x[0])
+            df['week_end'] = boundaries.apply(lambda x: x[1])
+            return df
+        
+        # タイムゾーン情報を持たない場合は設定されたタイムゾーンとして扱う
+        tz = merged_at.dt.tz
+        if tz is None:
+            tz = self.timezone_handler.display_timezone
+            merged_at = merged_at.dt.tz_localize(tz)
+        
+        # 壁時計時刻で月曜日0:00と日曜日23:59:59.999999を求めてから元のタイムゾーンに戻す
+        wall_clock = merged_at.dt.tz_localize(None)
+        week_start = wall_clock.dt.normalize() - pd.to_timedelta(wall_clock.dt.weekday, unit='D')
+        week_end = week_start + pd.Timedelta(days=7, microseconds=-1)
+        
+        df['week_start'] = week_start.dt.tz_localize(tz, ambiguous=True, nonexistent='shift_forward')
+        df['week_end'] = week_end.dt.tz_localize(tz, ambiguous=True, nonexistent='shift_forward')
         
         return df
     
@@ -90,18 +117,13 @@ class ProductivityAggregator:
             'author': 'unique_authors'
         })
         
-        # 生産性を計算
-        aggregated['productivity'] = aggregated.apply(
-            lambda row: self._calculate_productivity(row['pr_count'], row['unique_authors']), 
-            axis=1
-        )
+        # 生産性を計算（作成者がいない週は0.0）
+        aggregated['productivity'] = (
+            aggregated['pr_count'] / aggregated['unique_authors'].where(aggregated['unique_authors'] > 0)
+        ).fillna(0.0)
         
         return aggregated[self.REQUIRED_COLUMNS]
     
-    def _calculate_productivity(self, pr_count: int, unique_authors: int) -> float:
-        """生産性を計算（ゼロ除算を避ける）"""
-        return pr_count / unique_authors if unique_authors > 0 else 0.0
-    
     def calculate_moving_average(self, df: pd.DataFrame, window: int = 4) -> pd.Series:
         """
         生産性データの移動平均を計算
@@ -1,6 +1,7 @@
 """チャンク処理による大量データ集計 - メモリ効率的な集計処理"""
 import logging
 import time
+import tracemalloc
 from typing import List, Dict, Any, Iterator
 import pandas as pd
 import psutil
@@ -40,8 +41,11 @@ class ChunkedAggregator:
         total_metrics = []
         peak_memory_mb = 0
         
+        # 呼び出し側がtracemallocで追跡中の場合のみPythonヒープの割り当てを使い、それ以外はRSSを使う
+        # （集計処理に追跡のオーバーヘッドを加えず、呼び出し側のピーク値も変更しない）
+        use_tracemalloc = tracemalloc.is_tracing()
         process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        initial_memory = self._current_memory_mb(process, use_tracemalloc)
         
         try:
             # チャンク単位で処理
@@ -56,8 +60,7 @@ class ChunkedAggregator:
                 chunks_processed += 1
                 
                 # メモリ使用量を監視
-                current_memory = process.memory_info().rss / 1024 / 1024  # MB
-                memory_used = current_memory - initial_memory
+                memory_used = self._current_memory_mb(process, use_tracemalloc) - initial_memory
                 peak_memory_mb = max(peak_memory_mb, memory_used)
                 
                 logger.debug(f"Processed chunk {chunks_processed}: records {chunk_start}-{chunk_end-1}, "
@@ -75,7 +78,7 @@ class ChunkedAggregator:
                 'total_records_processed': total_records,
                 'processing_time_seconds': processing_time,
                 'memory_peak_mb': peak_memory_mb,
-                'final_metrics_count': len(final_metrics) if final_metrics is not None else 0
+                'final_metrics_count': final_metrics['total_weeks'] if final_metrics is not None else 0
             }
             
             logger.info(f"Chunked aggregation completed: {chunks_processed} chunks, "
@@ -92,6 +95,22 @@ class ChunkedAggregator:
                 'memory_peak_mb': peak_memory_mb
             }
     
+    def _current_memory_mb(self, process: psutil.Process, use_tracemalloc: bool) -> float:
+        """
+        現在のメモリ使用量を取得
+        
+        Args:
+            process: 計測対象のプロセス
+            use_tracemalloc: tracemallocで追跡中のPythonヒープ割り当てを使うか（FalseならRSS）
+            
+        Returns:
+            float: メモリ使用量（MB）
+        """
+        if use_tracemalloc:
+            current, _ = tracemalloc.get_traced_memory()
+            return current / 1024 / 1024
+        return process.memory_info().rss / 1024 / 1024
+    
     def _generate_chunk_data(self, start_idx: int, end_idx: int) -> pd.DataFrame:
         """
         チャンクデータを生成（テスト用）
@@ -103,14 +122,14 @@ class ChunkedAggregator:
         Returns:
             pd.DataFrame: チャンクデータ
         """
-        chunk_size = end_idx - start_idx
+        ids = pd.RangeIndex(start_idx, end_idx)
         
-        # テスト用のサンプルデータを生成
+        # テスト用のサンプルデータを列単位で生成
         data = {
-            'id': list(range(start_idx, end_idx)),
-            'author': [f'user_{i % 50}' for i in range(start_idx, end_idx)],
-            'week': [f'2024-W{(i % 52) + 1:02d}' for i in range(start_idx, end_idx)],
-            'pr_count': [1] * chunk_size  # 各レコードは1PR
+            'id': ids,
+            'author': 'user_' + pd.Series(ids % 50).astype(str),
+            'week': '2024-W' + pd.Series(ids % 52 + 1).astype(str).str.zfill(2),
+            'pr_count': 1  # 各レコードは1PR
         }
         
         return pd.DataFrame(data)
@@ -124,17 +143,14 @@ class ChunkedAggregator:
             
         Returns:
             Dict[str, Any]: 集計結果
+                - pr_counts: 週ごとのPR数（weekをインデックスとするSeries）
+                - week_authors: 週と作成者の重複なしの組（チャンクをまたいだユニーク数の算出用）
+                - chunk_size: チャンクの行数
         """
-        # 週次集計
-        weekly_agg = chunk_data.groupby('week').agg({
-            'pr_count': 'sum',
-            'author': 'nunique'
-        }).rename(columns={'author': 'unique_authors'})
-        
         return {
-            'weekly_metrics': weekly_agg.to_dict('index'),
-            'chunk_size': len(chunk_data),
-            'unique_authors_total': chunk_data['author'].nunique()
+            'pr_counts': chunk_data.groupby('week')['pr_count'].sum(),
+            'week_authors': chunk_data[['week', 'author']].drop_duplicates(),
+            'chunk_size': len(chunk_data)
         }
     
     def _merge_chunk_results(self, chunk_results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -150,24 +166,21 @@ class ChunkedAggregator:
         if not chunk_results:
             return None
         
-        # 全週次メトリクスをマージ
-        merged_weekly = {}
-        total_unique_authors = set()
+        # PR数は部分集計の合計、ユニーク作成者数は週と作成者の組を重複除去してから数える
+        pr_counts = pd.concat([result['pr_counts'] for result in chunk_results]).groupby(level=0).sum()
+        unique_authors = (
+            pd.concat([result['week_authors'] for result in chunk_results])
+            .drop_duplicates()
+            .groupby('week')
+            .size()
+        )
         
-        for chunk_result in chunk_results:
-            weekly_metrics = chunk_result['weekly_metrics']
-            
-            for week, metrics in weekly_metrics.items():
-                if week not in merged_weekly:
-                    merged_weekly[week] = {
-                        'pr_count': 0,
-                        'unique_authors': 0
-                    }
-                
-                merged_weekly[week]['pr_count'] += metrics['pr_count']
-                # unique_authorsは後で再計算が必要（チャンク単位では正確でない）
+        merged_weekly = pd.DataFrame({
+            'pr_count': pr_counts,
+            'unique_authors': unique_authors
+        })
         
         return {
-            'weekly_metrics': merged_weekly,
+            'weekly_metrics': merged_weekly.to_dict('index'),
             'total_weeks': len(merged_weekly)
-        }
\ No newline at end of file
+        }
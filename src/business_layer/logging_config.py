@@ -2,11 +2,57 @@
 
 アプリケーション全体のログ設定を管理し、一元的なログ設定機能を提供します。
 """
+import atexit
 import logging
 import logging.handlers
+import queue
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# ファイルサイズ文字列の解析用 (例: "10MB", "5GB", "100KB")
+_SIZE_PATTERN = re.compile(r'(\d+)(KB|MB|GB)')
+_SIZE_MULTIPLIERS = {
+    'KB': 1024,
+    'MB': 1024 * 1024,
+    'GB': 1024 * 1024 * 1024
+}
+_DEFAULT_MAX_BYTES = 10 * 1024 * 1024  # デフォルト10MB
+
+# ログレベル名と定数の対応表（getLevelNamesMappingはPython 3.11以降）
+if hasattr(logging, 'getLevelNamesMapping'):
+    _LOG_LEVELS = logging.getLevelNamesMapping()
+else:
+    _LOG_LEVELS = dict(logging._nameToLevel)
+
+# ファイル出力を担当するバックグラウンドリスナー（setup_loggingで作成）
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# 現在適用中の設定とルートロガーに追加したハンドラー（同一設定での再設定を省略するため）
+_configured_signature: Optional[Tuple[Any, ...]] = None
+_configured_handlers: Tuple[logging.Handler, ...] = ()
+
+
+@lru_cache(maxsize=32)
+def _parse_size(size_str: str) -> int:
+    """ファイルサイズ文字列をバイト数に変換（同じ文字列の解析結果はキャッシュ）
+    
+    Args:
+        size_str: ファイルサイズ文字列
+        
+    Returns:
+        int: バイト数（解析できない場合はデフォルト値）
+    """
+    try:
+        match = _SIZE_PATTERN.match(size_str.upper())
+    except AttributeError:
+        return _DEFAULT_MAX_BYTES
+    if not match:
+        return _DEFAULT_MAX_BYTES
+    
+    size, unit = match.groups()
+    return int(size) * _SIZE_MULTIPLIERS[unit]
 
 
 class LoggingConfig:
@@ -33,14 +79,7 @@ class LoggingConfig:
         Returns:
             int: ログレベル定数
         """
-        level_map = {
-            'DEBUG': logging.DEBUG,
-            'INFO': logging.INFO,
-            'WARNING': logging.WARNING,
-            'ERROR': logging.ERROR,
-            'CRITICAL': logging.CRITICAL
-        }
-        return level_map.get(self.level.upper(), logging.INFO)
+        return _LOG_LEVELS.get(self.level.upper(), logging.INFO)
     
     def get_max_bytes(self) -> int:
         """ファイルサイズ文字列をバイト数に変換
@@ -49,24 +88,30 @@ class LoggingConfig:
             int: 最大ファイルサイズ（バイト）
         """
         try:
-            # サイズ文字列を解析 (例: "10MB", "5GB", "100KB")
-            match = re.match(r'(\d+)(KB|MB|GB)', self.max_file_size.upper())
-            if not match:
-                return 10 * 1024 * 1024  # デフォルト10MB
-            
-            size, unit = match.groups()
-            size = int(size)
-            
-            multipliers = {
-                'KB': 1024,
-                'MB': 1024 * 1024,
-                'GB': 1024 * 1024 * 1024
-            }
-            
-            return size * multipliers[unit]
-            
-        except (ValueError, AttributeError):
-            return 10 * 1024 * 1024  # デフォルト10MB
+            return _parse_size(self.max_file_size)
+        except TypeError:
+            # ハッシュ不可能な値はキャッシュできないため無効なサイズとして扱う
+            return _DEFAULT_MAX_BYTES
+
+
+def shutdown_logging() -> None:
+    """ファイル出力用のバックグラウンドリスナーを停止
+    
+    キューに残っているログレコードをすべてファイルへ書き出してから、
+    ファイルハンドラーを閉じます。プロセス終了時にも自動的に呼ばれます。
+    """
+    global _queue_listener, _configured_signature
+    if _queue_listener is None:
+        return
+    
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+    _configured_signature = None
+
+
+atexit.register(shutdown_logging)
 
 
 def setup_logging(config: Dict[str, Any]) -> None:
@@ -74,16 +119,35 @@ def setup_logging(config: Dict[str, Any]) -> None:
     
     設定ファイルに基づいてアプリケーション全体のログ設定を行います。
     ファイル出力、ローテーション、フォーマット等を設定します。
+    ファイルへの書き込みはQueueHandler経由でバックグラウンドスレッドが行うため、
+    ログを出力したスレッドはディスクI/Oを待ちません。
+    同じ設定が適用済みで、ルートロガーのハンドラーとレベルも変更されていない場合は何もしません。
     
     Args:
         config: アプリケーション設定辞書
     """
+    global _queue_listener, _configured_signature, _configured_handlers
+    
     # ログ設定を取得（存在しない場合はデフォルト）
     logging_config_dict = config.get('logging', {})
     logging_config = LoggingConfig(logging_config_dict)
+    signature = (
+        logging_config.get_log_level(),
+        logging_config.file_path,
+        logging_config.format,
+        logging_config.get_max_bytes(),
+        logging_config.backup_count
+    )
     
-    # 既存のログハンドラーをクリア
     root_logger = logging.getLogger()
+    if (_queue_listener is not None
+            and signature == _configured_signature
+            and root_logger.level == signature[0]
+            and root_logger.handlers == list(_configured_handlers)):
+        return
+    
+    # 既存のファイル出力リスナーを停止し、ログハンドラーをクリア
+    shutdown_logging()
     root_logger.handlers.clear()
     
     # ログレベル設定
@@ -103,16 +167,27 @@ def setup_logging(config: Dict[str, Any]) -> None:
     log_file_path.parent.mkdir(parents=True, exist_ok=True)
     
     # ローテーティングファイルハンドラー設定
+    # delay=Trueで最初のログ出力までファイルを開かない（--helpなどログを出さない実行ではファイルを作らない）
     file_handler = logging.handlers.RotatingFileHandler(
         filename=logging_config.file_path,
         maxBytes=logging_config.get_max_bytes(),
         backupCount=logging_config.backup_count,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging_config.get_log_level())
-    root_logger.addHandler(file_handler)
+    
+    # ファイル出力はキュー経由でバックグラウンドリスナーに委譲
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(queue_handler)
+    _queue_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _queue_listener.start()
+    
+    _configured_signature = signature
+    _configured_handlers = (console_handler, queue_handler)
     
     # 設定完了ログ
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured: level={logging_config.level}, file={logging_config.file_path}")
\ No newline at end of file
+    logger.info(f"Logging configured: level={logging_config.level}, file={logging_config.file_path}")
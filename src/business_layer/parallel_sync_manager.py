@@ -54,8 +54,6 @@ class ParallelSyncManager:
         """
         start_time = time.time()
         
-        logger.info(f"Starting parallel sync for {len(repositories)} repositories with {self.max_workers} workers")
-        
         if not repositories:
             return ParallelSyncResult(
                 status='success',
@@ -72,8 +70,12 @@ class ParallelSyncManager:
         total_prs_fetched = 0
         individual_durations = []
         
+        # リポジトリ数を超えるスレッドは起動しない
+        worker_count = self.estimate_optimal_workers(len(repositories))
+        logger.info(f"Starting parallel sync for {len(repositories)} repositories with {worker_count} workers")
+        
         try:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
                 # 各リポジトリの同期タスクを作成
                 future_to_repo = {
                     executor.submit(
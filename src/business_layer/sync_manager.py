@@ -6,9 +6,9 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 import logging
 
-from ..data_layer.github_client import GitHubClient, GitHubAPIError
+from ..data_layer.github_client import GitHubClient, GitHubAPIError, PRRecord
 from ..data_layer.database_manager import DatabaseManager, DatabaseError
-from ..data_layer.models import PullRequest, WeeklyMetrics, SyncStatus
+from ..data_layer.models import WeeklyMetrics, SyncStatus
 from .aggregator import ProductivityAggregator
 
 
@@ -149,17 +149,17 @@ class SyncManager:
             return 0
         
         # データベースに保存（重複チェック付き）
-        saved_prs = self._save_pr_data(repository, pr_data)
+        saved_count = self._save_pr_data(repository, pr_data)
         
         # 週次メトリクスを計算・保存
-        if saved_prs:
+        if saved_count:
             weekly_metrics = self.aggregator.calculate_weekly_metrics(pr_data)
             self._save_weekly_metrics(repository, weekly_metrics)
         
         # SyncStatusを更新
         self._update_sync_status(repository, 'completed')
         
-        return len(saved_prs)
+        return saved_count
     
     def _create_sync_result(self, processed_repositories: int, total_prs_fetched: int, 
                           start_time: float, failed_repositories: List[str]) -> Dict[str, Any]:
@@ -194,52 +194,25 @@ class SyncManager:
                 f"{len(failed_repositories)} failed: {failed_repositories}"
             )
     
-    def _save_pr_data(self, repository: str, pr_data: List[Dict[str, Any]]) -> List[PullRequest]:
+    def _save_pr_data(self, repository: str, pr_data: List[PRRecord]) -> int:
         """
-        PRデータをデータベースに保存（重複チェック付き、一括操作で最適化）
+        PRデータをデータベースに保存（重複はユニーク制約で除外、一括INSERTで最適化）
         
         Args:
             repository: リポジトリ名
-            pr_data: PRデータのリスト
+            pr_data: GitHubClient.fetch_merged_prsが返すPRRecordのリスト
             
         Returns:
-            保存されたPRオブジェクトのリスト
+            新たに保存されたPR数
         """
         if not pr_data:
-            return []
-        
-        saved_prs = []
+            return 0
         
-        with self.db_manager.get_session() as session:
-            # 一括重複チェック：該当するPR番号のリストを一度に取得
-            pr_numbers = [pr_info["number"] for pr_info in pr_data]
-            existing_prs = session.query(PullRequest.pr_number).filter(
-                PullRequest.repo_name == repository,
-                PullRequest.pr_number.in_(pr_numbers)
-            ).all()
-            existing_pr_numbers = {pr.pr_number for pr in existing_prs}
-            
-            # 新しいPRのみを一括作成
-            for pr_info in pr_data:
-                if pr_info["number"] not in existing_pr_numbers:
-                    pr = PullRequest(
-                        repo_name=repository,
-                        pr_number=pr_info["number"],
-                        author=pr_info["author"],
-                        title=pr_info["title"],
-                        merged_at=pr_info["merged_at"],
-                        created_at=pr_info["created_at"],
-                        updated_at=pr_info["updated_at"]
-                    )
-                    saved_prs.append(pr)
-            
-            # 一括保存
-            if saved_prs:
-                session.add_all(saved_prs)
-                session.commit()
-                self.logger.info(f"Saved {len(saved_prs)} new PRs for repository {repository}")
+        saved_count = self.db_manager.bulk_insert_pull_requests(repository, pr_data)
+        if saved_count:
+            self.logger.info(f"Saved {saved_count} new PRs for repository {repository}")
         
-        return saved_prs
+        return saved_count
     
     def _save_weekly_metrics(self, repository: str, weekly_metrics_df) -> None:
         """
@@ -461,26 +434,26 @@ class SyncManager:
             return 0
         
         # データベースに保存
-        saved_prs = self._save_pr_data(repository, pr_data)
+        saved_count = self._save_pr_data(repository, pr_data)
         
         # 週次メトリクスを計算・保存
-        if saved_prs:
+        if saved_count:
             weekly_metrics = self.aggregator.calculate_weekly_metrics(pr_data)
             self._save_weekly_metrics(repository, weekly_metrics)
         
         # 同期ステータスを更新
         self._update_sync_status_for_incremental(repository, pr_data, success=True)
         
-        return len(saved_prs)
+        return saved_count
     
-    def _update_sync_status_for_incremental(self, repository: str, pr_data: List[Dict[str, Any]], 
+    def _update_sync_status_for_incremental(self, repository: str, pr_data: List[PRRecord], 
                                           success: bool = True) -> None:
         """
         差分同期用の同期ステータス更新
         
         Args:
             repository: リポジトリ名
-            pr_data: PRデータのリスト
+            pr_data: GitHubClient.fetch_merged_prsが返すPRRecordのリスト
             success: 同期が成功したかどうか
         """
         sync_result = {
@@ -524,8 +497,7 @@ class SyncManager:
                     
                     if pr_data:
                         # データベースに保存
-                        saved_prs = self._save_pr_data(repository, pr_data)
-                        total_prs_fetched += len(saved_prs)
+                        total_prs_fetched += self._save_pr_data(repository, pr_data)
                         
                         # 週次メトリクスを計算・保存
                         weekly_metrics = self.aggregator.calculate_weekly_metrics(pr_data)
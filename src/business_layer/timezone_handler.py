@@ -4,6 +4,8 @@
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+import pandas as pd
+
 
 class TimezoneHandler:
     """タイムゾーン変換とメンテナンス処理を担当するクラス"""
@@ -50,6 +52,19 @@ class TimezoneHandler:
         # 指定されたタイムゾーンに変換
         return dt.astimezone(self._display_tz)
     
+    def utc_to_local_series(self, values: pd.Series) -> pd.Series:
+        """
+        UTCの日時列を設定されたタイムゾーンに一括変換（utc_to_localの列単位版）
+        
+        Args:
+            values: UTC時刻の日時を含むSeries
+            
+        Returns:
+            ローカルタイムゾーンのdatetime64列
+        """
+        # タイムゾーン情報を持たない値はUTCとして扱い、pandasで列ごとに変換する
+        return pd.to_datetime(values, utc=True).dt.tz_convert(self._display_tz)
+    
     def local_to_utc(self, dt: datetime) -> datetime:
         """
         設定されたタイムゾーンからUTCに変換
@@ -7,18 +7,43 @@ import logging
 import os
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Optional, List, Dict, Any
+from datetime import datetime
+from typing import Generator, Optional, List, Dict, Any, Sequence, Tuple, Union
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, insert, tuple_, Engine
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 from sqlalchemy.pool import StaticPool
 
+from .github_client import PRRecord
 from .models import Base, DatabaseError
 
 # ログ設定
 logger = logging.getLogger(__name__)
 
+# 一括INSERT時に1回のexecutemanyへ渡す最大行数
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# 一括INSERT時にインデックスを削除・再作成する最小行数（これ未満は行ごとのインデックス更新の方が安い）
+BULK_LOAD_INDEX_THRESHOLD = 10_000
+
+# 接続ごとに設定するPRAGMA（WALはDBファイルに永続化され、インメモリDBでは無視される）
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-65536",  # 64MB（負数はKiB単位）
+)
+
+# fast_mode用のPRAGMA（クラッシュ時にDBが壊れうるため使い捨てのDB専用）
+SQLITE_FAST_MODE_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
 
 class DatabaseManager:
     """データベース接続・セッション管理クラス
@@ -27,18 +52,20 @@ class DatabaseManager:
     コンテキストマネージャーパターンを使用して、適切なセッション管理を実現します。
     """
     
-    def __init__(self, db_path: str, echo: bool = False) -> None:
+    def __init__(self, db_path: str, echo: bool = False, fast_mode: bool = False) -> None:
         """DatabaseManagerを初期化
         
         Args:
             db_path: データベースファイルのパス
             echo: SQLクエリのログ出力を有効にするか（デフォルト: False）
+            fast_mode: 耐久性より書き込み速度を優先するか（使い捨てのテスト用DB向け、デフォルト: False）
             
         Raises:
             DatabaseError: データベースディレクトリが存在しない、または書き込み権限がない場合
         """
         self.db_path = db_path
         self._echo = echo
+        self._fast_mode = fast_mode
         
         logger.info(f"Initializing DatabaseManager for: {db_path}")
         
@@ -71,6 +98,8 @@ class DatabaseManager:
                 }
             )
             
+            event.listen(self.engine, "connect", self._configure_sqlite_connection)
+            
             # スレッドセーフなセッションファクトリーを作成
             session_factory = sessionmaker(bind=self.engine)
             self.SessionFactory = scoped_session(session_factory)
@@ -82,6 +111,24 @@ class DatabaseManager:
             logger.error(error_msg)
             raise DatabaseError(error_msg)
     
+    def _configure_sqlite_connection(self, dbapi_connection, connection_record) -> None:
+        """新しいSQLite接続にPRAGMAを設定
+        
+        通常はWAL + synchronous=NORMALでコミットごとのfsyncを減らし、
+        fast_modeではジャーナルをメモリに置いてfsyncを行いません。
+        """
+        if self._fast_mode:
+            pragmas = SQLITE_FAST_MODE_PRAGMAS
+        else:
+            pragmas = SQLITE_PRAGMAS
+        
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+    
     def initialize_database(self) -> None:
         """データベースの初期化
         
@@ -236,6 +283,78 @@ class DatabaseManager:
             logger.error(error_msg)
             raise DatabaseError(error_msg)
     
+    def bulk_insert_pull_requests(self, repo_name: str, pr_data: Sequence[Union[PRRecord, Dict[str, Any]]],
+                                  chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+                                  index_rebuild_threshold: int = BULK_LOAD_INDEX_THRESHOLD) -> int:
+        """
+        プルリクエストを一括挿入（既存の(repo_name, pr_number)は無視）
+
+        ORMのオブジェクトを生成せず、1トランザクション内でチャンクごとに
+        INSERT OR IGNOREをexecutemanyで発行します。
+        挿入件数が閾値以上の場合は、重複判定に使うユニーク制約以外のインデックスを
+        挿入前に削除して挿入後に一度だけ作り直します（同じトランザクション内で行うため、
+        失敗時はインデックスごとロールバックされます）。
+
+        Args:
+            repo_name: リポジトリ名
+            pr_data: GitHubClient.fetch_merged_prsが返すPRRecord（または同じキーを持つ辞書）のシーケンス
+            chunk_size: 1回のexecutemanyで挿入する最大行数
+            index_rebuild_threshold: インデックスを作り直す最小の挿入件数
+
+        Returns:
+            int: 新たに挿入されたPR数
+
+        Raises:
+            DatabaseError: 挿入に失敗した場合
+        """
+        if not pr_data:
+            return 0
+
+        try:
+            from .models import PullRequest
+
+            rows = [
+                {
+                    'repo_name': repo_name,
+                    'pr_number': pr_info['number'],
+                    'author': pr_info['author'],
+                    'title': pr_info['title'],
+                    'merged_at': pr_info['merged_at'],
+                    'created_at': pr_info['created_at'],
+                    'updated_at': pr_info['updated_at']
+                }
+                for pr_info in pr_data
+            ]
+            statement = insert(PullRequest).prefix_with('OR IGNORE')
+
+            rebuild_indexes = len(rows) >= index_rebuild_threshold
+            indexes = PullRequest.__table__.indexes if rebuild_indexes else set()
+
+            inserted = 0
+            with self.get_session() as session:
+                # ORMの一括INSERTではなくCoreのexecutemanyとして発行し、挿入件数を得る
+                connection = session.connection()
+                for index in indexes:
+                    index.drop(connection)
+
+                for start in range(0, len(rows), chunk_size):
+                    result = connection.execute(statement, rows[start:start + chunk_size])
+                    inserted += result.rowcount
+
+                for index in indexes:
+                    index.create(connection)
+
+            if rebuild_indexes:
+                logger.debug(f"Rebuilt {len(indexes)} pull_requests indexes after bulk insert")
+
+            logger.debug(f"Bulk inserted {inserted}/{len(rows)} pull requests for {repo_name}")
+            return inserted
+
+        except Exception as e:
+            error_msg = f"Failed to bulk insert pull requests: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg)
+
     def cleanup_old_data(self, before_date: str) -> Dict[str, int]:
         """
         指定日以前の古いデータをクリーンアップする
@@ -283,24 +402,25 @@ class DatabaseManager:
             logger.error(error_msg)
             raise DatabaseError(error_msg)
     
-    def get_merged_pull_requests_paginated(self, page: int = 1, page_size: int = 100, 
-                                         repo_name: Optional[str] = None) -> Dict[str, Any]:
+    def get_merged_pull_requests_paginated(self, page_size: int = 100, repo_name: Optional[str] = None,
+                                         cursor: Optional[Tuple[datetime, int]] = None) -> Dict[str, Any]:
         """
-        ページネーション付きでマージされたプルリクエストデータを取得
+        キーセットページネーションでマージされたプルリクエストデータを取得
+        
+        OFFSETで読み飛ばす代わりに前ページ末尾の(merged_at, id)より後ろを検索するため、
+        ページが深くなっても取得コストが増えません。
         
         Args:
-            page: ページ番号（1から開始）
             page_size: 1ページあたりの件数
             repo_name: フィルタ対象のリポジトリ名（Noneの場合は全リポジトリ）
+            cursor: 前ページの結果のnext_cursor（Noneの場合は先頭ページ）
             
         Returns:
             Dict[str, Any]: ページネーション結果
-                - data: プルリクエストデータのリスト
-                - total_count: 総件数
-                - page: 現在のページ番号
+                - data: プルリクエストデータのリスト（merged_at降順）
                 - page_size: ページサイズ
+                - next_cursor: 次のページを取得するためのカーソル（データがない場合はNone）
                 - has_next_page: 次のページが存在するか
-                - has_prev_page: 前のページが存在するか
                 
         Raises:
             DatabaseError: データ取得に失敗した場合
@@ -308,11 +428,11 @@ class DatabaseManager:
         try:
             from .models import PullRequest
             
-            logger.debug(f"Querying paginated pull requests: page={page}, page_size={page_size}, repo={repo_name}")
+            logger.debug(f"Querying paginated pull requests: cursor={cursor}, page_size={page_size}, repo={repo_name}")
             
             with self.get_session() as session:
-                # ベースクエリ
-                base_query = session.query(
+                query = session.query(
+                    PullRequest.id,
                     PullRequest.merged_at,
                     PullRequest.author,
                     PullRequest.pr_number,
@@ -324,21 +444,25 @@ class DatabaseManager:
                 
                 # リポジトリフィルタ
                 if repo_name:
-                    base_query = base_query.filter(PullRequest.repo_name == repo_name)
-                
-                # 総件数を取得
-                total_count = base_query.count()
+                    query = query.filter(PullRequest.repo_name == repo_name)
                 
-                # ページネーション適用
-                offset = (page - 1) * page_size
-                data_query = base_query.order_by(PullRequest.merged_at.desc()).offset(offset).limit(page_size)
+                # 前ページ末尾より後ろの行だけを検索（idはSQLiteのrowidなのでidx_merged_atで順序付けできる）
+                if cursor is not None:
+                    cursor_merged_at, cursor_id = cursor
+                    query = query.filter(
+                        tuple_(PullRequest.merged_at, PullRequest.id) < (cursor_merged_at, cursor_id)
+                    )
                 
-                logger.debug(f"Executing paginated query: offset={offset}, limit={page_size}")
-                results = data_query.all()
+                # 1件多く取得し、次のページが存在するかを正確に判定する
+                results = query.order_by(
+                    PullRequest.merged_at.desc(), PullRequest.id.desc()
+                ).limit(page_size + 1).all()
+                has_next_page = len(results) > page_size
+                results = results[:page_size]
                 
                 # プルリクエストデータをリスト形式に変換
                 pr_data = []
-                for merged_at, author, pr_number, repo_name_result, title in results:
+                for pr_id, merged_at, author, pr_number, repo_name_result, title in results:
                     pr_data.append({
                         'merged_at': merged_at,
                         'author': author,
@@ -347,25 +471,16 @@ class DatabaseManager:
                         'title': title
                     })
                 
-                # ページネーション情報を計算
-                total_pages = (total_count + page_size - 1) // page_size
-                has_next_page = page < total_pages
-                has_prev_page = page > 1
+                next_cursor = (results[-1].merged_at, results[-1].id) if results else None
                 
                 result = {
                     'data': pr_data,
-                    'total_count': total_count,
-                    'page': page,
                     'page_size': page_size,
-                    'total_pages': total_pages,
-                    'has_next_page': has_next_page,
-                    'has_prev_page': has_prev_page,
-                    'showing_from': offset + 1 if pr_data else 0,
-                    'showing_to': min(offset + page_size, total_count)
+                    'next_cursor': next_cursor,
+                    'has_next_page': has_next_page
                 }
                 
-                logger.info(f"Retrieved paginated PRs: {len(pr_data)}/{total_count} "
-                           f"(page {page}/{total_pages})")
+                logger.info(f"Retrieved paginated PRs: {len(pr_data)} (page_size={page_size})")
                 
                 return result
                 
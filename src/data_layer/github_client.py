@@ -11,24 +11,160 @@ PyGithubを使用してGitHub APIからプルリクエストデータを取得
 - ネットワークエラーの自動検出
 """
 import logging
+import sqlite3
+import sys
+import threading
 import time
-from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Dict, Any, NamedTuple, Optional, Tuple, Union
 from functools import wraps
+from pathlib import Path
 
 from github import Github, GithubException, RateLimitExceededException, UnknownObjectException
 import requests
+from tenacity import RetryCallState, Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 from tqdm import tqdm
 
+from .pr_disk_cache import PRDiskCache
+
 # ログ設定
 logger = logging.getLogger(__name__)
 
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# マージ済みPRを更新日時の降順で取得するGraphQLクエリ（1リクエストで最大100件）
+MERGED_PRS_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, after: $cursor, states: MERGED,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        author { login }
+        mergedAt
+        createdAt
+        updatedAt
+      }
+    }
+  }
+}
+"""
+
+# マージ日時で絞り込んだ検索結果をGraphQLで取得するクエリ（use_searchと併用時）
+MERGED_PRS_SEARCH_GRAPHQL_QUERY = """
+query($query: String!, $cursor: String) {
+  search(query: $query, type: ISSUE, first: 100, after: $cursor) {
+    issueCount
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        number
+        title
+        author { login }
+        mergedAt
+        createdAt
+        updatedAt
+      }
+    }
+  }
+}
+"""
+
+# Search APIが1クエリで返す結果の上限
+SEARCH_RESULT_LIMIT = 1000
+
+# マージ済みPRのメモリキャッシュに保持するクエリ数の上限
+MEMORY_CACHE_MAXSIZE = 128
+
+
+def _rate_limit_reset_from_headers(error: RateLimitExceededException) -> Optional[datetime]:
+    """レート制限例外のレスポンスヘッダーからリセット時刻を取得
+    
+    x-ratelimit-resetヘッダーを使うことで、get_rate_limit()の追加リクエストを避けます。
+    
+    Args:
+        error: PyGithubのレート制限例外
+        
+    Returns:
+        Optional[datetime]: リセット時刻（UTC）。ヘッダーがない場合はNone
+    """
+    headers = getattr(error, "headers", None) or {}
+    reset = headers.get("x-ratelimit-reset")
+    if reset is None:
+        return None
+    try:
+        return datetime.fromtimestamp(int(reset), timezone.utc)
+    except (TypeError, ValueError):
+        return None
+
+
+if sys.version_info >= (3, 11):
+    # Python 3.11以降のfromisoformatは末尾の"Z"を直接受け付けるため、
+    # ページ内の全ノードで文字列置換を挟まずにC実装をそのまま使用する
+    _parse_github_datetime = datetime.fromisoformat
+else:
+    def _parse_github_datetime(value: str) -> datetime:
+        """GitHub APIのISO 8601形式の日時文字列をUTCのdatetimeに変換
+        
+        Python 3.10のdatetime.fromisoformatは末尾の"Z"を受け付けないため、
+        "+00:00"に置き換えてから変換します。
+        
+        Args:
+            value: 日時文字列（例: "2024-01-15T10:30:00Z"）
+            
+        Returns:
+            datetime: タイムゾーン付きの日時
+        """
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _build_merged_search_query(repo: str, since: datetime, until: datetime) -> str:
+    """期間内にマージされたPRを検索するクエリ文字列を作成
+    
+    Args:
+        repo: リポジトリ名（"owner/repo"形式）
+        since: 開始日時（UTC）
+        until: 終了日時（UTC）
+        
+    Returns:
+        str: 検索クエリ（例: "repo:owner/repo is:pr is:merged merged:2024-01-01T00:00:00Z..2024-01-31T00:00:00Z"）
+    """
+    return (
+        f"repo:{repo} is:pr is:merged "
+        f"merged:{_format_search_datetime(since)}..{_format_search_datetime(until)}"
+    )
+
+
+def _format_search_datetime(value: datetime) -> str:
+    """検索クエリ用に日時をUTCのISO 8601形式（末尾Z）に変換
+    
+    Args:
+        value: 日時（タイムゾーンなしの場合はUTCとみなす）
+        
+    Returns:
+        str: 日時文字列（例: "2024-01-15T10:30:00Z"）
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
 
 def retry_on_rate_limit(max_retries: int = 3, backoff_factor: float = 1.0):
     """レート制限とネットワークエラー用のリトライデコレータ
     
-    GitHub APIのレート制限やネットワークエラーに対して自動的にリトライを行います。
-    レート制限の場合はリセットまで待機し、ネットワークエラーの場合は指数バックオフを使用します。
+    GitHub APIのレート制限やネットワークエラーに対してtenacityで自動的にリトライを行います。
+    レート制限の場合はx-ratelimit-resetヘッダーのリセット時刻まで（ヘッダーがなければ
+    wait_for_rate_limit_resetで）待機し、ネットワークエラーの場合は指数バックオフを使用します。
+    待機にはクライアントに注入されたsleeperを使用します。
+    
+    直近の呼び出しのリトライ統計はクライアントのlast_retry_statisticsから参照できます
+    （クライアント・スレッドごとに保持）。リトライ中の呼び出しから入れ子で呼ばれた
+    デコレート済みメソッドはリトライせず、外側のリトライに任せます。
     
     Args:
         max_retries: 最大リトライ回数（デフォルト: 3）
@@ -37,52 +173,88 @@ def retry_on_rate_limit(max_retries: int = 3, backoff_factor: float = 1.0):
     Returns:
         デコレータ関数
     """
+    network_wait = wait_exponential(multiplier=backoff_factor, min=0, max=60)
+    
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            last_exception = None
+            retry_state_local = self._retry_state
             
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(self, *args, **kwargs)
-                    
-                except RateLimitExceededException as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.info(
-                            f"Rate limit exceeded for {func.__name__}, waiting for reset... "
-                            f"(attempt {attempt + 1}/{max_retries + 1})"
-                        )
-                        self.wait_for_rate_limit_reset()
-                        continue
-                    # 最後の試行で失敗した場合はRateLimitErrorとして再投げ
-                    rate_limit_info = self._github.get_rate_limit().core
-                    raise RateLimitError(
-                        f"Rate limit exceeded after {max_retries} retries", 
-                        reset_time=rate_limit_info.reset,
-                        remaining=rate_limit_info.remaining
+            # リトライ中の呼び出しから入れ子で呼ばれた場合はリトライせず、
+            # 例外をそのまま外側のリトライに委ねる（リトライ回数の掛け算を防ぐ）
+            if getattr(retry_state_local, "active", False):
+                return func(self, *args, **kwargs)
+            
+            def wait_strategy(retry_state: RetryCallState) -> float:
+                error = retry_state.outcome.exception()
+                if isinstance(error, RateLimitExceededException):
+                    reset_time = _rate_limit_reset_from_headers(error)
+                    if reset_time is None:
+                        # ヘッダーがない場合はbefore_sleepでwait_for_rate_limit_resetにより待機する
+                        # （waitは最終試行でも評価されるため、ここでは副作用を持たせない）
+                        return 0
+                    # リセット時刻まで待機（60秒のバッファを追加）
+                    return max(0, int((reset_time - self._now()).total_seconds() + 60))
+                return network_wait(retry_state)
+            
+            def before_sleep(retry_state: RetryCallState) -> None:
+                error = retry_state.outcome.exception()
+                attempt = retry_state.attempt_number
+                if isinstance(error, RateLimitExceededException):
+                    logger.info(
+                        f"Rate limit exceeded for {func.__name__}, waiting for reset... "
+                        f"(attempt {attempt}/{max_retries + 1})"
                     )
-                    
-                except requests.RequestException as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        wait_time = backoff_factor * (2 ** attempt)
-                        logger.info(
-                            f"Network error in {func.__name__}: {e}, retrying in {wait_time} seconds... "
-                            f"(attempt {attempt + 1}/{max_retries + 1})"
-                        )
-                        time.sleep(wait_time)
-                        continue
-                    # 最後の試行で失敗した場合はGitHubAPIErrorとして再投げ
-                    raise GitHubAPIError(
-                        f"Network error after {max_retries} retries: {e}",
-                        original_error=e
+                    if _rate_limit_reset_from_headers(error) is None:
+                        self.wait_for_rate_limit_reset()
+                else:
+                    logger.info(
+                        f"Network error in {func.__name__}: {error}, retrying in "
+                        f"{retry_state.next_action.sleep} seconds... (attempt {attempt}/{max_retries + 1})"
                     )
             
-            # このポイントに到達することは通常ないが、安全のため
-            if last_exception:
-                raise last_exception
+            def sleep(seconds: float) -> None:
+                if seconds > 0:
+                    self._sleep(seconds)
+            
+            retrying = Retrying(
+                stop=stop_after_attempt(max_retries + 1),
+                wait=wait_strategy,
+                retry=retry_if_exception_type((RateLimitExceededException, requests.RequestException)),
+                sleep=sleep,
+                before_sleep=before_sleep,
+                reraise=True
+            )
+            
+            retry_state_local.active = True
+            try:
+                return retrying(func, self, *args, **kwargs)
+                
+            except RateLimitExceededException as e:
+                # 最後の試行で失敗した場合はRateLimitErrorとして再投げ
+                reset_time = _rate_limit_reset_from_headers(e)
+                if reset_time is None:
+                    # ヘッダーがない場合のみ追加リクエストで実際の状態を取得
+                    rate_limit_info = self._github.get_rate_limit().core
+                    reset_time = rate_limit_info.reset
+                    remaining = rate_limit_info.remaining
+                else:
+                    remaining = 0
+                error_msg = (f"Rate limit exceeded after {max_retries} retries. "
+                             f"Resets at: {reset_time}, Remaining: {remaining}")
+                logger.error(error_msg)
+                raise RateLimitError(error_msg, reset_time=reset_time, remaining=remaining)
                 
+            except requests.RequestException as e:
+                # 最後の試行で失敗した場合はGitHubAPIErrorとして再投げ
+                error_msg = f"Network error after {max_retries} retries: {e}"
+                logger.error(error_msg)
+                raise GitHubAPIError(error_msg, original_error=e)
+                
+            finally:
+                retry_state_local.active = False
+                retry_state_local.statistics = dict(retrying.statistics)
+        
         return wrapper
     return decorator
 
@@ -113,6 +285,67 @@ class RateLimitError(GitHubAPIError):
         self.remaining = remaining
 
 
+class RateLimit(NamedTuple):
+    """APIレート制限の状態"""
+    limit: int
+    remaining: int
+    reset: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class PRRecord:
+    """マージ済みプルリクエストのレコード
+    
+    PRごとに辞書を生成するよりメモリ効率の良い__slots__ベースの不変レコードです。
+    既存の呼び出し側との互換性のため、辞書と同じ添字アクセス（record["number"]）と
+    キー存在確認（"number" in record）もサポートします。
+    """
+    number: int
+    title: str
+    author: str
+    merged_at: datetime
+    created_at: datetime
+    updated_at: datetime
+    
+    def __getitem__(self, key: str) -> Any:
+        """辞書互換の添字アクセス
+        
+        Raises:
+            KeyError: 存在しないフィールド名が指定された場合
+        """
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key: object) -> bool:
+        """辞書互換のキー存在確認（"number" in record）"""
+        return key in self.__dataclass_fields__
+    
+    def to_json_dict(self) -> Dict[str, Any]:
+        """JSONシリアライズ可能な辞書に変換（日時はISO 8601文字列）"""
+        return {
+            "number": self.number,
+            "title": self.title,
+            "author": self.author,
+            "merged_at": self.merged_at.isoformat(),
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat()
+        }
+    
+    @classmethod
+    def from_json_dict(cls, data: Dict[str, Any]) -> "PRRecord":
+        """to_json_dictの出力からPRRecordを復元"""
+        return cls(
+            number=data["number"],
+            title=data["title"],
+            author=data["author"],
+            merged_at=_parse_github_datetime(data["merged_at"]),
+            created_at=_parse_github_datetime(data["created_at"]),
+            updated_at=_parse_github_datetime(data["updated_at"])
+        )
+
+
 class GitHubClient:
     """GitHub APIクライアント（レート制限対応・リトライ機能付き）
     
@@ -140,9 +373,14 @@ class GitHubClient:
         
         # レート制限状況の確認
         status = client.get_rate_limit_status()
+        print(status.remaining, status.reset)
     """
     
-    def __init__(self, token: str, per_page: int = 100, timeout: int = 30, rate_limit_buffer: int = 100) -> None:
+    def __init__(self, token: str, per_page: int = 100, timeout: int = 30, rate_limit_buffer: int = 100,
+                 use_graphql: bool = False, use_search: bool = False, *, clock: Optional[Callable[[], datetime]] = None,
+                 sleeper: Optional[Callable[[float], None]] = None,
+                 cache_path: Optional[Union[str, Path]] = None,
+                 memory_cache_ttl: Optional[float] = None) -> None:
         """GitHubClientを初期化
         
         Args:
@@ -150,6 +388,13 @@ class GitHubClient:
             per_page: 1回のAPIコールで取得するアイテム数（デフォルト: 100）
             timeout: API接続タイムアウト秒数（デフォルト: 30）
             rate_limit_buffer: レート制限バッファ（デフォルト: 100）
+            use_graphql: マージ済みPRの取得にGraphQL APIを使用するかどうか（デフォルト: False）
+            use_search: マージ済みPRをマージ日時の検索クエリで取得するかどうか（デフォルト: False、
+                use_graphqlと併用した場合はGraphQLのsearchクエリを使用）
+            clock: 現在時刻（UTC）を返す関数（デフォルト: datetime.now(timezone.utc)）
+            sleeper: 指定秒数待機する関数（デフォルト: time.sleep）
+            cache_path: マージ済みPRのディスクキャッシュ（SQLite）のパス（Noneの場合はキャッシュしない）
+            memory_cache_ttl: マージ済みPRをプロセス内にキャッシュする秒数（Noneの場合はキャッシュしない）
             
         Raises:
             GitHubAPIError: トークンが空またはNoneの場合、初期化に失敗した場合
@@ -161,6 +406,20 @@ class GitHubClient:
         self._per_page = per_page
         self._timeout = timeout
         self._rate_limit_buffer = rate_limit_buffer
+        self._use_graphql = use_graphql
+        self._use_search = use_search
+        self._now = clock or (lambda: datetime.now(timezone.utc))
+        self._sleep = sleeper or time.sleep
+        # retry_on_rate_limitの状態（スレッドごとの実行中フラグとリトライ統計）
+        self._retry_state = threading.local()
+        # 複数スレッドからのレート制限待機を1回にまとめるためのロックと世代番号
+        self._rate_limit_wait_lock = threading.Lock()
+        self._rate_limit_wait_generation = 0
+        self._pr_cache = PRDiskCache(cache_path) if cache_path is not None else None
+        # (repo, since, until) -> (有効期限, PRリスト)。挿入順をLRUの順序として使用する
+        self._memory_cache_ttl = memory_cache_ttl
+        self._memory_cache: "OrderedDict[Tuple[str, str, Optional[str]], Tuple[datetime, List[PRRecord]]]" = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
         logger.info("Initializing GitHub API client")
         
         try:
@@ -175,6 +434,15 @@ class GitHubClient:
             logger.error(error_msg)
             raise GitHubAPIError(error_msg, original_error=e)
     
+    @property
+    def last_retry_statistics(self) -> Dict[str, Any]:
+        """現在のスレッドで直近にリトライ制御された呼び出しのtenacity統計
+        
+        Returns:
+            Dict[str, Any]: attempt_number、idle_forなどの統計（未実行の場合は空）
+        """
+        return getattr(self._retry_state, "statistics", {})
+    
     def _verify_authentication(self) -> str:
         """認証の有効性を確認
         
@@ -203,13 +471,26 @@ class GitHubClient:
         リセット時刻が既に過去の場合は待機しません。
         レート制限情報の取得に失敗した場合は、デフォルトで1時間待機します。
         
+        fetch_merged_prs_manyなどで複数スレッドが同時に呼び出した場合は1スレッドのみが待機し、
+        その間に到着したスレッドは待機完了後にそのまま処理を再開します。
+        
         Raises:
             GitHubAPIError: 重大なAPIエラーが発生した場合（フォールバック待機後）
         """
+        generation = self._rate_limit_wait_generation
+        with self._rate_limit_wait_lock:
+            if self._rate_limit_wait_generation != generation:
+                logger.debug("Rate limit wait already completed by another thread")
+                return
+            self._wait_for_rate_limit_reset_locked()
+            self._rate_limit_wait_generation += 1
+    
+    def _wait_for_rate_limit_reset_locked(self) -> None:
+        """レート制限のリセットまで待機する処理の本体（_rate_limit_wait_lockを保持して呼び出す）"""
         try:
             rate_limit_info = self._github.get_rate_limit().core
             reset_time = rate_limit_info.reset
-            current_time = datetime.now(timezone.utc)
+            current_time = self._now()
             remaining = rate_limit_info.remaining
             
             logger.info(f"Current rate limit status: {remaining}/{rate_limit_info.limit} remaining")
@@ -226,10 +507,10 @@ class GitHubClient:
                 if wait_seconds > 300:  # 5分以上
                     with tqdm(total=wait_seconds, desc="Waiting for rate limit reset", unit="s") as pbar:
                         for _ in range(wait_seconds):
-                            time.sleep(1)
+                            self._sleep(1)
                             pbar.update(1)
                 else:
-                    time.sleep(wait_seconds)
+                    self._sleep(wait_seconds)
                     
                 logger.info("Rate limit wait completed")
             else:
@@ -241,18 +522,18 @@ class GitHubClient:
             logger.warning(f"GitHub API error while checking rate limit: {e}")
             # 短めのフォールバック待機
             logger.info("Falling back to 10 minute wait")
-            time.sleep(600)
+            self._sleep(600)
             
         except requests.RequestException as e:
             logger.warning(f"Network error while checking rate limit: {e}")
             logger.info("Falling back to 10 minute wait")
-            time.sleep(600)
+            self._sleep(600)
             
         except Exception as e:
             logger.warning(f"Unexpected error while checking rate limit: {e}")
             # より長いフォールバック: 1時間待機
             logger.info("Falling back to 1 hour wait due to unexpected error")
-            time.sleep(3600)
+            self._sleep(3600)
     
     def check_rate_limit_and_wait_if_needed(self) -> None:
         """レート制限バッファをチェックし、必要に応じて待機
@@ -262,11 +543,11 @@ class GitHubClient:
         """
         try:
             rate_status = self.get_rate_limit_status()
-            remaining = rate_status["remaining"]
+            remaining = rate_status.remaining
             
             if remaining < self._rate_limit_buffer:
                 logger.warning(
-                    f"Rate limit buffer threshold reached: {remaining}/{rate_status['limit']} remaining "
+                    f"Rate limit buffer threshold reached: {remaining}/{rate_status.limit} remaining "
                     f"(buffer: {self._rate_limit_buffer}). Waiting for reset..."
                 )
                 self.wait_for_rate_limit_reset()
@@ -285,25 +566,174 @@ class GitHubClient:
             # その他のエラーはログ出力のみ（処理継続）
             logger.warning(f"Non-critical error checking rate limit: {e}")
     
-    def fetch_merged_prs(self, repo: str, since: datetime, until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    @retry_on_rate_limit()
+    def fetch_merged_prs(self, repo: str, since: datetime, until: Optional[datetime] = None,
+                         no_cache: bool = False) -> List[PRRecord]:
         """指定期間のマージ済みプルリクエストを取得
         
         Args:
             repo: リポジトリ名（"owner/repo"形式）
             since: 開始日時（UTC）
             until: 終了日時（UTC、Noneの場合は現在時刻）
+            no_cache: メモリキャッシュを参照せずに取得するかどうか（取得結果でキャッシュは更新される）
             
         Returns:
-            List[Dict[str, Any]]: マージ済みPRのリスト
+            List[PRRecord]: マージ済みPRのリスト
             
         Raises:
             GitHubAPIError: リポジトリが存在しない、または一般的なAPI エラー
             RateLimitError: レート制限に達した場合
         """
+        key = (repo, since.isoformat(), until.isoformat() if until is not None else None)
+        if self._memory_cache_ttl is not None and not no_cache:
+            cached = self._memory_cache_get(key)
+            if cached is not None:
+                logger.debug(f"PR memory cache hit for {repo}")
+                return cached
+        
+        if self._pr_cache is not None:
+            prs = self._fetch_merged_prs_cached(repo, since, until)
+        else:
+            prs = self._fetch_merged_prs_uncached(repo, since, until)
+        
+        if self._memory_cache_ttl is not None:
+            self._memory_cache_set(key, prs)
+        return prs
+    
+    def _memory_cache_get(self, key: Tuple[str, str, Optional[str]]) -> Optional[List[PRRecord]]:
+        """有効期限内のメモリキャッシュエントリを取得（期限切れのエントリは削除）"""
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, prs = entry
+            if self._now() >= expires_at:
+                del self._memory_cache[key]
+                return None
+            self._memory_cache.move_to_end(key)
+            # 呼び出し側でリストを変更してもキャッシュに影響しないようコピーを返す
+            return list(prs)
+    
+    def _memory_cache_set(self, key: Tuple[str, str, Optional[str]], prs: List[PRRecord]) -> None:
+        """メモリキャッシュにエントリを保存（上限を超えた場合は最も古いエントリを削除）"""
+        expires_at = self._now() + timedelta(seconds=self._memory_cache_ttl)
+        with self._memory_cache_lock:
+            self._memory_cache[key] = (expires_at, list(prs))
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > MEMORY_CACHE_MAXSIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _fetch_merged_prs_uncached(self, repo: str, since: datetime, until: Optional[datetime]) -> List[PRRecord]:
+        """設定されたバックエンド（REST/Search/GraphQL）でマージ済みPRを取得"""
+        if self._use_graphql:
+            return self._fetch_merged_prs_graphql(repo, since, until)
+        if self._use_search:
+            return self._fetch_merged_prs_search(repo, since, until)
         return self._fetch_merged_prs_impl(repo, since, until, show_progress=False)
     
+    def _fetch_merged_prs_cached(self, repo: str, since: datetime, until: Optional[datetime]) -> List[PRRecord]:
+        """ディスクキャッシュを使用したマージ済みPR取得
+        
+        (repo, since, until)をキーにキャッシュを参照し、保存時のETagで条件付きリクエストを送ります。
+        304 Not Modifiedならキャッシュを返し、それ以外は再取得してキャッシュを更新します。
+        キャッシュの読み書きに失敗した場合はキャッシュなしで動作を継続します。
+        
+        Args:
+            repo: リポジトリ名（"owner/repo"形式）
+            since: 開始日時（UTC）
+            until: 終了日時（UTC、Noneの場合は現在時刻）
+            
+        Returns:
+            List[PRRecord]: マージ済みPRのリスト
+        """
+        # untilがNoneの場合は「現在まで」を表すキーとし、新しい更新の有無はETagで判定する
+        key = (repo, since.isoformat(), until.isoformat() if until is not None else "")
+        
+        try:
+            cached = self._pr_cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read PR disk cache for {repo}: {e}")
+            cached = None
+        
+        status, etag = self._probe_pulls_etag(repo, cached.etag if cached else None)
+        if cached is not None and status == 304:
+            logger.info(f"PR disk cache hit for {repo} (not modified)")
+            return [PRRecord.from_json_dict(record) for record in cached.records]
+        
+        prs = self._fetch_merged_prs_uncached(repo, since, until)
+        
+        try:
+            self._pr_cache.set(key, etag, [pr.to_json_dict() for pr in prs])
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write PR disk cache for {repo}: {e}")
+        
+        return prs
+    
+    def _probe_pulls_etag(self, repo: str, etag: Optional[str]) -> Tuple[Optional[int], Optional[str]]:
+        """PR一覧の先頭1件に条件付きリクエストを送り、変更の有無とETagを取得
+        
+        更新日時の降順で先頭1件のみを要求するため、いずれかのPRが更新されるとETagが変わります。
+        304レスポンスはGitHubのレート制限にカウントされません。
+        
+        Args:
+            repo: リポジトリ名（"owner/repo"形式）
+            etag: 前回取得時のETag（Noneの場合は無条件リクエスト）
+            
+        Returns:
+            Tuple[Optional[int], Optional[str]]: HTTPステータスとETag（確認に失敗した場合は(None, None)）
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        try:
+            status, response_headers, _ = self._github.requester.requestJson(
+                "GET",
+                f"/repos/{repo}/pulls",
+                parameters={"state": "closed", "sort": "updated", "direction": "desc", "per_page": 1},
+                headers=headers
+            )
+        except (RateLimitExceededException, requests.RequestException):
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to check ETag for {repo}: {e}")
+            return None, None
+        
+        return status, (response_headers or {}).get("etag", etag if status == 304 else None)
+    
+    def fetch_merged_prs_many(self, repos: List[str], since: datetime, until: Optional[datetime] = None,
+                              max_workers: int = 8) -> Dict[str, List[PRRecord]]:
+        """複数リポジトリのマージ済みプルリクエストを並行して取得
+        
+        GitHub APIへのアクセスはI/O待ちが支配的なため、スレッドプールで
+        リポジトリごとのリクエストを重ね合わせて実行します。
+        
+        Args:
+            repos: リポジトリ名のリスト（"owner/repo"形式）
+            since: 開始日時（UTC）
+            until: 終了日時（UTC、Noneの場合は現在時刻）
+            max_workers: 最大ワーカー数（デフォルト: 8）
+            
+        Returns:
+            Dict[str, List[PRRecord]]: リポジトリ名をキーとしたマージ済みPRのリスト
+            
+        Raises:
+            GitHubAPIError: いずれかのリポジトリの取得に失敗した場合
+            RateLimitError: レート制限に達した場合
+        """
+        if not repos:
+            return {}
+        
+        if until is None:
+            until = self._now()
+        
+        workers = min(max_workers, len(repos))
+        logger.info(f"Fetching merged PRs for {len(repos)} repositories with {workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda repo: self.fetch_merged_prs(repo, since, until), repos)
+            return dict(zip(repos, results))
+    
+    @retry_on_rate_limit()
     def fetch_merged_prs_with_progress(self, repo: str, since: datetime, until: Optional[datetime] = None, 
-                                     show_progress: bool = True) -> List[Dict[str, Any]]:
+                                     show_progress: bool = True) -> List[PRRecord]:
         """進捗表示付きで指定期間のマージ済みプルリクエストを取得
         
         Args:
@@ -313,15 +743,19 @@ class GitHubClient:
             show_progress: 進捗バーを表示するかどうか
             
         Returns:
-            List[Dict[str, Any]]: マージ済みPRのリスト
+            List[PRRecord]: マージ済みPRのリスト
             
         Raises:
             GitHubAPIError: リポジトリが存在しない、または一般的なAPI エラー
             RateLimitError: レート制限に達した場合
         """
+        if self._use_graphql:
+            return self._fetch_merged_prs_graphql(repo, since, until, show_progress)
+        if self._use_search:
+            return self._fetch_merged_prs_search(repo, since, until, show_progress)
         return self._fetch_merged_prs_impl(repo, since, until, show_progress)
     
-    def _fetch_merged_prs_impl(self, repo: str, since: datetime, until: Optional[datetime], show_progress: bool) -> List[Dict[str, Any]]:
+    def _fetch_merged_prs_impl(self, repo: str, since: datetime, until: Optional[datetime], show_progress: bool) -> List[PRRecord]:
         """マージ済みPR取得の実装（ページネーション対応・リトライ機能付き）
         
         Args:
@@ -331,14 +765,14 @@ class GitHubClient:
             show_progress: 進捗バーを表示するかどうか
             
         Returns:
-            List[Dict[str, Any]]: マージ済みPRのリスト
+            List[PRRecord]: マージ済みPRのリスト
             
         Raises:
             GitHubAPIError: リポジトリが存在しない、または一般的なAPI エラー
             RateLimitError: レート制限に達した場合
         """
         if until is None:
-            until = datetime.now(timezone.utc)
+            until = self._now()
         
         progress_msg = "with progress display" if show_progress else "without progress display"
         logger.info(f"Fetching merged PRs for {repo} from {since} to {until} {progress_msg}")
@@ -362,33 +796,42 @@ class GitHubClient:
             with tqdm(desc=progress_desc, unit="PR", disable=not show_progress) as pbar:
                 for pr in pulls:
                     try:
+                        # updated_atの降順で取得しているため、since より前に更新された
+                        # PRが現れた時点で以降のページはすべて期間外（ページ送りを打ち切る）
+                        # 打ち切り判定はレート制限確認のAPI呼び出しより先に行う
+                        updated_at = pr.updated_at
+                        if updated_at < since:
+                            logger.debug(f"Reached PR #{pr.number} updated before {since}, stopping pagination")
+                            break
+                        
                         # レート制限バッファチェック
                         self.check_rate_limit_and_wait_if_needed()
                         
                         # マージされていないPRをスキップ
-                        if pr.merged_at is None:
+                        merged_at = pr.merged_at
+                        if merged_at is None:
                             continue
                         
                         # 指定期間外のPRをスキップ
-                        if pr.merged_at < since or pr.merged_at > until:
+                        if merged_at < since or merged_at > until:
                             continue
                         
-                        # PRデータを辞書形式で収集
-                        pr_data = {
-                            "number": pr.number,
-                            "title": pr.title,
-                            "author": pr.user.login,
-                            "merged_at": pr.merged_at,
-                            "created_at": pr.created_at,
-                            "updated_at": pr.updated_at
-                        }
-                        
-                        merged_prs.append(pr_data)
+                        # 一覧APIのレスポンスに含まれるフィールドのみを1回ずつ参照する
+                        # （raw_dataは未補完のオブジェクトに対してPRごとの追加GETを発生させるため使わない）
+                        record = PRRecord(
+                            number=pr.number,
+                            title=pr.title,
+                            author=pr.user.login,
+                            merged_at=merged_at,
+                            created_at=pr.created_at,
+                            updated_at=updated_at
+                        )
+                        merged_prs.append(record)
                         if show_progress:
                             pbar.update(1)
                             pbar.set_postfix({"Found": len(merged_prs)})
                         
-                        logger.debug(f"Found merged PR #{pr.number}: {pr.title}")
+                        logger.debug(f"Found merged PR #{record.number}: {record.title}")
                         
                     except RateLimitExceededException as e:
                         logger.info(f"Rate limit exceeded while processing PR, waiting for reset...")
@@ -399,47 +842,289 @@ class GitHubClient:
                     except requests.RequestException as e:
                         logger.warning(f"Network error while processing PR: {e}. Retrying...")
                         # ネットワークエラーの場合は短い待機後に継続
-                        time.sleep(1)
+                        self._sleep(1)
                         continue
             
             logger.info(f"Found {len(merged_prs)} merged PRs for {repo}")
             return merged_prs
             
+        except GitHubAPIError:
+            raise
+            
         except UnknownObjectException as e:
             error_msg = f"Repository not found: {repo}"
             logger.error(error_msg)
             raise GitHubAPIError(error_msg)
             
-        except RateLimitExceededException as e:
-            # 初期のリポジトリ取得やPRリスト取得で発生したレート制限
-            rate_limit_info = self._github.get_rate_limit().core
-            reset_time = rate_limit_info.reset
-            remaining = rate_limit_info.remaining
-            
-            error_msg = f"Rate limit exceeded during initial repository access. Resets at: {reset_time}, Remaining: {remaining}"
-            logger.error(error_msg)
-            raise RateLimitError(error_msg, reset_time=reset_time, remaining=remaining)
+        except (RateLimitExceededException, requests.RequestException):
+            # 初期のリポジトリ取得やPRリスト取得で発生したレート制限・ネットワークエラーは
+            # retry_on_rate_limitデコレータでリトライする
+            raise
             
         except GithubException as e:
             error_msg = f"GitHub API error: {e}"
             logger.error(error_msg)
             raise GitHubAPIError(error_msg, status_code=getattr(e, 'status', None), original_error=e)
             
-        except requests.RequestException as e:
-            error_msg = f"Network error: {e}"
+        except Exception as e:
+            error_msg = f"Unexpected error fetching PRs: {e}"
             logger.error(error_msg)
             raise GitHubAPIError(error_msg, original_error=e)
+    
+    def _fetch_merged_prs_search(self, repo: str, since: datetime, until: Optional[datetime],
+                                 show_progress: bool = False) -> List[PRRecord]:
+        """Search APIによるマージ済みPR取得の実装
+        
+        マージ日時の範囲をクエリで指定するため、サーバー側で期間内のマージ済みPRのみに絞り込まれ、
+        クローズ済みPRを全件走査する必要がありません。
+        Search APIは1クエリあたり最大1000件までしか返さないため、検索結果が上限を超える場合は
+        PR一覧の走査に切り替えます。レート制限も通常のAPIとは別（認証済みで30回/分）です。
+        
+        Args:
+            repo: リポジトリ名（"owner/repo"形式）
+            since: 開始日時（UTC）
+            until: 終了日時（UTC、Noneの場合は現在時刻）
+            show_progress: 進捗バーを表示するかどうか
+            
+        Returns:
+            List[PRRecord]: マージ済みPRのリスト
+            
+        Raises:
+            GitHubAPIError: リポジトリが存在しない、または一般的なAPI エラー
+            RateLimitError: レート制限に達した場合
+        """
+        if until is None:
+            until = self._now()
+        
+        query = _build_merged_search_query(repo, since, until)
+        logger.info(f"Searching merged PRs for {repo} from {since} to {until}")
+        logger.debug(f"Search query: {query}")
+        
+        try:
+            issues = self._github.search_issues(query, sort="updated", order="desc")
+            
+            merged_prs = []
+            exceeds_limit = False
+            with tqdm(desc=f"Processing PRs from {repo}", unit="PR", disable=not show_progress) as pbar:
+                for index, issue in enumerate(issues):
+                    # 総件数は最初のページのレスポンスに含まれるため、追加のリクエストは発生しない
+                    if index == 0 and getattr(issues, "totalCount", 0) > SEARCH_RESULT_LIMIT:
+                        exceeds_limit = True
+                        break
+                    
+                    # 検索結果のIssueにはPRのmerged_atが含まれる（古いAPIではclosed_atで代用）
+                    merged_at = issue.pull_request.merged_at if issue.pull_request else None
+                    merged_prs.append(PRRecord(
+                        number=issue.number,
+                        title=issue.title,
+                        author=issue.user.login if issue.user else "ghost",
+                        merged_at=merged_at or issue.closed_at,
+                        created_at=issue.created_at,
+                        updated_at=issue.updated_at
+                    ))
+                    if show_progress:
+                        pbar.update(1)
+            
+            if not exceeds_limit:
+                logger.info(f"Found {len(merged_prs)} merged PRs for {repo}")
+                return merged_prs
+            
+        except (RateLimitExceededException, requests.RequestException):
+            # retry_on_rate_limitデコレータでリトライする
+            raise
+            
+        except GithubException as e:
+            # 存在しない、またはアクセスできないリポジトリの検索は422になる
+            if e.status == 422:
+                error_msg = f"Repository not found: {repo}"
+            else:
+                error_msg = f"GitHub API error: {e}"
+            logger.error(error_msg)
+            raise GitHubAPIError(error_msg, status_code=e.status, original_error=e)
             
         except Exception as e:
-            error_msg = f"Unexpected error fetching PRs: {e}"
+            error_msg = f"Unexpected error searching PRs: {e}"
             logger.error(error_msg)
             raise GitHubAPIError(error_msg, original_error=e)
+        
+        # 検索結果は上限件数で打ち切られるため、取りこぼしを避けてPR一覧を走査する
+        logger.warning(
+            f"Search matched {issues.totalCount} PRs for {repo} (limit {SEARCH_RESULT_LIMIT}), "
+            f"falling back to pulls listing"
+        )
+        return self._fetch_merged_prs_impl(repo, since, until, show_progress)
+    
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """GitHub GraphQL APIにクエリを送信
+        
+        Args:
+            query: GraphQLクエリ文字列
+            variables: クエリ変数
+            
+        Returns:
+            Dict[str, Any]: レスポンスのdata部
+            
+        Raises:
+            GitHubAPIError: HTTPエラー、またはGraphQLエラーが返された場合
+            RateLimitError: レート制限に達した場合
+            requests.RequestException: ネットワークエラーが発生した場合
+        """
+        # ネットワークエラーは呼び出し元のretry_on_rate_limitデコレータでリトライする
+        response = requests.post(
+            GRAPHQL_URL,
+            headers={"Authorization": f"bearer {self._token}"},
+            json={"query": query, "variables": variables},
+            timeout=self._timeout
+        )
+        
+        if response.status_code != 200:
+            if response.status_code in (403, 429) and response.headers.get("x-ratelimit-remaining") == "0":
+                reset = response.headers.get("x-ratelimit-reset")
+                reset_time = datetime.fromtimestamp(int(reset), timezone.utc) if reset else None
+                error_msg = f"GraphQL rate limit exceeded. Resets at: {reset_time}"
+                logger.error(error_msg)
+                raise RateLimitError(error_msg, reset_time=reset_time, remaining=0)
+            error_msg = f"GitHub GraphQL API error: HTTP {response.status_code}"
+            logger.error(error_msg)
+            raise GitHubAPIError(error_msg, status_code=response.status_code)
+        
+        payload = response.json()
+        errors = payload.get("errors")
+        if errors:
+            messages = "; ".join(error.get("message", "") for error in errors)
+            if any(error.get("type") == "NOT_FOUND" for error in errors):
+                error_msg = f"Repository not found: {variables.get('owner')}/{variables.get('name')}"
+                logger.error(error_msg)
+                raise GitHubAPIError(error_msg, status_code=404)
+            error_msg = f"GitHub GraphQL API error: {messages}"
+            logger.error(error_msg)
+            raise GitHubAPIError(error_msg)
+        
+        return payload["data"]
+    
+    def _fetch_merged_prs_graphql(self, repo: str, since: datetime, until: Optional[datetime],
+                                  show_progress: bool = False) -> List[PRRecord]:
+        """GraphQL APIによるマージ済みPR取得の実装
+        
+        RESTのページ送りと異なり、1リクエストで必要なフィールドのみを最大100件取得します。
+        更新日時の降順で取得するため、since より前に更新されたPRに到達した時点で打ち切ります。
+        use_searchが有効な場合は、マージ日時で絞り込んだsearchクエリを使用し、
+        期間内のマージ済みPRのみを取得します（検索結果が上限件数を超える場合は
+        pullRequestsの走査に切り替えます）。
+        
+        Args:
+            repo: リポジトリ名（"owner/repo"形式）
+            since: 開始日時（UTC）
+            until: 終了日時（UTC、Noneの場合は現在時刻）
+            show_progress: 進捗バーを表示するかどうか
+            
+        Returns:
+            List[PRRecord]: マージ済みPRのリスト
+            
+        Raises:
+            GitHubAPIError: リポジトリが存在しない、または一般的なAPI エラー
+            RateLimitError: レート制限に達した場合
+        """
+        if until is None:
+            until = self._now()
+        
+        owner, _, name = repo.partition("/")
+        logger.info(f"Fetching merged PRs for {repo} from {since} to {until} via GraphQL")
+        
+        if self._use_search:
+            search_query = f"{_build_merged_search_query(repo, since, until)} sort:updated-desc"
+            query, variables, connection_key = MERGED_PRS_SEARCH_GRAPHQL_QUERY, {"query": search_query}, "search"
+        else:
+            query, variables, connection_key = MERGED_PRS_GRAPHQL_QUERY, {"owner": owner, "name": name}, "pullRequests"
+        
+        merged_prs = []
+        cursor = None
+        
+        with tqdm(desc=f"Processing PRs from {repo}", unit="PR", disable=not show_progress) as pbar:
+            while True:
+                data = self._graphql(query, {**variables, "cursor": cursor})
+                if connection_key == "search":
+                    connection = data.get("search")
+                else:
+                    repository = data.get("repository")
+                    if repository is None:
+                        error_msg = f"Repository not found: {repo}"
+                        logger.error(error_msg)
+                        raise GitHubAPIError(error_msg, status_code=404)
+                    connection = repository.get("pullRequests")
+                
+                try:
+                    if cursor is None and connection_key == "search" and connection["issueCount"] > SEARCH_RESULT_LIMIT:
+                        # 検索結果は上限件数で打ち切られるため、全件を走査する方式に切り替える
+                        logger.warning(
+                            f"Search matched {connection['issueCount']} PRs for {repo} "
+                            f"(limit {SEARCH_RESULT_LIMIT}), falling back to pullRequests traversal"
+                        )
+                        query, variables = MERGED_PRS_GRAPHQL_QUERY, {"owner": owner, "name": name}
+                        connection_key = "pullRequests"
+                        continue
+                    
+                    page_prs, reached_since = self._parse_graphql_pr_nodes(connection["nodes"], since, until)
+                    page_info = connection["pageInfo"]
+                    has_next_page = page_info["hasNextPage"]
+                    cursor = page_info["endCursor"]
+                except (KeyError, TypeError, ValueError) as e:
+                    error_msg = f"Unexpected GraphQL response for {repo}: {e}"
+                    logger.error(error_msg)
+                    raise GitHubAPIError(error_msg, original_error=e)
+                
+                merged_prs.extend(page_prs)
+                if show_progress and page_prs:
+                    pbar.update(len(page_prs))
+                    pbar.set_postfix({"Found": len(merged_prs)})
+                
+                if reached_since or not has_next_page:
+                    break
+        
+        logger.info(f"Found {len(merged_prs)} merged PRs for {repo}")
+        return merged_prs
+    
+    @staticmethod
+    def _parse_graphql_pr_nodes(nodes: List[Dict[str, Any]], since: datetime,
+                                until: datetime) -> Tuple[List[PRRecord], bool]:
+        """GraphQLのPRノード1ページ分をPRRecordに変換
+        
+        Args:
+            nodes: pullRequests.nodes または search.nodes
+            since: 開始日時（UTC）
+            until: 終了日時（UTC）
+            
+        Returns:
+            Tuple[List[PRRecord], bool]: 期間内のPRと、since より前に更新されたPRに到達したかどうか
+        """
+        page_prs = []
+        for node in nodes:
+            updated_at = _parse_github_datetime(node["updatedAt"])
+            if updated_at < since:
+                return page_prs, True
+            
+            merged_at = _parse_github_datetime(node["mergedAt"])
+            if merged_at < since or merged_at > until:
+                continue
+            
+            # 削除済みユーザーのPRはauthorがnullになる
+            author = node["author"]["login"] if node["author"] else "ghost"
+            page_prs.append(PRRecord(
+                number=node["number"],
+                title=node["title"],
+                author=author,
+                merged_at=merged_at,
+                created_at=_parse_github_datetime(node["createdAt"]),
+                updated_at=updated_at
+            ))
+        return page_prs, False
     
-    def get_rate_limit_status(self) -> Dict[str, Any]:
+    @retry_on_rate_limit()
+    def get_rate_limit_status(self) -> RateLimit:
         """APIレート制限の状態を取得
         
         Returns:
-            Dict[str, Any]: レート制限情報
+            RateLimit: レート制限情報
                 - limit: 1時間あたりのリクエスト制限数
                 - remaining: 残りリクエスト数
                 - reset: リセット時刻（UTC）
@@ -450,15 +1135,16 @@ class GitHubClient:
         try:
             rate_limit = self._github.get_rate_limit()
             
-            result = {
-                "limit": rate_limit.core.limit,
-                "remaining": rate_limit.core.remaining,
-                "reset": rate_limit.core.reset
-            }
+            core = rate_limit.core
+            result = RateLimit(limit=core.limit, remaining=core.remaining, reset=core.reset)
             
-            logger.debug(f"Rate limit status: {result['remaining']}/{result['limit']} remaining")
+            logger.debug(f"Rate limit status: {result.remaining}/{result.limit} remaining")
             return result
             
+        except (RateLimitExceededException, requests.RequestException):
+            # retry_on_rate_limitデコレータでリトライする
+            raise
+            
         except GithubException as e:
             error_msg = f"Failed to get rate limit status: {e}"
             logger.error(error_msg)
@@ -540,12 +1226,12 @@ class GitHubClient:
         """
         try:
             rate_status = self.get_rate_limit_status()
-            remaining = rate_status["remaining"]
+            remaining = rate_status.remaining
             
             if remaining < threshold:
                 logger.warning(
-                    f"Rate limit approaching threshold: {remaining}/{rate_status['limit']} remaining. "
-                    f"Resets at: {rate_status['reset']}"
+                    f"Rate limit approaching threshold: {remaining}/{rate_status.limit} remaining. "
+                    f"Resets at: {rate_status.reset}"
                 )
                 return False
             
@@ -1,8 +1,9 @@
 """メトリクスキャッシュモジュール - 週次メトリクスの効率的なキャッシュ管理"""
 import logging
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union
 from datetime import datetime, timezone
+from pathlib import Path
 import hashlib
 import json
 import pandas as pd
@@ -27,18 +28,24 @@ class CacheEntry:
 class MetricsCache:
     """週次メトリクスの効率的なキャッシュ管理クラス"""
     
-    def __init__(self, default_ttl_seconds: int = 3600):
+    def __init__(self, default_ttl_seconds: int = 3600, cache_dir: Optional[Union[str, Path]] = None):
         """
         MetricsCacheを初期化
         
         Args:
             default_ttl_seconds: デフォルトTTL秒数（デフォルト: 3600秒 = 1時間）
+            cache_dir: Parquetディスクキャッシュの保存先（Noneの場合はメモリのみ）
         """
         self.default_ttl_seconds = default_ttl_seconds
         self._cache: Dict[str, CacheEntry] = {}
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
         self._hit_count = 0
         self._miss_count = 0
-        logger.info(f"MetricsCache initialized with default TTL: {default_ttl_seconds}s")
+        
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        logger.info(f"MetricsCache initialized with default TTL: {default_ttl_seconds}s, cache_dir: {self._cache_dir}")
     
     def get_cached_weekly_metrics(self, repo_name: str, timezone_name: str = "UTC") -> pd.DataFrame:
         """
@@ -71,6 +78,15 @@ class MetricsCache:
                 del self._cache[cache_key]
                 logger.debug(f"Expired cache entry removed for {repo_name}")
         
+        # ディスクキャッシュ確認（プロセス再起動後の再計算を避ける）
+        disk_entry = self._load_from_disk(cache_key)
+        if disk_entry is not None:
+            self._hit_count += 1
+            self._cache[cache_key] = disk_entry
+            retrieval_time = time.time() - start_time
+            logger.info(f"Disk cache hit for {repo_name}: retrieved in {retrieval_time:.3f}s")
+            return disk_entry.data.copy()
+        
         # キャッシュミス - 新規計算
         self._miss_count += 1
         logger.info(f"Cache miss for {repo_name} - computing weekly metrics")
@@ -82,6 +98,7 @@ class MetricsCache:
             created_at=datetime.now(timezone.utc),
             ttl_seconds=self.default_ttl_seconds
         )
+        self._save_to_disk(cache_key, computed_data)
         
         retrieval_time = time.time() - start_time
         logger.info(f"Weekly metrics computed and cached for {repo_name}: {retrieval_time:.3f}s")
@@ -123,23 +140,32 @@ class MetricsCache:
             bool: 無効化されたエントリが存在した場合True
         """
         cache_key = self._generate_cache_key(repo_name, timezone_name)
+        removed = self._remove_from_disk(cache_key)
         
         if cache_key in self._cache:
             del self._cache[cache_key]
+            removed = True
+        
+        if removed:
             logger.info(f"Cache invalidated for {repo_name} (timezone: {timezone_name})")
-            return True
         
-        return False
+        return removed
     
     def clear_all_cache(self) -> int:
         """
         すべてのキャッシュエントリをクリア
         
         Returns:
-            int: クリアされたエントリ数
+            int: クリアされたエントリ数（メモリとディスクのキーの和集合）
         """
-        cleared_count = len(self._cache)
+        cleared_keys = set(self._cache)
         self._cache.clear()
+        
+        if self._cache_dir is not None:
+            for path in self._cache_dir.glob("*.parquet"):
+                cleared_keys.add(path.stem)
+                path.unlink(missing_ok=True)
+        cleared_count = len(cleared_keys)
         logger.info(f"All cache entries cleared: {cleared_count} entries")
         return cleared_count
     
@@ -182,6 +208,71 @@ class MetricsCache:
         key_string = json.dumps(key_data, sort_keys=True)
         return hashlib.md5(key_string.encode()).hexdigest()
     
+    def _disk_path(self, cache_key: str) -> Optional[Path]:
+        """キャッシュキーに対応するParquetファイルのパス（ディスクキャッシュ無効時はNone）"""
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / f"{cache_key}.parquet"
+    
+    def _load_from_disk(self, cache_key: str) -> Optional[CacheEntry]:
+        """
+        Parquetディスクキャッシュからエントリを読み込む
+        
+        Args:
+            cache_key: キャッシュキー
+            
+        Returns:
+            Optional[CacheEntry]: 有効なエントリ（存在しない・期限切れ・読み込み不可の場合はNone）
+        """
+        path = self._disk_path(cache_key)
+        if path is None or not path.exists():
+            return None
+        
+        entry_created_at = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+        if time.time() > entry_created_at.timestamp() + self.default_ttl_seconds:
+            path.unlink(missing_ok=True)
+            logger.debug(f"Expired disk cache entry removed: {path}")
+            return None
+        
+        try:
+            data = pd.read_parquet(path)
+        except ImportError:
+            logger.warning("pyarrow not available, Parquet disk cache is disabled")
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read disk cache {path}: {e}")
+            return None
+        
+        return CacheEntry(data=data, created_at=entry_created_at, ttl_seconds=self.default_ttl_seconds)
+    
+    def _save_to_disk(self, cache_key: str, data: pd.DataFrame) -> None:
+        """
+        エントリをParquetディスクキャッシュに保存（失敗してもメモリキャッシュは有効）
+        
+        Args:
+            cache_key: キャッシュキー
+            data: 保存する週次メトリクス
+        """
+        path = self._disk_path(cache_key)
+        if path is None:
+            return
+        
+        try:
+            data.to_parquet(path, compression='zstd', index=False)
+        except ImportError:
+            logger.warning("pyarrow not available, Parquet disk cache is disabled")
+        except Exception as e:
+            logger.warning(f"Failed to write disk cache {path}: {e}")
+    
+    def _remove_from_disk(self, cache_key: str) -> bool:
+        """Parquetディスクキャッシュからエントリを削除し、削除したかどうかを返す"""
+        path = self._disk_path(cache_key)
+        if path is None or not path.exists():
+            return False
+        
+        path.unlink(missing_ok=True)
+        return True
+    
     def _compute_weekly_metrics(self, repo_name: str, timezone_name: str) -> pd.DataFrame:
         """
         週次メトリクスを計算（データベースから実際のデータを取得）
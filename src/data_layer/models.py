@@ -16,8 +16,7 @@ from sqlalchemy import (
     UniqueConstraint,
     Index,
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import validates
+from sqlalchemy.orm import declarative_base, validates
 
 # SQLAlchemyのベースクラス
 Base = declarative_base()
@@ -0,0 +1,132 @@
+"""PRディスクキャッシュモジュール - マージ済みPR取得結果の永続キャッシュ
+
+GitHubClient.fetch_merged_prsの結果を(repo, since, until)をキーとしてSQLiteに保存し、
+CIやcronなど同一条件での繰り返し実行で全ページの再取得を避けます。
+キャッシュの鮮度はGitHub APIのETagによる条件付きリクエストで確認します。
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]
+
+
+class CachedPRs(NamedTuple):
+    """キャッシュされたPR取得結果"""
+    etag: Optional[str]
+    records: List[Dict[str, Any]]
+
+
+class PRDiskCache:
+    """マージ済みPR取得結果のSQLiteディスクキャッシュ
+
+    接続は操作ごとに開くため、複数スレッドから同時に利用できます。
+    WALモードとsynchronous=NORMALにより書き込みのfsyncコストを抑えます。
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        PRDiskCacheを初期化
+
+        Args:
+            path: SQLiteファイルのパス（親ディレクトリは自動作成）
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pr_cache (
+                    repo TEXT NOT NULL,
+                    since TEXT NOT NULL,
+                    until TEXT NOT NULL,
+                    etag TEXT,
+                    payload TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (repo, since, until)
+                )
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        logger.info(f"PRDiskCache initialized at {self._path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """同期モードを設定したSQLite接続を作成"""
+        conn = sqlite3.connect(self._path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def get(self, key: CacheKey) -> Optional[CachedPRs]:
+        """
+        キャッシュエントリを取得
+
+        Args:
+            key: (repo, since, until)のキー
+
+        Returns:
+            Optional[CachedPRs]: キャッシュエントリ（存在しない場合はNone）
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT etag, payload FROM pr_cache WHERE repo = ? AND since = ? AND until = ?",
+                key
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        return CachedPRs(etag=row[0], records=json.loads(row[1]))
+
+    def set(self, key: CacheKey, etag: Optional[str], records: List[Dict[str, Any]]) -> None:
+        """
+        キャッシュエントリを保存（既存エントリは置き換え）
+
+        Args:
+            key: (repo, since, until)のキー
+            etag: 取得時点のETag
+            records: JSONシリアライズ可能なPRデータのリスト
+        """
+        payload = json.dumps(records)
+        with self._write_lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO pr_cache (repo, since, until, etag, payload, stored_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (*key, etag, payload, time.time())
+                    )
+            finally:
+                conn.close()
+        logger.debug(f"Cached {len(records)} PRs for {key[0]} ({key[1]} - {key[2] or 'now'})")
+
+    def clear(self) -> int:
+        """
+        すべてのキャッシュエントリを削除
+
+        Returns:
+            int: 削除されたエントリ数
+        """
+        with self._write_lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    deleted = conn.execute("DELETE FROM pr_cache").rowcount
+            finally:
+                conn.close()
+        logger.info(f"PR disk cache cleared: {deleted} entries")
+        return deleted
@@ -69,7 +69,9 @@ def create_components(config: Dict[str, Any]) -> tuple[TimezoneHandler, GitHubCl
             token=config['github']['api_token'],
             per_page=config['github'].get('per_page', 100),
             timeout=config['github'].get('timeout', 30),
-            rate_limit_buffer=config['github'].get('rate_limit_buffer', 100)
+            rate_limit_buffer=config['github'].get('rate_limit_buffer', 100),
+            # ETagで鮮度を確認するPRディスクキャッシュ（未設定の場合は無効）
+            cache_path=config['github'].get('pr_cache_path')
         )
         
         # データベース設定からSQLiteパスを構築
@@ -1,14 +1,43 @@
 """
 基本的なグラフ生成機能を担当するモジュール
 """
+import hashlib
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from typing import List, Dict, Any
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 import datetime
 
 from ..business_layer.timezone_handler import TimezoneHandler
 
 
+# 呼び出しごとに変わらないレイアウト定義（テンプレートは_get_template_layoutで別途解決する）
+_BASE_LAYOUT = {
+    'title': {'text': '週次生産性の推移'},
+    'xaxis': {'title': {'text': '週の開始日'}},
+    'yaxis': {'title': {'text': '生産性 (PR数/人)'}},
+    'hovermode': 'x unified',
+    'showlegend': True
+}
+
+
+@lru_cache(maxsize=None)
+def _get_template_layout(template_name: str) -> Dict[str, Any]:
+    """
+    Plotlyテンプレートを展開したdictを取得（テンプレートごとに1回だけ展開する）
+    
+    Args:
+        template_name: Plotlyのテンプレート名
+        
+    Returns:
+        テンプレート定義のdict（共有されるため変更しないこと）
+    """
+    return pio.templates[template_name].to_plotly_json()
+
+
 class ProductivityVisualizer:
     """生産性グラフの可視化を担当するクラス"""
     
@@ -19,7 +48,16 @@ class ProductivityVisualizer:
         'marker_size': 6,
         'template': 'plotly_white',
         'moving_average_color': 'red',
-        'moving_average_dash': 'dash'
+        'moving_average_dash': 'dash',
+        # この点数以上のトレースはWebGL（scattergl）で描画し、未満はSVG（scatter）で描画する
+        'webgl_min_points': 100,
+        # この点数以上のデータはplotly-resampler（任意依存）で間引いて出力する
+        'resample_min_points': 2000,
+        'resampled_points': 1000,
+        # plotly.jsはHTMLごとに埋め込まず（約3.5MB）、CDNから読み込んでブラウザにキャッシュさせる
+        'include_plotlyjs': 'cdn',
+        # 同じ入力に対するグラフHTMLを保持する件数（古いものから破棄する）
+        'chart_cache_size': 32
     }
     
     def __init__(self, timezone_handler: TimezoneHandler):
@@ -30,6 +68,8 @@ class ProductivityVisualizer:
             timezone_handler: タイムゾーン処理を担当するハンドラー
         """
         self.timezone_handler = timezone_handler
+        # 入力データのハッシュをキーにしたグラフHTMLのLRUキャッシュ
+        self._chart_cache: "OrderedDict[bytes, str]" = OrderedDict()
     
     def create_productivity_chart(self, weekly_data: pd.DataFrame, moving_average_window: int = 4) -> str:
         """
@@ -52,19 +92,77 @@ class ProductivityVisualizer:
         
         # 空データの処理
         if weekly_data.empty:
-            return self._create_empty_chart()
+            return self._empty_chart_html
+        
+        # 同じ入力で生成済みの場合はキャッシュから返す
+        cache_key = self._generate_chart_cache_key(weekly_data, moving_average_window)
+        cached_html = self._chart_cache.get(cache_key)
+        if cached_html is not None:
+            self._chart_cache.move_to_end(cache_key)
+            return cached_html
         
         # データの前処理
         x_data, y_data, ma_data = self._prepare_chart_data(weekly_data)
         
-        # グラフの作成
+        # グラフの作成（レイアウトを含む）
         fig = self._create_figure(x_data, y_data, ma_data, moving_average_window)
         
-        # レイアウトの適用
-        self._apply_layout(fig)
-        
         # HTMLとして出力
-        return fig.to_html(include_plotlyjs='inline')
+        html = self._to_html(fig)
+        self._store_chart_html(cache_key, html)
+        return html
+    
+    def _generate_chart_cache_key(self, weekly_data: pd.DataFrame, moving_average_window: int) -> bytes:
+        """
+        グラフHTMLのキャッシュキーを生成
+        
+        データ内容（インデックスを含む行ハッシュ）に加え、列名・移動平均のウィンドウ・
+        表示タイムゾーンを含める。
+        
+        Args:
+            weekly_data: 週次データのDataFrame
+            moving_average_window: 移動平均のウィンドウサイズ
+            
+        Returns:
+            キャッシュキー（16バイトのダイジェスト）
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(weekly_data, index=True).to_numpy().tobytes())
+        digest.update(repr((
+            list(weekly_data.columns), moving_average_window, self.timezone_handler.display_timezone
+        )).encode())
+        return digest.digest()
+    
+    def _store_chart_html(self, cache_key: bytes, html: str) -> None:
+        """
+        グラフHTMLをキャッシュに保存（上限を超えた場合は最も古いものを破棄）
+        
+        Args:
+            cache_key: キャッシュキー
+            html: グラフのHTML文字列
+        """
+        self._chart_cache[cache_key] = html
+        if len(self._chart_cache) > self.CHART_CONFIG['chart_cache_size']:
+            self._chart_cache.popitem(last=False)
+    
+    def _to_html(self, fig: go.Figure) -> str:
+        """
+        図表をHTML文字列として出力
+        
+        図表は組み立て時に検証を省略しているため、出力時も検証しない。
+        
+        Args:
+            fig: 出力する図表オブジェクト
+            
+        Returns:
+            HTML文字列
+        """
+        return fig.to_html(
+            include_plotlyjs=self.CHART_CONFIG['include_plotlyjs'],
+            full_html=True,
+            validate=False,
+            config={'responsive': True}
+        )
     
     def _validate_input_data(self, weekly_data: pd.DataFrame) -> None:
         """
@@ -91,45 +189,55 @@ class ProductivityVisualizer:
         if missing_columns:
             raise KeyError(f"Missing required columns: {missing_columns}")
     
-    def _prepare_chart_data(self, weekly_data: pd.DataFrame) -> tuple[List[str], List[float], List[float]]:
+    def _prepare_chart_data(self, weekly_data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         チャート用のデータを準備（pandasの機能を活用して効率化）
         
+        数値列はfloat64のndarrayで返し、Plotlyが要素ごとに変換せず型付き配列として出力できるようにする。
+        
         Args:
             weekly_data: 週次データのDataFrame
             
         Returns:
-            Tuple[X軸データ（日付文字列のリスト）, Y軸データ（生産性のリスト）, 移動平均データ（移動平均のリスト）]
+            Tuple[X軸データ（日付文字列の配列）, Y軸データ（生産性の配列）, 移動平均データ（存在しない場合は空配列）]
         """
-        # X軸データの準備（pandasのapplyを使用してローカルタイムゾーンに変換）
-        x_data = weekly_data['week_start'].apply(
-            lambda dt: self.timezone_handler.utc_to_local(dt).strftime('%Y-%m-%d')
-        ).tolist()
+        # X軸データの準備（列単位でローカルタイムゾーンに変換してから日付文字列化）
+        x_data = self.timezone_handler.utc_to_local_series(
+            weekly_data['week_start']
+        ).dt.strftime('%Y-%m-%d').to_numpy()
         
         # Y軸データ（生産性）- そのまま使用
-        y_data = weekly_data['productivity'].tolist()
+        y_data = weekly_data['productivity'].to_numpy(dtype=np.float64)
         
         # 移動平均データ（存在する場合）
-        ma_data = weekly_data['moving_average'].tolist() if 'moving_average' in weekly_data.columns else []
+        if 'moving_average' in weekly_data.columns:
+            ma_data = weekly_data['moving_average'].to_numpy(dtype=np.float64)
+        else:
+            ma_data = np.empty(0, dtype=np.float64)
         
         return x_data, y_data, ma_data
     
-    def _create_figure(self, x_data: List[str], y_data: List[float], ma_data: List[float] = None, moving_average_window: int = 4) -> go.Figure:
+    def _create_figure(self, x_data: np.ndarray, y_data: np.ndarray, ma_data: np.ndarray = None, moving_average_window: int = 4) -> go.Figure:
         """
         Plotly図表オブジェクトを作成
         
+        トレースとレイアウトはプレーンなdictで組み立て、go.Figureの検証（validate_coerce）を
+        省略して生成する。値はCHART_CONFIGと_build_layoutで固定しているため検証は不要。
+        
         Args:
             x_data: X軸データ
             y_data: Y軸データ
             ma_data: 移動平均データ（オプション）
+            moving_average_window: 移動平均のウィンドウサイズ（凡例名に使用）
             
         Returns:
             Plotly図表オブジェクト
         """
-        fig = go.Figure()
+        trace_type = self._get_trace_type(len(x_data))
         
-        # 青色のマーカー付き線グラフを追加
-        fig.add_trace(go.Scatter(
+        # 青色のマーカー付き線グラフ
+        traces = [dict(
+            type=trace_type,
             x=x_data,
             y=y_data,
             mode='lines+markers',
@@ -142,11 +250,12 @@ class ProductivityVisualizer:
                 color=self.CHART_CONFIG['line_color'],
                 size=self.CHART_CONFIG['marker_size']
             )
-        ))
+        )]
         
         # 移動平均線を追加（データが存在する場合）
-        if ma_data:
-            fig.add_trace(go.Scatter(
+        if ma_data is not None and len(ma_data) > 0:
+            traces.append(dict(
+                type=trace_type,
                 x=x_data,
                 y=ma_data,
                 mode='lines',
@@ -158,23 +267,78 @@ class ProductivityVisualizer:
                 )
             ))
         
-        return fig
+        layout = self._build_layout()
+        
+        # 大量データは間引いた図表を使用（plotly-resamplerが利用できない場合は全データを描画）
+        if len(x_data) >= self.CHART_CONFIG['resample_min_points']:
+            resampled_fig = self._create_resampled_figure(traces, layout)
+            if resampled_fig is not None:
+                return resampled_fig
+        
+        return go.Figure({'data': traces, 'layout': layout}, _validate=False)
     
-    def _apply_layout(self, fig: go.Figure) -> None:
+    def _create_resampled_figure(self, traces: List[Dict[str, Any]], layout: Dict[str, Any]) -> go.Figure:
         """
-        図表のレイアウトを適用
+        plotly-resamplerでデータを間引いた図表オブジェクトを作成
+        
+        各トレースのx/yはFigureResamplerに高解像度データ（hf_x/hf_y）として渡し、
+        LTTBで集約した点だけをHTMLに出力する。
         
         Args:
-            fig: レイアウトを適用する図表オブジェクト
-        """
-        fig.update_layout(
-            title='週次生産性の推移',
-            xaxis_title='週の開始日',
-            yaxis_title='生産性 (PR数/人)',
-            hovermode='x unified',
-            template=self.CHART_CONFIG['template'],
-            showlegend=True
+            traces: トレース定義（x/yを含むdict）のリスト
+            layout: レイアウト定義
+            
+        Returns:
+            間引き済みの図表オブジェクト。plotly-resamplerが利用できない場合はNone
+        """
+        try:
+            from plotly_resampler import FigureResampler
+        except ImportError:
+            return None
+        
+        fig = FigureResampler(
+            go.Figure({'data': [], 'layout': layout}, _validate=False),
+            default_n_shown_samples=self.CHART_CONFIG['resampled_points']
         )
+        for trace in traces:
+            trace = dict(trace)
+            hf_x = trace.pop('x')
+            hf_y = trace.pop('y')
+            fig.add_trace(trace, hf_x=hf_x, hf_y=hf_y)
+        
+        return fig
+    
+    def _get_trace_type(self, point_count: int) -> str:
+        """
+        データ点数に応じたトレース種別を取得
+        
+        点数が多い場合はブラウザの描画負荷を抑えるためWebGLで描画し、
+        少数の場合は表示品質を優先してSVGで描画する。
+        
+        Args:
+            point_count: トレースのデータ点数
+            
+        Returns:
+            'scattergl' または 'scatter'
+        """
+        return 'scattergl' if point_count >= self.CHART_CONFIG['webgl_min_points'] else 'scatter'
+    
+    def _build_layout(self) -> Dict[str, Any]:
+        """
+        図表のレイアウトをdictで作成
+        
+        固定部分はモジュール定数を浅くコピーして使い回す。検証を省略するとテンプレート名が
+        解決されないため、テンプレートは展開済みのdictで渡す。
+        
+        Returns:
+            Plotlyのレイアウト定義
+        """
+        return {**_BASE_LAYOUT, 'template': _get_template_layout(self.CHART_CONFIG['template'])}
+    
+    @cached_property
+    def _empty_chart_html(self) -> str:
+        """空のデータ用のチャートのHTML（内容が入力に依存しないため初回のみ生成する）"""
+        return self._create_empty_chart()
     
     def _create_empty_chart(self) -> str:
         """
@@ -183,16 +347,13 @@ class ProductivityVisualizer:
         Returns:
             空のチャートのHTML文字列
         """
-        # 空のデータでグラフを作成
+        # 空のデータで基本レイアウトのグラフを作成
         fig = self._create_figure([], [], [], 4)
         
-        # 基本レイアウトを適用
-        self._apply_layout(fig)
-        
         # 空データ用の注釈を追加
         self._add_empty_data_annotation(fig)
         
-        return fig.to_html(include_plotlyjs='inline')
+        return self._to_html(fig)
     
     def _add_empty_data_annotation(self, fig: go.Figure) -> None:
         """
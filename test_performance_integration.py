@@ -126,25 +126,25 @@ def test_pagination_functionality():
         from src.data_layer.database_manager import DatabaseManager
         from unittest.mock import Mock, MagicMock
         
-        # モックセッションとクエリ結果を設定
+        from collections import namedtuple
+        from datetime import datetime, timedelta
+        
+        # クエリ結果の行（id, merged_at, author, pr_number, repo_name, title）
+        Row = namedtuple('Row', ['id', 'merged_at', 'author', 'pr_number', 'repo_name', 'title'])
+        base_time = datetime(2024, 1, 31)
+        rows = [
+            Row(i, base_time - timedelta(hours=i), f'user_{i}', i, 'test/repo', f'PR {i}')
+            for i in range(1, 16)
+        ]
+        
+        # モックセッションとクエリ結果を設定（次ページ判定用に1件多く取得するため1ページ目は11件、2ページ目は5件）
         mock_session = Mock()
         mock_query = Mock()
-        mock_base_query = Mock()
-        
-        # クエリチェーンのモック設定
-        mock_session.query.return_value = mock_base_query
-        mock_base_query.filter.return_value = mock_base_query
-        mock_base_query.count.return_value = 250  # 総件数250件
-        mock_base_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
         mock_query.limit.return_value = mock_query
-        
-        # ページ1のテストデータ（10件）
-        mock_results = [
-            (f'2024-01-{i:02d}', f'user_{i}', i, 'test/repo', f'PR {i}')
-            for i in range(1, 11)
-        ]
-        mock_query.all.return_value = mock_results
+        mock_query.all.side_effect = [rows[:11], rows[10:]]
+        mock_session.query.return_value = mock_query
         
         # DatabaseManagerのget_sessionをモック
         db_manager = DatabaseManager(':memory:')
@@ -152,23 +152,26 @@ def test_pagination_functionality():
         db_manager.get_session.return_value.__enter__ = Mock(return_value=mock_session)
         db_manager.get_session.return_value.__exit__ = Mock(return_value=None)
         
-        # ページネーション機能をテスト
-        result = db_manager.get_merged_pull_requests_paginated(page=1, page_size=10)
+        # キーセットページネーションで先頭ページを取得
+        first_page = db_manager.get_merged_pull_requests_paginated(page_size=10)
         
-        # 結果検証
-        assert result['page'] == 1
-        assert result['page_size'] == 10
-        assert result['total_count'] == 250
-        assert result['total_pages'] == 25  # 250 / 10 = 25
-        assert result['has_next_page'] is True
-        assert result['has_prev_page'] is False
-        assert len(result['data']) == 10
-        assert result['showing_from'] == 1
-        assert result['showing_to'] == 10
-        
-        print(f"✅ ページ情報: {result['page']}/{result['total_pages']}")
-        print(f"✅ データ件数: {len(result['data'])}/{result['total_count']}")
-        print(f"✅ 次ページ: {result['has_next_page']}, 前ページ: {result['has_prev_page']}")
+        assert first_page['page_size'] == 10
+        assert len(first_page['data']) == 10
+        assert first_page['has_next_page'] is True
+        assert first_page['next_cursor'] == (rows[9].merged_at, rows[9].id)
+        
+        # 前ページのnext_cursorを渡して続きを取得
+        second_page = db_manager.get_merged_pull_requests_paginated(
+            page_size=10, cursor=first_page['next_cursor']
+        )
+        
+        assert len(second_page['data']) == 5
+        assert second_page['has_next_page'] is False
+        assert second_page['next_cursor'] == (rows[14].merged_at, rows[14].id)
+        mock_query.limit.assert_called_with(11)
+        
+        print(f"✅ 1ページ目: {len(first_page['data'])}件, 次ページ: {first_page['has_next_page']}")
+        print(f"✅ 2ページ目: {len(second_page['data'])}件, 次ページ: {second_page['has_next_page']}")
         print("✅ ページネーション機能テスト成功")
         return True
         
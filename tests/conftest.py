@@ -0,0 +1,71 @@
+"""テスト共通のフィクスチャ"""
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.data_layer import github_client
+from src.data_layer.models import Base
+
+
+@pytest.fixture
+def github_client_logger(monkeypatch):
+    """github_clientモジュールのロガーをテストごとにモックへ差し替える
+
+    monkeypatchで差し替えるためテスト終了時に確実に元へ戻り、
+    pytest-xdistのワーカー間でも状態を共有しない。
+    """
+    mock_logger = Mock()
+    monkeypatch.setattr(github_client, "logger", mock_logger)
+    return mock_logger
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """スキーマ作成済みのインメモリSQLiteエンジン（テストセッションで1回だけ作成）"""
+    # StaticPoolで常に同じ接続を返し、どの接続からも作成済みのスキーマを参照できるようにする
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    # pysqliteはSAVEPOINTを正しく扱えないため、トランザクション開始を自前で発行する。
+    # 使い捨てのDBなので同期・ジャーナル・ロックの安全性より速度を優先する
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # 空のDBなので存在確認を省き、すべてのCREATEを1トランザクションで発行する
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, checkfirst=False)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """外部トランザクションに参加するテスト用セッション
+
+    テスト内のcommitはSAVEPOINTの解放に留まり、
+    終了時に外側のトランザクションごとロールバックして次のテストへ状態を持ち越さない。
+    """
+    connection = engine.connect()
+    trans = connection.begin()
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+        yield session
+    trans.rollback()
+    connection.close()
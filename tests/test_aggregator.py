@@ -3,7 +3,7 @@ import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.business_layer.aggregator import ProductivityAggregator
 from src.business_layer.timezone_handler import TimezoneHandler
@@ -300,6 +300,53 @@ class TestProductivityAggregator:
         # タイムゾーンを考慮して適切に週が分けられることを確認
         assert isinstance(result, pd.DataFrame)
         assert len(result) >= 1
+    
+    def test_DataFrameを渡してもリストと同じ結果になる(self, aggregator):
+        """正常系: 列形式のDataFrameを渡した場合も辞書のリストと同じ週次メトリクスになることを確認"""
+        prs = [
+            {"number": number, "author": f"developer{number % 2}",
+             "merged_at": datetime(2024, 1, 10 + number, 10, 0, tzinfo=timezone.utc)}
+            for number in range(1, 8)
+        ]
+        
+        from_list = aggregator.calculate_weekly_metrics(prs)
+        from_frame = aggregator.calculate_weekly_metrics(pd.DataFrame(prs))
+        
+        pd.testing.assert_frame_equal(from_list, from_frame)
+    
+    def test_週境界は1件ずつではなく列単位で計算される(self, aggregator, timezone_handler):
+        """性能: 単一タイムゾーンのデータではget_week_boundariesを1件ずつ呼ばず、列単位で週境界を求めることを確認"""
+        prs = [
+            {"number": number, "author": f"developer{number % 3}",
+             "merged_at": datetime(2024, 1, 1 + number % 28, 10, 0, tzinfo=timezone.utc)}
+            for number in range(1, 101)
+        ]
+        
+        with patch.object(timezone_handler, 'get_week_boundaries',
+                          wraps=timezone_handler.get_week_boundaries) as get_week_boundaries:
+            result = aggregator.calculate_weekly_metrics(prs)
+        
+        # 行ごとの計算（Series.apply）に戻ると、PR件数分だけ呼び出される
+        get_week_boundaries.assert_not_called()
+        assert result['pr_count'].sum() == len(prs)
+    
+    def test_夏時間終了の週も月曜日始まりで集計される(self):
+        """正常系: 夏時間が終わる週の日曜深夜のPRが、その週の月曜日から始まる週に含まれることを確認"""
+        from zoneinfo import ZoneInfo
+        
+        new_york = ZoneInfo("America/New_York")
+        aggregator = ProductivityAggregator(TimezoneHandler("America/New_York"))
+        prs = [
+            # 2024-11-03（日）02:00に夏時間が終わる
+            {"number": 1, "author": "developer1", "merged_at": datetime(2024, 10, 28, 9, 0, tzinfo=new_york)},
+            {"number": 2, "author": "developer2", "merged_at": datetime(2024, 11, 3, 23, 0, tzinfo=new_york)},
+        ]
+        
+        result = aggregator.calculate_weekly_metrics(prs)
+        
+        assert len(result) == 1
+        assert result.iloc[0]['week_start'] == pd.Timestamp(datetime(2024, 10, 28, tzinfo=new_york))
+        assert result.iloc[0]['pr_count'] == 2
 
 
 class TestMovingAverageCalculation:
@@ -4,6 +4,7 @@ import os
 import tempfile
 from pathlib import Path
 from contextlib import contextmanager
+from datetime import datetime, timezone
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session
 
@@ -20,9 +21,10 @@ class TestDatabaseManager:
         with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
             temp_path = f.name
         yield temp_path
-        # テスト後にクリーンアップ
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+        # テスト後にクリーンアップ（WALモードの補助ファイルを含む）
+        for path in (temp_path, f"{temp_path}-wal", f"{temp_path}-shm"):
+            if os.path.exists(path):
+                os.unlink(path)
     
     def test_DatabaseManagerが正常に初期化できる(self, temp_db_path):
         """正常系: DatabaseManagerが正常に初期化できることを確認"""
@@ -70,6 +72,47 @@ class TestDatabaseManager:
             indexes = list(result)
             assert len(indexes) > 0
     
+    @pytest.mark.parametrize("fast_mode,journal_mode,synchronous", [
+        (False, "wal", 1),  # synchronous=NORMAL
+        (True, "memory", 0),  # synchronous=OFF
+    ])
+    def test_接続ごとにPRAGMAが設定される(self, temp_db_path, fast_mode, journal_mode, synchronous):
+        """正常系: 接続にジャーナル・同期モードのPRAGMAが設定されることを確認"""
+        manager = DatabaseManager(temp_db_path, fast_mode=fast_mode)
+        manager.initialize_database()
+        
+        with manager.get_session() as session:
+            assert session.execute(text("PRAGMA journal_mode")).scalar() == journal_mode
+            assert session.execute(text("PRAGMA synchronous")).scalar() == synchronous
+        
+        manager.close()
+    
+    @pytest.mark.parametrize("index_rebuild_threshold", [1, 1000])
+    def test_bulk_insert_pull_requestsで重複を除いて挿入されインデックスが維持される(
+            self, temp_db_path, index_rebuild_threshold):
+        """正常系: 一括挿入で既存PRが無視され、インデックスを作り直す場合も元のインデックスが残ることを確認"""
+        manager = DatabaseManager(temp_db_path)
+        manager.initialize_database()
+        now = datetime.now(timezone.utc)
+        pr_data = [
+            {"number": number, "author": "user", "title": f"PR {number}",
+             "merged_at": now, "created_at": now, "updated_at": now}
+            for number in range(1, 4)
+        ]
+        
+        first_count = manager.bulk_insert_pull_requests(
+            "test/repo", pr_data[:2], index_rebuild_threshold=index_rebuild_threshold)
+        second_count = manager.bulk_insert_pull_requests(
+            "test/repo", pr_data, index_rebuild_threshold=index_rebuild_threshold)
+        
+        assert (first_count, second_count) == (2, 1)
+        with manager.get_session() as session:
+            assert session.query(PullRequest).count() == 3
+            index_names = {row[1] for row in session.execute(text("PRAGMA index_list('pull_requests')"))}
+        assert {index.name for index in PullRequest.__table__.indexes} <= index_names
+        
+        manager.close()
+    
     def test_get_sessionがコンテキストマネージャとして動作する(self, temp_db_path):
         """正常系: get_session()がコンテキストマネージャとして動作することを確認"""
         manager = DatabaseManager(temp_db_path)
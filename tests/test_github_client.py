@@ -1,16 +1,98 @@
 """GitHub APIクライアントのテスト"""
+import threading
 import pytest
-from datetime import datetime, timezone
+import requests
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import Mock, patch, MagicMock
 
+from github import RateLimitExceededException
+
 from src.data_layer.github_client import (
     GitHubClient,
     GitHubAPIError,
+    PRRecord,
+    RateLimit,
     RateLimitError
 )
 
 
+@pytest.fixture(scope="module")
+def shared_client():
+    """モジュール内で共有するGitHubClient（初期化は1回のみ）"""
+    with patch('src.data_layer.github_client.Github'):
+        return GitHubClient("test_token")
+
+
+@pytest.fixture
+def client(shared_client, monkeypatch):
+    """テストごとにGithubモックと待機・リトライ状態を差し替えた共有GitHubClient"""
+    monkeypatch.setattr(shared_client, "_github", Mock())
+    monkeypatch.setattr(shared_client, "_sleep", Mock())
+    monkeypatch.setattr(shared_client, "_now", lambda: datetime.now(timezone.utc))
+    monkeypatch.setattr(shared_client, "_retry_state", threading.local())
+    return shared_client
+
+
+@pytest.fixture
+def gh_mock(client):
+    """共有GitHubClientと、そのGithubモック・get_repoが返すリポジトリモックの組"""
+    return SimpleNamespace(client=client, instance=client._github, repo=client._github.get_repo.return_value)
+
+
+@pytest.fixture
+def freeze_now(client, monkeypatch):
+    """共有クライアントの現在時刻をISO 8601文字列で指定した時刻に固定する関数を返す"""
+    def freeze(iso_timestamp):
+        frozen = datetime.fromisoformat(iso_timestamp)
+        monkeypatch.setattr(client, "_now", lambda: frozen)
+        return frozen
+    return freeze
+
+
+@pytest.fixture
+def github_factory():
+    """
+    Githubをモックに差し替え、返すPRデータ行とコンストラクタ引数を指定してGitHubClientを生成する関数を返す
+    
+    生成関数は (client, instance, repo) を返す。同じテスト内で複数回呼び出すと同じGithubモックを共有する。
+    """
+    with patch('src.data_layer.github_client.Github', new_callable=Mock) as mock_github:
+        instance = mock_github.return_value
+        repo = instance.get_repo.return_value
+        
+        def create(prs=(), **client_kwargs):
+            repo.get_pulls.side_effect = lambda **kwargs: list(prs)
+            client = GitHubClient("test_token", **client_kwargs)
+            return SimpleNamespace(client=client, instance=instance, repo=repo)
+        
+        yield create
+
+
+def _pr_stub(number, merged_at, created_at, updated_at=None, title=None, login="developer1"):
+    """PyGithubのPullRequestの代わりに使う軽量なPRデータ行（未定義の属性へのアクセスは失敗する）"""
+    return SimpleNamespace(
+        number=number,
+        title=title if title is not None else f"PR {number}",
+        user=SimpleNamespace(login=login),
+        merged_at=merged_at,
+        created_at=created_at,
+        updated_at=updated_at if updated_at is not None else merged_at
+    )
+
+
+# 取得処理が読み取るだけのPRデータ行（テスト間で共有するため変更しないこと）
+_PR_123 = _pr_stub(
+    123, datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc), datetime(2024, 1, 10, 9, 0, tzinfo=timezone.utc),
+    title="Feature PR 1", login="developer1"
+)
+_PR_124 = _pr_stub(
+    124, datetime(2024, 1, 16, 14, 15, tzinfo=timezone.utc), datetime(2024, 1, 11, 8, 30, tzinfo=timezone.utc),
+    title="Feature PR 2", login="developer2"
+)
+
+
 class TestGitHubClientExceptions:
     """GitHub APIクライアントのカスタム例外テスト"""
     
@@ -30,6 +112,46 @@ class TestGitHubClientExceptions:
         assert isinstance(error, Exception)
 
 
+class TestPRRecord:
+    """PRRecordデータクラスのテスト"""
+    
+    @pytest.fixture
+    def record(self):
+        """サンプルPRRecord"""
+        return PRRecord(
+            number=1,
+            title="PR 1",
+            author="developer1",
+            merged_at=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
+            created_at=datetime(2024, 1, 10, 9, 0, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+        )
+    
+    def test_辞書互換の添字アクセスができる(self, record):
+        """正常系: 既存の呼び出し側向けに添字アクセスで値を取得できることを確認"""
+        assert record["number"] == record.number == 1
+        assert record["author"] == "developer1"
+    
+    def test_辞書互換のキー存在確認ができる(self, record):
+        """正常系: in演算子でフィールドの有無を確認できることを確認"""
+        assert "number" in record
+        assert "merged_at" in record
+        assert "unknown" not in record
+    
+    def test_存在しないキーはKeyErrorになる(self, record):
+        """異常系: 存在しないフィールド名の添字アクセスでKeyErrorが発生することを確認"""
+        with pytest.raises(KeyError):
+            record["unknown"]
+    
+    def test_不変でありスロットを使用する(self, record):
+        """正常系: レコードが不変で__dict__を持たないことを確認"""
+        from dataclasses import FrozenInstanceError
+        
+        with pytest.raises(FrozenInstanceError):
+            record.number = 2
+        assert not hasattr(record, "__dict__")
+
+
 class TestGitHubClientInitialization:
     """GitHubClientクラスの初期化テスト"""
     
@@ -99,266 +221,887 @@ class TestGitHubClientAuthentication:
 class TestFetchMergedPRs:
     """fetch_merged_prsメソッドのテスト"""
     
-    @patch('src.data_layer.github_client.Github')
-    def test_マージ済みPR取得が正常に動作する(self, mock_github):
+    def test_マージ済みPR取得が正常に動作する(self, gh_mock):
         """正常系: 指定期間のマージ済みPRが正常に取得されることを確認"""
-        # モックPRデータの準備
-        mock_pr1 = Mock()
-        mock_pr1.number = 123
-        mock_pr1.title = "Feature PR 1"
-        mock_pr1.user.login = "developer1"
-        mock_pr1.merged_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
-        mock_pr1.created_at = datetime(2024, 1, 10, 9, 0, tzinfo=timezone.utc)
-        mock_pr1.updated_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
-        
-        mock_pr2 = Mock()
-        mock_pr2.number = 124
-        mock_pr2.title = "Feature PR 2"
-        mock_pr2.user.login = "developer2"
-        mock_pr2.merged_at = datetime(2024, 1, 16, 14, 15, tzinfo=timezone.utc)
-        mock_pr2.created_at = datetime(2024, 1, 11, 8, 30, tzinfo=timezone.utc)
-        mock_pr2.updated_at = datetime(2024, 1, 16, 14, 15, tzinfo=timezone.utc)
-        
         # モックリポジトリの設定
-        mock_repo = Mock()
-        mock_repo.get_pulls.return_value = [mock_pr1, mock_pr2]
-        
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github.return_value = mock_github_instance
+        gh_mock.repo.get_pulls.return_value = [_PR_123, _PR_124]
         
         # テスト実行
-        client = GitHubClient("test_token")
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
         
-        result = client.fetch_merged_prs("owner/repo", since_date, until_date)
+        result = gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
         
         # アサーション
         assert len(result) == 2
         
-        assert result[0]["number"] == 123
-        assert result[0]["title"] == "Feature PR 1"
-        assert result[0]["author"] == "developer1"
-        assert result[0]["merged_at"] == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert all(isinstance(pr, PRRecord) for pr in result)
         
-        assert result[1]["number"] == 124
-        assert result[1]["title"] == "Feature PR 2"
-        assert result[1]["author"] == "developer2"
-        assert result[1]["merged_at"] == datetime(2024, 1, 16, 14, 15, tzinfo=timezone.utc)
+        assert result[0].number == 123
+        assert result[0].title == "Feature PR 1"
+        assert result[0].author == "developer1"
+        assert result[0].merged_at == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        
+        assert result[1].number == 124
+        assert result[1].title == "Feature PR 2"
+        assert result[1].author == "developer2"
+        assert result[1].merged_at == datetime(2024, 1, 16, 14, 15, tzinfo=timezone.utc)
         
         # モックが正しく呼ばれたことを確認
-        mock_github_instance.get_repo.assert_called_once_with("owner/repo")
-        mock_repo.get_pulls.assert_called_once_with(
+        gh_mock.instance.get_repo.assert_called_once_with("owner/repo")
+        gh_mock.repo.get_pulls.assert_called_once_with(
             state="closed", 
             sort="updated", 
             direction="desc"
         )
     
-    @patch('src.data_layer.github_client.Github')
-    def test_until日時がNoneの場合現在時刻が使用される(self, mock_github):
+    def test_until日時がNoneの場合現在時刻が使用される(self, gh_mock, freeze_now):
         """正常系: until日時がNoneの場合、現在時刻が使用されることを確認"""
-        mock_repo = Mock()
-        mock_repo.get_pulls.return_value = []
+        # 現在時刻より後にマージされたPR
+        mock_pr_future = SimpleNamespace(
+            merged_at=datetime(2024, 2, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 2, 1, tzinfo=timezone.utc)
+        )
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github.return_value = mock_github_instance
+        # 現在時刻より前にマージされたPR
+        mock_pr_past = _pr_stub(
+            200, datetime(2024, 1, 15, tzinfo=timezone.utc), datetime(2024, 1, 10, tzinfo=timezone.utc), title="Past PR"
+        )
         
-        client = GitHubClient("test_token")
+        gh_mock.repo.get_pulls.return_value = [mock_pr_future, mock_pr_past]
+        
+        freeze_now("2024-01-31T12:00:00+00:00")
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         
-        with patch('src.data_layer.github_client.datetime') as mock_datetime:
-            mock_now = datetime(2024, 1, 31, 12, 0, tzinfo=timezone.utc)
-            mock_datetime.now.return_value = mock_now
-            mock_datetime.timezone = timezone
-            
-            result = client.fetch_merged_prs("owner/repo", since_date, None)
-            
-            # 現在時刻が取得されることを確認
-            mock_datetime.now.assert_called_once_with(timezone.utc)
+        result = gh_mock.client.fetch_merged_prs("owner/repo", since_date, None)
+        
+        # 現在時刻が終了日時として使用され、それ以降にマージされたPRは除外される
+        assert [pr.number for pr in result] == [200]
     
-    @patch('src.data_layer.github_client.Github')
-    def test_マージされていないPRは除外される(self, mock_github):
+    def test_マージされていないPRは除外される(self, gh_mock):
         """正常系: マージされていないPRは結果に含まれないことを確認"""
         # マージされていないPR
-        mock_pr_open = Mock()
-        mock_pr_open.merged_at = None
-        mock_pr_open.state = "closed"
+        mock_pr_open = SimpleNamespace(
+            merged_at=None, state="closed", updated_at=datetime(2024, 1, 22, tzinfo=timezone.utc)
+        )
         
         # マージされたPR
-        mock_pr_merged = Mock()
-        mock_pr_merged.number = 125
-        mock_pr_merged.title = "Merged PR"
-        mock_pr_merged.user.login = "developer3"
-        mock_pr_merged.merged_at = datetime(2024, 1, 20, tzinfo=timezone.utc)
-        mock_pr_merged.created_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
-        mock_pr_merged.updated_at = datetime(2024, 1, 20, tzinfo=timezone.utc)
-        
-        mock_repo = Mock()
-        mock_repo.get_pulls.return_value = [mock_pr_open, mock_pr_merged]
+        mock_pr_merged = _pr_stub(
+            125, datetime(2024, 1, 20, tzinfo=timezone.utc), datetime(2024, 1, 15, tzinfo=timezone.utc),
+            title="Merged PR", login="developer3"
+        )
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github.return_value = mock_github_instance
+        gh_mock.repo.get_pulls.return_value = [mock_pr_open, mock_pr_merged]
         
-        client = GitHubClient("test_token")
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
         
-        result = client.fetch_merged_prs("owner/repo", since_date, until_date)
+        result = gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
         
         # マージされたPRのみが含まれることを確認
         assert len(result) == 1
         assert result[0]["number"] == 125
     
-    @patch('src.data_layer.github_client.Github')
-    def test_期間外のPRは除外される(self, mock_github):
+    def test_期間外のPRは除外される(self, gh_mock):
         """正常系: 指定期間外のPRは結果に含まれないことを確認"""
+        # 期間より後のPR
+        mock_pr_after = SimpleNamespace(
+            merged_at=datetime(2024, 2, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 2, 1, tzinfo=timezone.utc)
+        )
+        
+        # 期間内のPR
+        mock_pr_within = _pr_stub(
+            126, datetime(2024, 1, 15, tzinfo=timezone.utc), datetime(2024, 1, 10, tzinfo=timezone.utc),
+            title="Within Range PR", login="developer4"
+        )
+        
         # 期間より前のPR
-        mock_pr_before = Mock()
-        mock_pr_before.merged_at = datetime(2023, 12, 31, tzinfo=timezone.utc)
+        mock_pr_before = SimpleNamespace(
+            number=98,
+            merged_at=datetime(2023, 12, 31, tzinfo=timezone.utc),
+            updated_at=datetime(2023, 12, 31, tzinfo=timezone.utc)
+        )
         
+        # get_pullsはupdated_atの降順で返す
+        gh_mock.repo.get_pulls.return_value = [mock_pr_after, mock_pr_within, mock_pr_before]
+        
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        result = gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        # 期間内のPRのみが含まれることを確認
+        assert len(result) == 1
+        assert result[0]["number"] == 126
+    
+    def test_since以前に更新されたPRでページ送りを打ち切る(self, gh_mock):
+        """正常系: updated_atがsinceより前のPRに到達したら以降のPRを取得しないことを確認"""
         # 期間内のPR
-        mock_pr_within = Mock()
-        mock_pr_within.number = 126
-        mock_pr_within.title = "Within Range PR"
-        mock_pr_within.user.login = "developer4"
-        mock_pr_within.merged_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
-        mock_pr_within.created_at = datetime(2024, 1, 10, tzinfo=timezone.utc)
-        mock_pr_within.updated_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        mock_pr_within = _pr_stub(
+            127, datetime(2024, 1, 15, tzinfo=timezone.utc), datetime(2024, 1, 10, tzinfo=timezone.utc),
+            title="Within Range PR", login="developer5"
+        )
         
-        # 期間より後のPR
-        mock_pr_after = Mock()
-        mock_pr_after.merged_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        # sinceより前に更新されたPR（ここで打ち切られるべき）
+        mock_pr_stale = SimpleNamespace(
+            number=100,
+            merged_at=datetime(2023, 12, 20, tzinfo=timezone.utc),
+            updated_at=datetime(2023, 12, 20, tzinfo=timezone.utc)
+        )
+        
+        # 触れられたら失敗する番兵PR（属性アクセスでAttributeError）
+        mock_pr_sentinel = SimpleNamespace()
+        
+        consumed = []
+        
+        def pulls_generator():
+            for pr in [mock_pr_within, mock_pr_stale, mock_pr_sentinel]:
+                consumed.append(pr)
+                yield pr
+        
+        gh_mock.repo.get_pulls.return_value = pulls_generator()
+        
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        result = gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        assert len(result) == 1
+        assert result[0]["number"] == 127
+        # 3件目以降は取得されていないことを確認
+        assert len(consumed) == 2
+
+    def test_期間より古いPRに到達したら走査を打ち切る(self, gh_mock):
+        """正常系: 3件目でsinceより古いPRに到達した後はイテレータを進めず、レート制限確認も行わないことを確認"""
+        def make_pr(number, updated_at):
+            return _pr_stub(number, updated_at, updated_at - timedelta(days=1), login="developer7")
+        
+        prs = [
+            make_pr(131, datetime(2024, 1, 25, tzinfo=timezone.utc)),
+            make_pr(130, datetime(2024, 1, 12, tzinfo=timezone.utc)),
+            make_pr(129, datetime(2023, 12, 1, tzinfo=timezone.utc)),
+        ]
+        
+        def pulls_generator():
+            yield from prs
+            raise AssertionError("iterated past the first PR older than since")
+        
+        gh_mock.repo.get_pulls.return_value = pulls_generator()
+        gh_mock.instance.get_rate_limit.return_value.core.limit = 5000
+        gh_mock.instance.get_rate_limit.return_value.core.remaining = 5000
+        
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        result = gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        assert [pr.number for pr in result] == [131, 130]
+        # 打ち切り対象のPRではレート制限を確認しない
+        assert gh_mock.instance.get_rate_limit.call_count == 2
+    
+    def test_PRの各フィールドは1回だけ参照されraw_dataは使われない(self, gh_mock):
+        """正常系: PyGithubの補完GETを誘発しないよう、フィールドを1回ずつ参照しraw_dataに触れないことを確認"""
+        from unittest.mock import PropertyMock
+        
+        mock_pr = Mock()
+        mock_pr.number = 132
+        mock_pr.title = "Attribute PR"
+        mock_pr.user.login = "developer8"
+        mock_pr.created_at = datetime(2024, 1, 9, tzinfo=timezone.utc)
+        merged_at = PropertyMock(return_value=datetime(2024, 1, 10, tzinfo=timezone.utc))
+        updated_at = PropertyMock(return_value=datetime(2024, 1, 10, tzinfo=timezone.utc))
+        raw_data = PropertyMock(side_effect=AssertionError("raw_data triggers a completion request"))
+        type(mock_pr).merged_at = merged_at
+        type(mock_pr).updated_at = updated_at
+        type(mock_pr).raw_data = raw_data
+        
+        gh_mock.repo.get_pulls.return_value = [mock_pr]
+        
+        result = gh_mock.client.fetch_merged_prs(
+            "owner/repo", datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 31, tzinfo=timezone.utc)
+        )
+        
+        assert [pr.number for pr in result] == [132]
+        assert merged_at.call_count == 1
+        assert updated_at.call_count == 1
+        raw_data.assert_not_called()
+    
+    def test_PR一覧はリストに展開せず逐次処理される(self, gh_mock):
+        """正常系: 期間外のPRの次を要求した時点で失敗するイテレータでも取得が完了することを確認"""
+        mock_pr_within = _pr_stub(
+            128, datetime(2024, 1, 20, tzinfo=timezone.utc), datetime(2024, 1, 18, tzinfo=timezone.utc),
+            title="Streamed PR", login="developer6"
+        )
+
+        mock_pr_out_of_range = SimpleNamespace(
+            number=99, merged_at=None, updated_at=datetime(2023, 11, 1, tzinfo=timezone.utc)
+        )
+
+        def pulls_generator():
+            yield mock_pr_within
+            yield mock_pr_out_of_range
+            raise AssertionError("should have stopped")
+
+        gh_mock.repo.get_pulls.return_value = pulls_generator()
+
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+        result = gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
+
+        assert [pr.number for pr in result] == [128]
+
+    def test_リポジトリが存在しない場合GitHubAPIErrorが発生する(self, gh_mock):
+        """異常系: リポジトリが存在しない場合GitHubAPIErrorが発生することを確認"""
+        from github import UnknownObjectException
+        
+        gh_mock.instance.get_repo.side_effect = UnknownObjectException(404, "Not Found")
+        
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        with pytest.raises(GitHubAPIError, match="Repository not found"):
+            gh_mock.client.fetch_merged_prs("owner/nonexistent", since_date, until_date)
+
+
+class TestConcurrentMultiRepoFetch:
+    """fetch_merged_prs_manyメソッドのテスト"""
+    
+    def test_複数リポジトリのPRが並行して取得される(self, client):
+        """正常系: 複数リポジトリへのリクエストが並行して発行されることを確認"""
+        repos = [f"owner/repo{i}" for i in range(8)]
+        
+        mock_repo = Mock()
+        mock_repo.get_pulls.return_value = []
+        
+        # 全リポジトリのget_repoが同時に待ち合わせできた場合のみ通過する
+        # （逐次実行ではタイムアウトしてBrokenBarrierErrorになる）
+        barrier = threading.Barrier(len(repos), timeout=5)
+        
+        def get_repo(name):
+            barrier.wait()
+            return mock_repo
+        
+        mock_github_instance = client._github
+        mock_github_instance.get_repo.side_effect = get_repo
+        
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        result = client.fetch_merged_prs_many(repos, since_date, until_date, max_workers=len(repos))
+        
+        assert list(result.keys()) == repos
+        assert all(prs == [] for prs in result.values())
+        assert mock_github_instance.get_repo.call_count == len(repos)
+        assert not barrier.broken
+    
+    def test_空のリポジトリリストでは空の辞書を返す(self, client):
+        """正常系: リポジトリが指定されない場合は空の辞書を返すことを確認"""
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        assert client.fetch_merged_prs_many([], since_date) == {}
+    
+    def test_いずれかのリポジトリでエラーが発生した場合GitHubAPIErrorが伝播する(self, client):
+        """異常系: 一部のリポジトリが存在しない場合GitHubAPIErrorが発生することを確認"""
+        from github import UnknownObjectException
         
         mock_repo = Mock()
-        mock_repo.get_pulls.return_value = [mock_pr_before, mock_pr_within, mock_pr_after]
+        mock_repo.get_pulls.return_value = []
+        
+        def get_repo(name):
+            if name == "owner/nonexistent":
+                raise UnknownObjectException(404, "Not Found")
+            return mock_repo
+        
+        mock_github_instance = client._github
+        mock_github_instance.get_repo.side_effect = get_repo
         
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        with pytest.raises(GitHubAPIError, match="Repository not found"):
+            client.fetch_merged_prs_many(["owner/repo", "owner/nonexistent"], since_date)
+
+
+class TestDiskCache:
+    """マージ済みPRのディスクキャッシュのテスト"""
+    
+    ETAG = 'W/"abc123"'
+    
+    # キャッシュ対象となる1件のマージ済みPR
+    CACHED_PR = _pr_stub(
+        300, datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc), datetime(2024, 1, 10, 9, 0, tzinfo=timezone.utc),
+        title="Cached PR"
+    )
+    
+    @pytest.fixture
+    def create_client(self, github_factory):
+        """ETag確認レスポンスとコンストラクタ引数を指定してキャッシュ対象のPRを返すクライアントを生成する関数"""
+        def create(probe_responses, **client_kwargs):
+            gh = github_factory([self.CACHED_PR], **client_kwargs)
+            gh.instance.requester.requestJson.side_effect = probe_responses
+            return gh
+        return create
+    
+    def test_未変更の場合2回目はキャッシュから返す(self, create_client, tmp_path):
+        """正常系: ETagが一致(304)する場合、2回目の取得でリポジトリにアクセスしないことを確認"""
+        gh = create_client([
+            (200, {"etag": self.ETAG}, "[]"),
+            (304, {"etag": self.ETAG}, "")
+        ], cache_path=tmp_path / "c.sqlite")
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        first = gh.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        second = gh.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        assert gh.instance.get_repo.call_count == 1
+        assert second == first
+        assert second[0].merged_at == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        
+        # 2回目は保存したETagで条件付きリクエストを送る
+        probe_kwargs = gh.instance.requester.requestJson.call_args_list[1].kwargs
+        assert probe_kwargs["headers"] == {"If-None-Match": self.ETAG}
+    
+    def test_未変更の場合はキャッシュを書き換えない(self, create_client, tmp_path):
+        """正常系: 304の場合は保存済みの内容をそのまま返し、キャッシュへの再書き込みを行わないことを確認"""
+        gh = create_client([
+            (200, {"etag": self.ETAG}, "[]"),
+            (304, {}, "")
+        ], cache_path=tmp_path / "c.sqlite")
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        gh.client.fetch_merged_prs("owner/repo", since_date)
+        with patch.object(gh.client._pr_cache, 'set') as mock_set:
+            result = gh.client.fetch_merged_prs("owner/repo", since_date)
+        
+        assert [pr.number for pr in result] == [300]
+        mock_set.assert_not_called()
+    
+    def test_変更がある場合は再取得してキャッシュを更新する(self, create_client, tmp_path):
+        """正常系: ETagが変化(200)した場合は再取得し、新しいETagで保存することを確認"""
+        gh = create_client([
+            (200, {"etag": self.ETAG}, "[]"),
+            (200, {"etag": 'W/"def456"'}, "[]"),
+            (304, {"etag": 'W/"def456"'}, "")
+        ], cache_path=tmp_path / "c.sqlite")
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        for _ in range(3):
+            gh.client.fetch_merged_prs("owner/repo", since_date)
+        
+        assert gh.instance.get_repo.call_count == 2
+        probe_kwargs = gh.instance.requester.requestJson.call_args_list[2].kwargs
+        assert probe_kwargs["headers"] == {"If-None-Match": 'W/"def456"'}
+    
+    def test_キャッシュはクライアントをまたいで永続化される(self, create_client, github_factory, tmp_path):
+        """正常系: 別のクライアントインスタンスからも同じキャッシュが使用されることを確認"""
+        cache_path = tmp_path / "c.sqlite"
+        first = create_client([
+            (200, {"etag": self.ETAG}, "[]"),
+            (304, {"etag": self.ETAG}, "")
+        ], cache_path=cache_path)
+        second = github_factory([self.CACHED_PR], cache_path=cache_path)
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        first.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        result = second.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        assert [pr.number for pr in result] == [300]
+        assert second.instance.get_repo.call_count == 1
+    
+    def test_キャッシュ未指定ではETag確認を行わない(self, create_client):
+        """正常系: cache_pathを指定しない場合は従来通り毎回取得することを確認"""
+        gh = create_client([])
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        gh.client.fetch_merged_prs("owner/repo", since_date)
+        gh.client.fetch_merged_prs("owner/repo", since_date)
+        
+        assert gh.instance.get_repo.call_count == 2
+        gh.instance.requester.requestJson.assert_not_called()
+
+
+class TestMemoryCache:
+    """マージ済みPRのメモリキャッシュのテスト"""
+    
+    NOW = datetime(2024, 2, 1, 12, 0, tzinfo=timezone.utc)
+    # キャッシュ対象となる1件のマージ済みPR
+    CACHED_PR = _pr_stub(
+        400, datetime(2024, 1, 15, tzinfo=timezone.utc), datetime(2024, 1, 14, tzinfo=timezone.utc),
+        title="Memory Cached PR"
+    )
+    
+    @pytest.fixture
+    def clock(self):
+        """テストから進められる時計"""
+        current = {"now": self.NOW}
+        clock = lambda: current["now"]
+        clock.advance = lambda seconds: current.update(now=current["now"] + timedelta(seconds=seconds))
+        return clock
+    
+    def test_同一クエリの2回目の呼び出しはAPIを叩かない(self, github_factory, clock):
+        """正常系: 有効期限内の同一クエリはキャッシュから返されることを確認"""
+        gh = github_factory([self.CACHED_PR], clock=clock, memory_cache_ttl=300)
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        first = gh.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        first.clear()  # 呼び出し側での変更はキャッシュに影響しない
+        second = gh.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        assert [pr.number for pr in second] == [400]
+        assert gh.repo.get_pulls.call_count == 1
+    
+    def test_有効期限切れとno_cache指定では再取得する(self, github_factory, clock):
+        """正常系: TTL経過後やno_cache=Trueの場合はAPIから再取得することを確認"""
+        gh = github_factory([self.CACHED_PR], clock=clock, memory_cache_ttl=300)
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        gh.client.fetch_merged_prs("owner/repo", since_date)
+        gh.client.fetch_merged_prs("owner/repo", since_date, no_cache=True)
+        assert gh.repo.get_pulls.call_count == 2
+        
+        clock.advance(301)
+        gh.client.fetch_merged_prs("owner/repo", since_date)
+        assert gh.repo.get_pulls.call_count == 3
+    
+    def test_TTL未指定ではキャッシュしない(self, github_factory):
+        """正常系: memory_cache_ttlを指定しない場合は毎回APIから取得することを確認"""
+        gh = github_factory([self.CACHED_PR])
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        gh.client.fetch_merged_prs("owner/repo", since_date)
+        gh.client.fetch_merged_prs("owner/repo", since_date)
+        
+        assert gh.repo.get_pulls.call_count == 2
+
+
+class TestSearchFetch:
+    """Search APIによるfetch_merged_prsのテスト"""
+    
+    @staticmethod
+    def _make_issue(number, merged_at, login="developer1"):
+        """検索結果のIssueモックを作成"""
+        issue = Mock()
+        issue.number = number
+        issue.title = f"PR {number}"
+        issue.user.login = login
+        issue.pull_request.merged_at = merged_at
+        issue.closed_at = merged_at
+        issue.created_at = merged_at - timedelta(days=1)
+        issue.updated_at = merged_at
+        return issue
+    
+    @patch('src.data_layer.github_client.Github')
+    def test_マージ日時の範囲をクエリで指定して検索する(self, mock_github):
+        """正常系: 期間の絞り込みをサーバー側の検索クエリで行い、PR一覧を走査しないことを確認"""
         mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
+        mock_github_instance.search_issues.return_value = [
+            self._make_issue(301, datetime(2024, 1, 20, tzinfo=timezone.utc)),
+            self._make_issue(300, datetime(2024, 1, 5, tzinfo=timezone.utc)),
+        ]
         mock_github.return_value = mock_github_instance
         
-        client = GitHubClient("test_token")
+        client = GitHubClient("test_token", use_search=True)
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
         
         result = client.fetch_merged_prs("owner/repo", since_date, until_date)
         
-        # 期間内のPRのみが含まれることを確認
-        assert len(result) == 1
-        assert result[0]["number"] == 126
+        assert [pr.number for pr in result] == [301, 300]
+        assert result[0] == PRRecord(
+            number=301,
+            title="PR 301",
+            author="developer1",
+            merged_at=datetime(2024, 1, 20, tzinfo=timezone.utc),
+            created_at=datetime(2024, 1, 19, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 20, tzinfo=timezone.utc)
+        )
+        mock_github_instance.search_issues.assert_called_once_with(
+            "repo:owner/repo is:pr is:merged merged:2024-01-01T00:00:00Z..2024-01-31T00:00:00Z",
+            sort="updated",
+            order="desc"
+        )
+        mock_github_instance.get_repo.assert_not_called()
     
     @patch('src.data_layer.github_client.Github')
-    def test_リポジトリが存在しない場合GitHubAPIErrorが発生する(self, mock_github):
-        """異常系: リポジトリが存在しない場合GitHubAPIErrorが発生することを確認"""
-        from github import UnknownObjectException
+    def test_merged_atがない場合はclosed_atを使用し作者不明はghostになる(self, mock_github):
+        """正常系: 検索結果にmerged_atが含まれない場合のフォールバックを確認"""
+        issue = self._make_issue(302, datetime(2024, 1, 10, tzinfo=timezone.utc))
+        issue.pull_request.merged_at = None
+        issue.user = None
         
         mock_github_instance = Mock()
-        mock_github_instance.get_repo.side_effect = UnknownObjectException(404, "Not Found")
+        mock_github_instance.search_issues.return_value = [issue]
         mock_github.return_value = mock_github_instance
         
-        client = GitHubClient("test_token")
+        client = GitHubClient("test_token", use_search=True)
+        result = client.fetch_merged_prs(
+            "owner/repo", datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 31, tzinfo=timezone.utc)
+        )
+        
+        assert result[0].merged_at == datetime(2024, 1, 10, tzinfo=timezone.utc)
+        assert result[0].author == "ghost"
+    
+    @patch('src.data_layer.github_client.Github')
+    def test_検索結果が上限件数を超える場合はPR一覧の走査に切り替える(self, mock_github):
+        """正常系: 検索結果が1000件を超える場合、取りこぼしを避けるためget_pullsで取得することを確認"""
+        from github.PaginatedList import PaginatedList
+        
+        issues = MagicMock(spec=PaginatedList)
+        issues.__iter__.return_value = iter([self._make_issue(303, datetime(2024, 1, 10, tzinfo=timezone.utc))])
+        issues.totalCount = 1500
+        
+        mock_pr = Mock()
+        mock_pr.number = 304
+        mock_pr.title = "Listed PR"
+        mock_pr.user.login = "developer2"
+        mock_pr.merged_at = datetime(2024, 1, 12, tzinfo=timezone.utc)
+        mock_pr.created_at = datetime(2024, 1, 11, tzinfo=timezone.utc)
+        mock_pr.updated_at = datetime(2024, 1, 12, tzinfo=timezone.utc)
+        
+        mock_github_instance = Mock()
+        mock_github_instance.search_issues.return_value = issues
+        mock_github_instance.get_repo.return_value.get_pulls.return_value = [mock_pr]
+        mock_github.return_value = mock_github_instance
+        
+        client = GitHubClient("test_token", use_search=True)
+        result = client.fetch_merged_prs(
+            "owner/repo", datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 31, tzinfo=timezone.utc)
+        )
+        
+        assert [pr.number for pr in result] == [304]
+        mock_github_instance.get_repo.assert_called_once_with("owner/repo")
+    
+    @patch('src.data_layer.github_client.Github')
+    def test_検索できないリポジトリはGitHubAPIErrorになる(self, mock_github):
+        """異常系: 存在しないリポジトリの検索（422）がGitHubAPIErrorに変換されることを確認"""
+        from github import GithubException
+        
+        mock_github_instance = Mock()
+        mock_github_instance.search_issues.side_effect = GithubException(422, "Validation Failed")
+        mock_github.return_value = mock_github_instance
+        
+        client = GitHubClient("test_token", use_search=True)
+        
+        with pytest.raises(GitHubAPIError, match="Repository not found: owner/nonexistent"):
+            client.fetch_merged_prs("owner/nonexistent", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+class TestGraphQLFetch:
+    """GraphQL APIによるマージ済みPR取得のテスト"""
+    
+    @staticmethod
+    def _make_node(number, merged_at, updated_at=None):
+        """GraphQLレスポンスのPRノードを生成"""
+        return {
+            "number": number,
+            "title": f"PR {number}",
+            "author": {"login": f"developer{number % 5}"},
+            "mergedAt": merged_at.isoformat().replace("+00:00", "Z"),
+            "createdAt": merged_at.isoformat().replace("+00:00", "Z"),
+            "updatedAt": (updated_at or merged_at).isoformat().replace("+00:00", "Z")
+        }
+    
+    @staticmethod
+    def _make_response(nodes, has_next_page=False, end_cursor=None):
+        """GraphQLのHTTPレスポンスモックを生成"""
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor},
+                        "nodes": nodes
+                    }
+                }
+            }
+        }
+        return response
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_100件以下のPRは1回のHTTPリクエストで取得される(self, mock_github, mock_post):
+        """正常系: 100件のマージ済みPRが1回のGraphQLリクエストで取得されることを確認"""
+        # 2024-01-30から6時間刻みで更新日時の降順に並んだ100件
+        base = datetime(2024, 1, 30, tzinfo=timezone.utc)
+        nodes = [self._make_node(i, base - timedelta(hours=6 * i)) for i in range(100)]
+        mock_post.return_value = self._make_response(nodes)
+        
+        client = GitHubClient("test_token", use_graphql=True)
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        result = client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        assert len(result) == 100
+        assert mock_post.call_count == 1
+        assert result[0].author == "developer0"
+        
+        args, kwargs = mock_post.call_args
+        assert args[0] == "https://api.github.com/graphql"
+        assert kwargs["headers"]["Authorization"] == "bearer test_token"
+        assert kwargs["json"]["variables"] == {"owner": "owner", "name": "repo", "cursor": None}
+        # REST APIは使用されないことを確認
+        mock_github.return_value.get_repo.assert_not_called()
+    
+    @staticmethod
+    def _make_search_response(nodes, issue_count, has_next_page=False, end_cursor=None):
+        """GraphQLのsearchクエリのHTTPレスポンスモックを生成"""
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "data": {
+                "search": {
+                    "issueCount": issue_count,
+                    "pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor},
+                    "nodes": nodes
+                }
+            }
+        }
+        return response
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_use_search併用時はマージ日時で絞り込んだsearchクエリをカーソルで取得する(self, mock_github, mock_post):
+        """正常系: use_searchと併用した場合、searchクエリで期間内のPRのみをページ送りで取得することを確認"""
+        mock_post.side_effect = [
+            self._make_search_response(
+                [self._make_node(2, datetime(2024, 1, 20, tzinfo=timezone.utc))], 2,
+                has_next_page=True, end_cursor="c1"
+            ),
+            self._make_search_response([self._make_node(1, datetime(2024, 1, 5, tzinfo=timezone.utc))], 2),
+        ]
+        
+        client = GitHubClient("test_token", use_graphql=True, use_search=True)
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
+        
+        result = client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        assert [pr.number for pr in result] == [2, 1]
+        first_variables = mock_post.call_args_list[0].kwargs["json"]["variables"]
+        assert first_variables == {
+            "query": "repo:owner/repo is:pr is:merged "
+                     "merged:2024-01-01T00:00:00Z..2024-01-31T00:00:00Z sort:updated-desc",
+            "cursor": None
+        }
+        assert mock_post.call_args_list[1].kwargs["json"]["variables"]["cursor"] == "c1"
+        mock_github.return_value.search_issues.assert_not_called()
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_検索結果が上限件数を超える場合はpullRequestsの走査に切り替える(self, mock_github, mock_post):
+        """正常系: 検索結果が1000件を超える場合、取りこぼしを避けるためpullRequestsクエリで取得することを確認"""
+        node = self._make_node(3, datetime(2024, 1, 10, tzinfo=timezone.utc))
+        mock_post.side_effect = [
+            self._make_search_response([node], 1500, has_next_page=True, end_cursor="c1"),
+            self._make_response([node]),
+        ]
+        
+        client = GitHubClient("test_token", use_graphql=True, use_search=True)
+        result = client.fetch_merged_prs(
+            "owner/repo", datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 31, tzinfo=timezone.utc)
+        )
+        
+        assert [pr.number for pr in result] == [3]
+        assert mock_post.call_args_list[1].kwargs["json"]["variables"] == {
+            "owner": "owner", "name": "repo", "cursor": None
+        }
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_次ページはカーソルで取得しsince以前で打ち切る(self, mock_github, mock_post):
+        """正常系: endCursorで次ページを取得し、since以前に更新されたPRで打ち切ることを確認"""
+        page1 = self._make_response(
+            [self._make_node(2, datetime(2024, 1, 20, tzinfo=timezone.utc))],
+            has_next_page=True, end_cursor="CURSOR1"
+        )
+        page2 = self._make_response(
+            [
+                self._make_node(1, datetime(2024, 1, 10, tzinfo=timezone.utc)),
+                self._make_node(0, datetime(2023, 12, 1, tzinfo=timezone.utc))
+            ],
+            has_next_page=True, end_cursor="CURSOR2"
+        )
+        mock_post.side_effect = [page1, page2]
+        
+        client = GitHubClient("test_token", use_graphql=True)
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
         
+        result = client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        assert [pr.number for pr in result] == [2, 1]
+        assert mock_post.call_count == 2
+        assert mock_post.call_args_list[1].kwargs["json"]["variables"]["cursor"] == "CURSOR1"
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_末尾Zの日時文字列がUTCとして解釈される(self, mock_github, mock_post):
+        """正常系: GitHubが返す末尾Z形式の日時がUTCのdatetimeに変換されることを確認"""
+        node = {
+            "number": 1,
+            "title": "PR 1",
+            "author": None,
+            "mergedAt": "2024-01-15T10:30:00Z",
+            "createdAt": "2024-01-10T09:00:00Z",
+            "updatedAt": "2024-01-15T10:30:00Z"
+        }
+        mock_post.return_value = self._make_response([node])
+        
+        client = GitHubClient("test_token", use_graphql=True)
+        result = client.fetch_merged_prs(
+            "owner/repo",
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 31, tzinfo=timezone.utc)
+        )
+        
+        assert result[0].merged_at == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert result[0].created_at == datetime(2024, 1, 10, 9, 0, tzinfo=timezone.utc)
+        assert result[0].author == "ghost"
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_不正な日時文字列はGitHubAPIErrorに変換される(self, mock_github, mock_post):
+        """異常系: 解釈できない日時を含むレスポンスがGitHubAPIErrorに変換されることを確認"""
+        node = self._make_node(1, datetime(2024, 1, 15, tzinfo=timezone.utc))
+        node["updatedAt"] = "not-a-date"
+        mock_post.return_value = self._make_response([node])
+        
+        client = GitHubClient("test_token", use_graphql=True)
+        
+        with pytest.raises(GitHubAPIError, match="Unexpected GraphQL response"):
+            client.fetch_merged_prs("owner/repo", datetime(2024, 1, 1, tzinfo=timezone.utc))
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_進捗表示付き取得もGraphQLを使用する(self, mock_github, mock_post):
+        """正常系: use_graphql=Trueの場合fetch_merged_prs_with_progressもGraphQLで取得することを確認"""
+        mock_post.return_value = self._make_response(
+            [self._make_node(1, datetime(2024, 1, 15, tzinfo=timezone.utc))]
+        )
+        
+        client = GitHubClient("test_token", use_graphql=True)
+        
+        with patch('src.data_layer.github_client.tqdm') as mock_tqdm:
+            result = client.fetch_merged_prs_with_progress(
+                "owner/repo",
+                datetime(2024, 1, 1, tzinfo=timezone.utc),
+                datetime(2024, 1, 31, tzinfo=timezone.utc)
+            )
+        
+        assert [pr.number for pr in result] == [1]
+        assert mock_post.call_count == 1
+        mock_github.return_value.get_repo.assert_not_called()
+        mock_tqdm.return_value.__enter__.return_value.update.assert_called_once_with(1)
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_リポジトリが存在しない場合GitHubAPIErrorが発生する(self, mock_github, mock_post):
+        """異常系: GraphQLのNOT_FOUNDエラーがGitHubAPIErrorに変換されることを確認"""
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "data": {"repository": None},
+            "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to a Repository"}]
+        }
+        mock_post.return_value = response
+        
+        client = GitHubClient("test_token", use_graphql=True)
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
         with pytest.raises(GitHubAPIError, match="Repository not found"):
-            client.fetch_merged_prs("owner/nonexistent", since_date, until_date)
+            client.fetch_merged_prs("owner/nonexistent", since_date)
+    
+    @patch('src.data_layer.github_client.requests.post')
+    @patch('src.data_layer.github_client.Github')
+    def test_レート制限時にRateLimitErrorが発生する(self, mock_github, mock_post):
+        """異常系: GraphQLのレート制限レスポンスがRateLimitErrorに変換されることを確認"""
+        response = Mock()
+        response.status_code = 403
+        response.headers = {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "1704110400"}
+        mock_post.return_value = response
+        
+        client = GitHubClient("test_token", use_graphql=True)
+        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            client.fetch_merged_prs("owner/repo", since_date)
+        
+        assert exc_info.value.reset_time == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        assert exc_info.value.remaining == 0
 
 
 class TestRateLimitHandling:
     """レート制限処理のテスト"""
     
-    @patch('src.data_layer.github_client.Github')
-    def test_get_rate_limit_statusが正常に動作する(self, mock_github):
+    def test_get_rate_limit_statusが正常に動作する(self, gh_mock):
         """正常系: レート制限状態が正常に取得されることを確認"""
         mock_rate_limit = Mock()
         mock_rate_limit.core.limit = 5000
         mock_rate_limit.core.remaining = 4500
         mock_rate_limit.core.reset = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_rate_limit.return_value = mock_rate_limit
-        mock_github.return_value = mock_github_instance
+        gh_mock.instance.get_rate_limit.return_value = mock_rate_limit
         
-        client = GitHubClient("test_token")
-        result = client.get_rate_limit_status()
+        result = gh_mock.client.get_rate_limit_status()
         
-        expected = {
-            "limit": 5000,
-            "remaining": 4500,
-            "reset": datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
-        }
-        assert result == expected
-        mock_github_instance.get_rate_limit.assert_called_once()
+        assert result == RateLimit(5000, 4500, datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc))
+        assert result.remaining == 4500
+        gh_mock.instance.get_rate_limit.assert_called_once()
     
-    @patch('src.data_layer.github_client.Github')
-    def test_レート制限に達した場合RateLimitErrorが発生する(self, mock_github):
+    def test_レート制限に達した場合RateLimitErrorが発生する(self, gh_mock):
         """異常系: レート制限に達した場合RateLimitErrorが発生することを確認"""
-        from github import RateLimitExceededException
+        gh_mock.instance.get_repo.side_effect = RateLimitExceededException(403, "Rate limit exceeded")
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.side_effect = RateLimitExceededException(
-            403, "Rate limit exceeded"
-        )
-        mock_github.return_value = mock_github_instance
-        
-        client = GitHubClient("test_token")
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
         
-        with pytest.raises(RateLimitError, match="Rate limit exceeded"):
-            client.fetch_merged_prs("owner/repo", since_date, until_date)
+        with patch.object(gh_mock.client, 'wait_for_rate_limit_reset'):
+            with pytest.raises(RateLimitError, match="Rate limit exceeded"):
+                gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
     
-    @patch('src.data_layer.github_client.Github')
-    def test_レート制限取得でエラーが発生した場合GitHubAPIErrorになる(self, mock_github):
+    def test_レート制限取得でエラーが発生した場合GitHubAPIErrorになる(self, gh_mock):
         """異常系: レート制限取得エラー時にGitHubAPIErrorが発生することを確認"""
         from github import GithubException
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_rate_limit.side_effect = GithubException(500, "Server Error")
-        mock_github.return_value = mock_github_instance
-        
-        client = GitHubClient("test_token")
+        gh_mock.instance.get_rate_limit.side_effect = GithubException(500, "Server Error")
         
         with pytest.raises(GitHubAPIError, match="Failed to get rate limit status"):
-            client.get_rate_limit_status()
+            gh_mock.client.get_rate_limit_status()
 
 
 class TestGitHubClientErrorHandling:
     """GitHubClientのエラーハンドリングテスト"""
     
-    @patch('src.data_layer.github_client.Github')
-    def test_一般的なGitHub例外はGitHubAPIErrorに変換される(self, mock_github):
+    def test_一般的なGitHub例外はGitHubAPIErrorに変換される(self, gh_mock):
         """異常系: 一般的なGitHub例外がGitHubAPIErrorに変換されることを確認"""
         from github import GithubException
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.side_effect = GithubException(500, "Internal Server Error")
-        mock_github.return_value = mock_github_instance
+        gh_mock.instance.get_repo.side_effect = GithubException(500, "Internal Server Error")
         
-        client = GitHubClient("test_token")
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
         
         with pytest.raises(GitHubAPIError, match="GitHub API error"):
-            client.fetch_merged_prs("owner/repo", since_date, until_date)
+            gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
     
-    @patch('src.data_layer.github_client.Github')
-    def test_ネットワークエラーはGitHubAPIErrorに変換される(self, mock_github):
+    def test_ネットワークエラーはGitHubAPIErrorに変換される(self, gh_mock):
         """異常系: ネットワークエラーがGitHubAPIErrorに変換されることを確認"""
-        import requests
+        gh_mock.instance.get_repo.side_effect = requests.RequestException("Connection failed")
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.side_effect = requests.RequestException("Connection failed")
-        mock_github.return_value = mock_github_instance
-        
-        client = GitHubClient("test_token")
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         until_date = datetime(2024, 1, 31, tzinfo=timezone.utc)
         
         with pytest.raises(GitHubAPIError, match="Network error"):
-            client.fetch_merged_prs("owner/repo", since_date, until_date)
+            gh_mock.client.fetch_merged_prs("owner/repo", since_date, until_date)
+        
+        # 指数バックオフで3回リトライした後に変換されることを確認
+        assert gh_mock.client._sleep.call_args_list == [mock.call(1), mock.call(2), mock.call(4)]
 
 
 class TestGitHubClientIntegration:
@@ -407,8 +1150,8 @@ class TestGitHubClientIntegration:
         assert prs[0]["number"] == 100
         assert prs[0]["title"] == "Integration Test PR"
         
-        assert rate_status["limit"] == 5000
-        assert rate_status["remaining"] == 4999
+        assert rate_status.limit == 5000
+        assert rate_status.remaining == 4999
         
         # 全ての必要なメソッドが呼ばれたことを確認
         mock_github_instance.get_repo.assert_called_once_with("test/repo")
@@ -428,8 +1171,7 @@ class TestRateLimitWaiting:
         assert callable(getattr(client, 'wait_for_rate_limit_reset'))
     
     @patch('src.data_layer.github_client.Github')
-    @patch('src.data_layer.github_client.time.sleep')
-    def test_レート制限リセットまで適切に待機する(self, mock_sleep, mock_github):
+    def test_レート制限リセットまで適切に待機する(self, mock_github):
         """正常系: レート制限がリセットされるまで適切に待機することを確認"""
         # 現在時刻とリセット時刻のモック
         reset_time = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
@@ -443,20 +1185,44 @@ class TestRateLimitWaiting:
         mock_github_instance.get_rate_limit.return_value = mock_rate_limit
         mock_github.return_value = mock_github_instance
         
-        with patch('src.data_layer.github_client.datetime') as mock_datetime:
-            mock_datetime.now.return_value = current_time
-            mock_datetime.timezone = timezone
-            
-            client = GitHubClient("test_token")
+        recorded = []
+        client = GitHubClient("test_token", clock=lambda: current_time, sleeper=recorded.append)
+        
+        with patch('src.data_layer.github_client.tqdm') as mock_tqdm:
             client.wait_for_rate_limit_reset()
-            
-            # 30分 + バッファ（60秒）待機することを確認
-            expected_sleep_time = 30 * 60 + 60  # 1860秒
-            mock_sleep.assert_called_once_with(expected_sleep_time)
+        
+        # 30分 + バッファ（60秒）を進捗表示しながら1秒ずつ待機することを確認
+        expected_sleep_time = 30 * 60 + 60  # 1860秒
+        assert sum(recorded) == expected_sleep_time
+        assert set(recorded) == {1}
+        mock_tqdm.assert_called_once()
+    
+    @patch('src.data_layer.github_client.Github')
+    def test_短い待機は進捗表示なしで一度に待機する(self, mock_github):
+        """正常系: 5分以下の待機は進捗表示なしで一度に待機することを確認"""
+        reset_time = datetime(2024, 1, 1, 12, 2, tzinfo=timezone.utc)
+        current_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)  # 2分前
+        
+        mock_rate_limit = Mock()
+        mock_rate_limit.core.reset = reset_time
+        mock_rate_limit.core.remaining = 0
+        
+        mock_github_instance = Mock()
+        mock_github_instance.get_rate_limit.return_value = mock_rate_limit
+        mock_github.return_value = mock_github_instance
+        
+        recorded = []
+        client = GitHubClient("test_token", clock=lambda: current_time, sleeper=recorded.append)
+        
+        with patch('src.data_layer.github_client.tqdm') as mock_tqdm:
+            client.wait_for_rate_limit_reset()
+        
+        # 2分 + バッファ（60秒）
+        assert recorded == [180]
+        mock_tqdm.assert_not_called()
     
     @patch('src.data_layer.github_client.Github')
-    @patch('src.data_layer.github_client.time.sleep')
-    def test_リセット時刻が過去の場合は待機しない(self, mock_sleep, mock_github):
+    def test_リセット時刻が過去の場合は待機しない(self, mock_github):
         """正常系: リセット時刻が既に過去の場合は待機しないことを確認"""
         reset_time = datetime(2024, 1, 1, 11, 30, tzinfo=timezone.utc)  # 過去
         current_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)  # 現在
@@ -468,15 +1234,62 @@ class TestRateLimitWaiting:
         mock_github_instance.get_rate_limit.return_value = mock_rate_limit
         mock_github.return_value = mock_github_instance
         
-        with patch('src.data_layer.github_client.datetime') as mock_datetime:
-            mock_datetime.now.return_value = current_time
-            mock_datetime.timezone = timezone
-            
-            client = GitHubClient("test_token")
-            client.wait_for_rate_limit_reset()
+        recorded = []
+        client = GitHubClient("test_token", clock=lambda: current_time, sleeper=recorded.append)
+        client.wait_for_rate_limit_reset()
+        
+        # sleepが呼ばれないことを確認
+        assert recorded == []
+    
+    @patch('src.data_layer.github_client.Github')
+    def test_複数スレッドの同時待機は1回にまとめられる(self, mock_github):
+        """正常系: 待機中に別スレッドが到着しても、レート制限の確認と待機は1回だけ行われることを確認"""
+        mock_rate_limit = Mock()
+        mock_rate_limit.core.reset = datetime(2024, 1, 1, 12, 2, tzinfo=timezone.utc)
+        mock_github_instance = Mock()
+        mock_github_instance.get_rate_limit.return_value = mock_rate_limit
+        mock_github.return_value = mock_github_instance
+        
+        sleeping = threading.Event()
+        release = threading.Event()
+        recorded = []
+        
+        def sleeper(seconds):
+            recorded.append(seconds)
+            sleeping.set()
+            release.wait(5)
+        
+        client = GitHubClient(
+            "test_token", clock=lambda: datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc), sleeper=sleeper
+        )
+        
+        # ロック取得を試みたスレッド数を数えるラッパー
+        entered = threading.Semaphore(0)
+        real_lock = client._rate_limit_wait_lock
+        
+        class SignallingLock:
+            def __enter__(self):
+                entered.release()
+                return real_lock.__enter__()
             
-            # sleepが呼ばれないことを確認
-            mock_sleep.assert_not_called()
+            def __exit__(self, *exc_info):
+                return real_lock.__exit__(*exc_info)
+        
+        client._rate_limit_wait_lock = SignallingLock()
+        
+        first = threading.Thread(target=client.wait_for_rate_limit_reset)
+        first.start()
+        assert sleeping.wait(5)
+        second = threading.Thread(target=client.wait_for_rate_limit_reset)
+        second.start()
+        # 2スレッド目が世代番号を読み取りロック待ちに入ってから1スレッド目の待機を終える
+        assert entered.acquire(timeout=5) and entered.acquire(timeout=5)
+        release.set()
+        first.join(5)
+        second.join(5)
+        
+        assert recorded == [180]
+        mock_github_instance.get_rate_limit.assert_called_once()
 
 
 class TestRetryDecorator:
@@ -489,87 +1302,140 @@ class TestRetryDecorator:
         
         assert callable(retry_on_rate_limit)
     
-    @patch('src.data_layer.github_client.Github') 
-    @patch('src.data_layer.github_client.time.sleep')
-    def test_レート制限エラー時に自動リトライする(self, mock_sleep, mock_github):
-        """正常系: レート制限エラー時に自動でリトライすることを確認"""
-        from github import RateLimitExceededException
+    @staticmethod
+    def _run_retry_scenario(gh_mock, exc_seq):
+        """get_repoが順にexc_seqの例外を送出した後に成功する状況でPRを取得"""
+        gh_mock.repo.get_pulls.return_value = [_pr_stub(
+            1, datetime(2024, 1, 15, tzinfo=timezone.utc), datetime(2024, 1, 10, tzinfo=timezone.utc),
+            title="Retry PR", login="retryuser"
+        )]
+        
+        # レート制限情報のモック（リセット待機後は残数が回復している）
+        gh_mock.instance.get_rate_limit.return_value.core.limit = 5000
+        gh_mock.instance.get_rate_limit.return_value.core.remaining = 5000
+        gh_mock.instance.get_repo.side_effect = [*exc_seq, gh_mock.repo]
+        
+        return gh_mock.client.fetch_merged_prs("owner/repo", datetime(2024, 1, 1, tzinfo=timezone.utc))
+    
+    @pytest.mark.parametrize("exc_seq,expected_sleeps,expected_waits", [
+        # レート制限（リセット時刻ヘッダーなし）はリセット待機後にリトライ
+        ([RateLimitExceededException(403, "Rate limit exceeded")], [], 1),
+        # ネットワークエラーは指数バックオフ（1秒、2秒）でリトライ
+        ([requests.RequestException("Connection failed"), requests.RequestException("Timeout")], [1, 2], 0),
+        ([requests.RequestException("Connection failed")], [1], 0),
+    ], ids=["rate_limit", "network_twice", "network_once"])
+    def test_一時的なエラー時にリトライして成功する(self, gh_mock, exc_seq, expected_sleeps, expected_waits):
+        """正常系: レート制限・ネットワークエラーの後にリトライして最終的に成功することを確認"""
+        client = gh_mock.client
+        with patch.object(client, 'wait_for_rate_limit_reset') as mock_wait:
+            result = self._run_retry_scenario(gh_mock, exc_seq)
         
-        # 1回目はレート制限エラー、2回目は成功のモック
-        mock_repo = Mock()
-        mock_pr = Mock()
-        mock_pr.number = 1
-        mock_pr.title = "Test PR"
-        mock_pr.user.login = "testuser"
-        mock_pr.merged_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
-        mock_pr.created_at = datetime(2024, 1, 10, tzinfo=timezone.utc)
-        mock_pr.updated_at = datetime(2024, 1, 15, tzinfo=timezone.utc)
-        
-        # レート制限情報のモック
-        mock_rate_limit = Mock()
-        mock_rate_limit.core.reset = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
-        mock_rate_limit.core.remaining = 0
+        assert [pr.number for pr in result] == [1]
+        assert client._sleep.call_args_list == [mock.call(s) for s in expected_sleeps]
+        assert mock_wait.call_count == expected_waits
+        assert client._github.get_repo.call_count == len(exc_seq) + 1
+
+
+class TestRateLimitPolicy:
+    """tenacityによるリトライポリシーのテスト"""
+    
+    NOW = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    RESET = datetime(2024, 1, 1, 12, 10, tzinfo=timezone.utc)
+    
+    @staticmethod
+    def _rate_limit_exception(headers=None):
+        """レート制限例外を生成"""
+        from github import RateLimitExceededException
+        return RateLimitExceededException(403, "Rate limit exceeded", headers)
+    
+    @pytest.fixture
+    def create_client(self, github_factory):
+        """get_repoの挙動（"ok"はリポジトリを返す）とコンストラクタ引数を指定し、十分なレート制限残数のクライアントを生成する関数"""
+        def create(get_repo_side_effect, **client_kwargs):
+            gh = github_factory(**client_kwargs)
+            gh.instance.get_repo.side_effect = [gh.repo if item == "ok" else item for item in get_repo_side_effect]
+            core = gh.instance.get_rate_limit.return_value.core
+            core.limit = 5000
+            core.remaining = 5000
+            core.reset = datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)
+            return gh
+        return create
+    
+    def test_ヘッダーのリセット時刻まで待機してリトライする(self, create_client):
+        """正常系: x-ratelimit-resetヘッダーから待機時間を算出し追加リクエストなしで待機することを確認"""
+        headers = {"x-ratelimit-reset": str(int(self.RESET.timestamp())), "x-ratelimit-remaining": "0"}
+        recorded = []
+        gh = create_client(
+            [self._rate_limit_exception(headers), "ok"], clock=lambda: self.NOW, sleeper=recorded.append
+        )
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.side_effect = [
-            RateLimitExceededException(403, "Rate limit exceeded"),  # 1回目は失敗
-            mock_repo  # 2回目は成功
-        ]
-        mock_github_instance.get_rate_limit.return_value = mock_rate_limit
-        mock_repo.get_pulls.return_value = [mock_pr]
-        mock_github.return_value = mock_github_instance
+        with patch.object(gh.client, 'wait_for_rate_limit_reset') as mock_wait:
+            gh.client.fetch_merged_prs("owner/repo", datetime(2023, 12, 1, tzinfo=timezone.utc))
         
-        client = GitHubClient("test_token")
-        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        # 10分 + バッファ（60秒）待機し、get_rate_limitによる待機は行わない
+        assert recorded == [660]
+        mock_wait.assert_not_called()
+        assert gh.instance.get_repo.call_count == 2
+    
+    def test_リトライ統計がクライアントに記録される(self, create_client):
+        """正常系: 直近の呼び出しのtenacity統計がクライアントから参照できることを確認"""
+        gh = create_client([requests.ConnectionError("reset"), "ok"], clock=lambda: self.NOW, sleeper=Mock())
+        assert gh.client.last_retry_statistics == {}
         
-        # wait_for_rate_limit_resetメソッドをモック
-        with patch.object(client, 'wait_for_rate_limit_reset') as mock_wait:
-            result = client.fetch_merged_prs("owner/repo", since_date)
+        gh.client.fetch_merged_prs("owner/repo", datetime(2023, 12, 1, tzinfo=timezone.utc))
         
-        # リトライが発生し、wait_for_rate_limit_resetが呼ばれることを確認
-        assert len(result) == 1
-        assert result[0]["number"] == 1
-        mock_wait.assert_called_once()
-        assert mock_github_instance.get_repo.call_count == 2
+        assert gh.client.last_retry_statistics["attempt_number"] == 2
+        assert gh.client.last_retry_statistics["idle_for"] == 1
     
-    @patch('src.data_layer.github_client.Github')
-    @patch('src.data_layer.github_client.time.sleep')
-    def test_ネットワークエラー時に指数バックオフでリトライする(self, mock_sleep, mock_github):
-        """正常系: ネットワークエラー時に指数バックオフでリトライすることを確認"""
-        import requests
+    def test_リトライ上限でヘッダーのリセット時刻を持つRateLimitErrorになる(self, create_client):
+        """異常系: リトライ上限に達するとヘッダーのリセット時刻を持つRateLimitErrorになることを確認"""
+        headers = {"x-ratelimit-reset": str(int(self.RESET.timestamp()))}
+        recorded = []
+        gh = create_client(
+            [self._rate_limit_exception(headers) for _ in range(4)], clock=lambda: self.NOW, sleeper=recorded.append
+        )
         
-        # 2回失敗、3回目で成功
-        mock_repo = Mock()
-        mock_pr = Mock()
-        mock_pr.number = 2
-        mock_pr.title = "Network Test PR"
-        mock_pr.user.login = "networkuser"
-        mock_pr.merged_at = datetime(2024, 1, 16, tzinfo=timezone.utc)
-        mock_pr.created_at = datetime(2024, 1, 11, tzinfo=timezone.utc)
-        mock_pr.updated_at = datetime(2024, 1, 16, tzinfo=timezone.utc)
+        with pytest.raises(RateLimitError) as exc_info:
+            gh.client.fetch_merged_prs("owner/repo", datetime(2023, 12, 1, tzinfo=timezone.utc))
         
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.side_effect = [
-            requests.RequestException("Connection failed"),  # 1回目失敗
-            requests.RequestException("Timeout"),            # 2回目失敗
-            mock_repo                                         # 3回目成功
-        ]
-        mock_repo.get_pulls.return_value = [mock_pr]
-        mock_github.return_value = mock_github_instance
-        
-        client = GitHubClient("test_token")
-        since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert exc_info.value.reset_time == self.RESET
+        assert exc_info.value.remaining == 0
+        assert recorded == [660, 660, 660]
+        gh.instance.get_rate_limit.assert_not_called()
+    
+    def test_ヘッダーがない場合はget_rate_limitからリセット時刻を取得する(self, create_client):
+        """異常系: ヘッダーがない場合のみget_rate_limitの実際の状態でRateLimitErrorを生成することを確認"""
+        gh = create_client(
+            [self._rate_limit_exception() for _ in range(4)], clock=lambda: self.NOW, sleeper=Mock()
+        )
+        gh.instance.get_rate_limit.return_value.core.remaining = 0
         
-        result = client.fetch_merged_prs("owner/repo", since_date)
+        with patch.object(gh.client, 'wait_for_rate_limit_reset') as mock_wait:
+            with pytest.raises(RateLimitError) as exc_info:
+                gh.client.fetch_merged_prs("owner/repo", datetime(2023, 12, 1, tzinfo=timezone.utc))
         
-        # 指数バックオフで待機することを確認 (1秒、2秒)
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_any_call(1)  # 1回目のリトライ前
-        mock_sleep.assert_any_call(2)  # 2回目のリトライ前
+        assert mock_wait.call_count == 3
+        assert exc_info.value.reset_time == datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)
+        assert exc_info.value.remaining == 0
+    
+    def test_リトライ中の入れ子呼び出しはリトライしない(self, github_factory):
+        """正常系: fetch中のレート制限確認はリトライせず外側のリトライに任せることを確認"""
+        recorded = []
+        gh = github_factory([
+            _pr_stub(1, datetime(2024, 1, 15, tzinfo=timezone.utc), datetime(2024, 1, 10, tzinfo=timezone.utc))
+        ], sleeper=recorded.append)
+        gh.instance.get_rate_limit.side_effect = requests.ConnectionError("reset")
+        
+        result = gh.client.fetch_merged_prs(
+            "owner/repo",
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 31, tzinfo=timezone.utc)
+        )
         
-        # 最終的に成功することを確認
+        # 入れ子のget_rate_limit_statusは1回だけ呼ばれ、バックオフ待機も発生しない
         assert len(result) == 1
-        assert result[0]["number"] == 2
+        assert gh.instance.get_rate_limit.call_count == 1
+        assert recorded == []
 
 
 class TestProgressDisplay:
@@ -623,8 +1489,7 @@ class TestEnhancedLogging:
     """拡張ログ機能のテスト"""
     
     @patch('src.data_layer.github_client.Github')
-    @patch('src.data_layer.github_client.logger')
-    def test_レート制限検知時にログが出力される(self, mock_logger, mock_github):
+    def test_レート制限検知時にログが出力される(self, mock_github, github_client_logger):
         """正常系: レート制限検知時に適切なログが出力されることを確認"""
         mock_rate_limit = Mock()
         mock_rate_limit.core.remaining = 50  # しきい値(100)より少ない
@@ -642,15 +1507,13 @@ class TestEnhancedLogging:
         assert result is False
         
         # ログが出力されることを確認
-        mock_logger.warning.assert_called()
-        warning_call_args = mock_logger.warning.call_args[0][0]
+        github_client_logger.warning.assert_called()
+        warning_call_args = github_client_logger.warning.call_args[0][0]
         assert "Rate limit approaching threshold" in warning_call_args
         assert "50/5000" in warning_call_args
     
     @patch('src.data_layer.github_client.Github') 
-    @patch('src.data_layer.github_client.logger')
-    @patch('src.data_layer.github_client.time.sleep')
-    def test_リトライ時にログが出力される(self, mock_sleep, mock_logger, mock_github):
+    def test_リトライ時にログが出力される(self, mock_github, github_client_logger):
         """正常系: リトライ時に適切なログが出力されることを確認"""
         import requests
         
@@ -664,13 +1527,13 @@ class TestEnhancedLogging:
         ]
         mock_github.return_value = mock_github_instance
         
-        client = GitHubClient("test_token")
+        client = GitHubClient("test_token", sleeper=Mock())
         since_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         
         client.fetch_merged_prs("owner/repo", since_date)
         
         # リトライのログが出力されることを確認
-        mock_logger.info.assert_any_call(
+        github_client_logger.info.assert_any_call(
             mock.ANY  # リトライメッセージを含む任意の文字列
         )
 
@@ -2,23 +2,57 @@
 import pytest
 import os
 import logging
-import tempfile
-from pathlib import Path
+import mmap
+import re
+from contextlib import contextmanager
 from unittest.mock import patch, Mock
 from typing import Dict, Any
 
-from src.business_layer.logging_config import LoggingConfig, setup_logging
+from src.business_layer.logging_config import LoggingConfig, setup_logging, shutdown_logging
+
+# ログファイル中のレベル別テストメッセージを1回の走査で抽出する
+_LEVEL_MESSAGE_RE = re.compile('(DEBUG|INFO|WARNING|ERROR)メッセージ'.encode('utf-8'))
+
+
+@contextmanager
+def _mapped_log(path):
+    """ログファイルを読み込まずにメモリマップして返す（空ファイルは空のbytes）"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _log_contains(path, *needles):
+    """ログファイルにすべての文字列が含まれるかをメモリマップ上で検索する
+
+    mmapの``in``はバイト列の部分一致を判定しないため、findで検索する。
+    """
+    with _mapped_log(path) as content:
+        return all(content.find(needle.encode('utf-8')) != -1 for needle in needles)
+
+
+@pytest.fixture
+def temp_log_dir(tmp_path_factory):
+    """一時ログディレクトリのフィクスチャ（セッション共通の一時領域にテストごとに作成）"""
+    return tmp_path_factory.mktemp("logs")
+
+
+@pytest.fixture
+def null_file_handler():
+    """ファイル内容を検証しないテスト用に、ログファイルへの書き込みをNullHandlerに置き換える"""
+    with patch(
+        'src.business_layer.logging_config.logging.handlers.RotatingFileHandler',
+        side_effect=lambda *args, **kwargs: logging.NullHandler()
+    ) as mock_handler:
+        yield mock_handler
 
 
 class TestLoggingConfig:
     """ログ設定クラスのテスト"""
     
-    @pytest.fixture
-    def temp_log_dir(self):
-        """一時ログディレクトリのフィクスチャ"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
     @pytest.fixture
     def basic_config(self, temp_log_dir):
         """基本的なログ設定のフィクスチャ"""
@@ -73,6 +107,12 @@ class TestLoggingConfig:
         config = LoggingConfig({'level': 'INVALID_LEVEL'})
         assert config.get_log_level() == logging.INFO
     
+    def test_ログレベルの別名と小文字が変換されloggingの属性名は無視される(self):
+        """正常系: WARNなどの別名や小文字を変換し、レベル以外のlogging属性名はデフォルトになることを確認"""
+        assert LoggingConfig({'level': 'warn'}).get_log_level() == logging.WARNING
+        assert LoggingConfig({'level': 'Fatal'}).get_log_level() == logging.CRITICAL
+        assert LoggingConfig({'level': 'disable'}).get_log_level() == logging.INFO
+    
     def test_ファイルサイズの解析が正常に動作する(self):
         """正常系: ファイルサイズ文字列が正しくバイト数に変換されることを確認"""
         test_cases = [
@@ -90,17 +130,27 @@ class TestLoggingConfig:
         """異常系: 無効なファイルサイズではデフォルト値が適用されることを確認"""
         config = LoggingConfig({'max_file_size': 'INVALID_SIZE'})
         assert config.get_max_bytes() == 10 * 1024 * 1024  # 10MBデフォルト
+    
+    def test_同じファイルサイズ文字列の解析結果はキャッシュされる(self):
+        """正常系: 同じサイズ文字列を繰り返し解析しても正規表現の評価は1回のみであることを確認"""
+        from src.business_layer.logging_config import _parse_size
+        
+        _parse_size.cache_clear()
+        for _ in range(3):
+            assert LoggingConfig({'max_file_size': '3MB'}).get_max_bytes() == 3 * 1024 * 1024
+        
+        info = _parse_size.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+    
+    def test_文字列以外のファイルサイズでデフォルトが適用される(self):
+        """異常系: 数値など文字列以外のサイズ指定ではデフォルト値が適用されることを確認"""
+        assert LoggingConfig({'max_file_size': 1024}).get_max_bytes() == 10 * 1024 * 1024
+        assert LoggingConfig({'max_file_size': ['1MB']}).get_max_bytes() == 10 * 1024 * 1024
 
 
 class TestLoggingSetup:
     """ログセットアップ関数のテスト"""
     
-    @pytest.fixture
-    def temp_log_dir(self):
-        """一時ログディレクトリのフィクスチャ"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
     @pytest.fixture
     def config_with_logging(self, temp_log_dir):
         """ログ設定を含む設定のフィクスチャ"""
@@ -114,7 +164,7 @@ class TestLoggingSetup:
             }
         }
     
-    def test_setup_loggingが正常に実行される(self, config_with_logging, temp_log_dir):
+    def test_setup_loggingが正常に実行される(self, config_with_logging, temp_log_dir, null_file_handler):
         """正常系: setup_logging関数が正常に実行されることを確認"""
         # ログディレクトリが存在しない状態で開始
         assert not (temp_log_dir / 'app.log').exists()
@@ -137,16 +187,28 @@ class TestLoggingSetup:
         test_logger = logging.getLogger('test_file_output')
         test_logger.info('テストメッセージ')
         
+        shutdown_logging()  # キュー内のログをファイルへ書き出す
+        
         # ログファイルが作成され、内容が書き込まれることを確認
         log_file_path = temp_log_dir / 'app.log'
         assert log_file_path.exists()
         
         # ログファイルの内容を確認
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-            assert 'test_file_output' in log_content
-            assert 'INFO' in log_content
-            assert 'テストメッセージ' in log_content
+        assert _log_contains(log_file_path, 'test_file_output', 'INFO', 'テストメッセージ')
+    
+    def test_ログファイルは最初のログ出力まで作成されない(self, temp_log_dir):
+        """正常系: setup_loggingだけではログファイルを開かず、最初の出力時に作成されることを確認"""
+        log_file_path = temp_log_dir / 'delayed.log'
+        # WARNINGレベルではsetup_logging自身のINFOログが出力されないため、ファイルは作成されない
+        setup_logging({'logging': {'level': 'WARNING', 'file': str(log_file_path)}})
+        shutdown_logging()  # リスナーがキューを処理し終えた状態で確認する
+        assert not log_file_path.exists()
+        
+        setup_logging({'logging': {'level': 'WARNING', 'file': str(log_file_path)}})
+        logging.getLogger('test_delayed_open').warning('最初のメッセージ')
+        shutdown_logging()  # キュー内のログをファイルへ書き出す
+        
+        assert _log_contains(log_file_path, '最初のメッセージ')
     
     def test_ログレベルフィルタリングが動作する(self, temp_log_dir):
         """正常系: ログレベルフィルタリングが正しく動作することを確認"""
@@ -166,16 +228,14 @@ class TestLoggingSetup:
         test_logger.warning('WARNINGメッセージ（出力される）')
         test_logger.error('ERRORメッセージ（出力される）')
         
+        shutdown_logging()  # キュー内のログをファイルへ書き出す
+        
         # ログファイルの内容を確認
         log_file_path = temp_log_dir / 'warning_test.log'
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-            assert 'DEBUGメッセージ' not in log_content
-            assert 'INFOメッセージ' not in log_content
-            assert 'WARNINGメッセージ' in log_content
-            assert 'ERRORメッセージ' in log_content
+        with _mapped_log(log_file_path) as log_content:
+            assert _LEVEL_MESSAGE_RE.findall(log_content) == [b'WARNING', b'ERROR']
     
-    def test_ログ設定がない場合デフォルト設定が適用される(self):
+    def test_ログ設定がない場合デフォルト設定が適用される(self, null_file_handler):
         """正常系: ログ設定がない場合にデフォルト設定が適用されることを確認"""
         config_without_logging = {}
         
@@ -187,7 +247,7 @@ class TestLoggingSetup:
         assert test_logger.level <= logging.INFO
     
     @patch('src.business_layer.logging_config.logging.getLogger')
-    def test_既存のログ設定がリセットされる(self, mock_get_logger, config_with_logging):
+    def test_既存のログ設定がリセットされる(self, mock_get_logger, config_with_logging, null_file_handler):
         """正常系: setup_loggingが既存のログ設定をリセットすることを確認"""
         mock_logger = Mock()
         mock_get_logger.return_value = mock_logger
@@ -196,17 +256,40 @@ class TestLoggingSetup:
         
         # ハンドラーがクリアされることを確認
         mock_logger.handlers.clear.assert_called()
+        
+        # 再設定時には既存のファイル出力リスナーが停止されることを確認
+        from src.business_layer import logging_config as logging_config_module
+        
+        previous_listener = logging_config_module._queue_listener
+        with patch.object(previous_listener, 'stop', wraps=previous_listener.stop) as mock_stop:
+            setup_logging(config_with_logging)
+        
+        mock_stop.assert_called_once()
+        assert logging_config_module._queue_listener is not previous_listener
+        shutdown_logging()
 
+    
+    def test_同じ設定での再設定はハンドラーとリスナーを作り直さない(self, config_with_logging, null_file_handler):
+        """正常系: 同一設定で再度呼ばれた場合は既存の設定を維持し、設定変更時のみ作り直すことを確認"""
+        from src.business_layer import logging_config as logging_config_module
+        
+        setup_logging(config_with_logging)
+        listener = logging_config_module._queue_listener
+        handlers = logging.getLogger().handlers[:]
+        
+        setup_logging(config_with_logging)
+        assert logging_config_module._queue_listener is listener
+        assert logging.getLogger().handlers == handlers
+        
+        changed_config = {'logging': {**config_with_logging['logging'], 'level': 'WARNING'}}
+        setup_logging(changed_config)
+        assert logging_config_module._queue_listener is not listener
+        assert logging.getLogger().level == logging.WARNING
+        shutdown_logging()
 
 class TestLoggingIntegration:
     """ログ機能の統合テスト"""
     
-    @pytest.fixture
-    def temp_log_dir(self):
-        """一時ログディレクトリのフィクスチャ"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
     def test_複数のロガーが独立して動作する(self, temp_log_dir):
         """正常系: 複数のロガーが独立して動作することを確認"""
         config = {
@@ -226,14 +309,13 @@ class TestLoggingIntegration:
         logger1.info('Component1からのメッセージ')
         logger2.warning('Component2からの警告')
         
+        shutdown_logging()  # キュー内のログをファイルへ書き出す
+        
         # 両方のメッセージがログファイルに記録されることを確認
         log_file_path = temp_log_dir / 'multi_logger.log'
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-            assert 'component1' in log_content
-            assert 'Component1からのメッセージ' in log_content
-            assert 'component2' in log_content
-            assert 'Component2からの警告' in log_content
+        assert _log_contains(
+            log_file_path, 'component1', 'Component1からのメッセージ', 'component2', 'Component2からの警告'
+        )
     
     def test_フォーマットが正しく適用される(self, temp_log_dir):
         """正常系: 指定されたフォーマットが正しく適用されることを確認"""
@@ -250,6 +332,8 @@ class TestLoggingIntegration:
         test_logger = logging.getLogger('format_tester')
         test_logger.info('フォーマットテスト')
         
+        shutdown_logging()  # キュー内のログをファイルへ書き出す
+        
         # カスタムフォーマットが適用されていることを確認
         log_file_path = temp_log_dir / 'format_test.log'
         with open(log_file_path, 'r', encoding='utf-8') as f:
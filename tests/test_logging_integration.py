@@ -1,132 +1,180 @@
 """ログ機能の統合テスト - 各コンポーネントでのログ出力確認"""
+import io
 import pytest
-import tempfile
 import logging
-from pathlib import Path
-from unittest.mock import Mock, patch
+import re
+from functools import lru_cache
+from unittest.mock import patch
 
-from src.business_layer.logging_config import setup_logging
+from src.business_layer import logging_config as logging_config_module
+from src.business_layer.logging_config import setup_logging, shutdown_logging
 
 
-class TestLoggingIntegrationWithComponents:
-    """各コンポーネントでのログ統合テスト"""
-    
-    @pytest.fixture
-    def temp_log_dir(self):
-        """一時ログディレクトリのフィクスチャ"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+@pytest.fixture(scope="module")
+def temp_log_dir(tmp_path_factory):
+    """一時ログディレクトリのフィクスチャ（モジュール内で共有）"""
+    return tmp_path_factory.mktemp("integration_logs")
+
+
+@pytest.fixture
+def logging_config(temp_log_dir):
+    """テスト用ログ設定のフィクスチャ"""
+    return {
+        'logging': {
+            'level': 'DEBUG',  # 全ログレベルを確認するためDEBUG
+            'file': str(temp_log_dir / 'integration_test.log'),
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            'max_file_size': '1MB',
+            'backup_count': 2
+        }
+    }
+
+
+# 各コンポーネントのログ出力テストのケース: (ロガー名, 出力するログ, ログ出力に含まれるべき文字列)
+COMPONENT_LOG_CASES = [
+    pytest.param(
+        'src.business_layer.sync_manager',
+        (
+            (logging.INFO, "Test sync started"),
+            (logging.DEBUG, "Processing repository details"),
+            (logging.WARNING, "Rate limit approaching"),
+            (logging.ERROR, "Sync failed for repository"),
+        ),
+        (
+            'sync_manager',
+            'Test sync started',
+            'Processing repository details',
+            'Rate limit approaching',
+            'Sync failed for repository',
+            # 各ログレベル
+            'INFO',
+            'DEBUG',
+            'WARNING',
+            'ERROR',
+        ),
+        id='SyncManager'
+    ),
+    pytest.param(
+        'src.data_layer.database_manager',
+        (
+            (logging.INFO, "Database connection established"),
+            (logging.DEBUG, "Executing query: SELECT * FROM pull_requests"),
+            (logging.INFO, "Retrieved 150 merged pull requests"),
+            (logging.WARNING, "Connection pool nearly exhausted"),
+            (logging.ERROR, "Database query failed: connection timeout"),
+        ),
+        (
+            'database_manager',
+            'Database connection established',
+            'Executing query',
+            'Retrieved 150 merged pull requests',
+            'Connection pool nearly exhausted',
+            'Database query failed',
+        ),
+        id='DatabaseManager'
+    ),
+    pytest.param(
+        'src.data_layer.github_client',
+        (
+            (logging.INFO, "Fetching merged PRs for owner/repo from 2024-01-01 to 2024-12-31"),
+            (logging.DEBUG, "Getting repository object for owner/repo"),
+            (logging.DEBUG, "Successfully retrieved repository: owner/repo"),
+            (logging.INFO, "Retrieved 25 merged PRs"),
+            (logging.WARNING, "Rate limit approaching: 50 requests remaining"),
+            (logging.ERROR, "GitHub API error: Repository not found"),
+        ),
+        (
+            'github_client',
+            'Fetching merged PRs',
+            'Getting repository object',
+            'Successfully retrieved repository',
+            'Retrieved 25 merged PRs',
+            'Rate limit approaching',
+            'GitHub API error',
+        ),
+        id='GitHubClient'
+    ),
+]
+
+
+@lru_cache(maxsize=None)
+def _expected_pattern(expected):
+    """期待する文字列のいずれかに一致する正規表現（長い文字列を優先して照合する）"""
+    return re.compile('|'.join(re.escape(text) for text in sorted(expected, key=len, reverse=True)))
+
+
+def _missing_from(content, expected):
+    """expectedのうちcontentに含まれない文字列のリスト（contentは1回だけ走査する）"""
+    found = set(_expected_pattern(expected).findall(content))
+    return [text for text in expected if text not in found]
+
+
+def _flush_queued_logs():
+    """キュー内のログを出力先へ書き出す（リスナーを停止してキューを処理し切り、再開する）"""
+    listener = logging_config_module._queue_listener
+    listener.stop()
+    listener.start()
+
+
+@pytest.fixture(scope="module")
+def shared_log_stream(temp_log_dir):
+    """モジュール内で1回だけsetup_loggingを実行し、ファイル出力先のStringIOを返す
     
-    @pytest.fixture
-    def logging_config(self, temp_log_dir):
-        """テスト用ログ設定のフィクスチャ"""
-        return {
-            'logging': {
-                'level': 'DEBUG',  # 全ログレベルを確認するためDEBUG
-                'file': str(temp_log_dir / 'integration_test.log'),
-                'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                'max_file_size': '1MB',
-                'backup_count': 2
-            }
+    ファイルハンドラーの代わりにStringIOへ書き込ませるため、フォーマット・レベル設定・
+    キュー経由の出力はsetup_loggingの実装どおりに動作し、ファイルの作成と読み込みだけを省略する。
+    終了時にリスナーを停止し、ルートロガーのハンドラーとレベルを元に戻す。
+    """
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+    stream = io.StringIO()
+    config = {
+        'logging': {
+            'level': 'DEBUG',  # 全ログレベルを確認するためDEBUG
+            'file': str(temp_log_dir / 'integration_test.log'),
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         }
+    }
+    with patch(
+        'src.business_layer.logging_config.logging.handlers.RotatingFileHandler',
+        side_effect=lambda *args, **kwargs: logging.StreamHandler(stream)
+    ):
+        setup_logging(config)
+    _flush_queued_logs()
     
-    def test_SyncManagerでログが適切に出力される(self, logging_config, temp_log_dir):
-        """正常系: SyncManagerのログが適切に出力されることを確認"""
-        setup_logging(logging_config)
-        
-        # SyncManagerのログ動作をシミュレート
-        from src.business_layer.sync_manager import SyncManager
-        
-        # モックオブジェクトを作成してSyncManagerを初期化
-        mock_github_client = Mock()
-        mock_db_manager = Mock()
-        mock_aggregator = Mock()
-        
-        sync_manager = SyncManager(mock_github_client, mock_db_manager, mock_aggregator)
-        
-        # ログメッセージのテスト
-        sync_manager.logger.info("Test sync started")
-        sync_manager.logger.debug("Processing repository details")
-        sync_manager.logger.warning("Rate limit approaching")
-        sync_manager.logger.error("Sync failed for repository")
-        
-        # ログファイルの内容を確認
-        log_file_path = temp_log_dir / 'integration_test.log'
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-            
-        # 期待されるログメッセージが記録されていることを確認
-        assert 'sync_manager' in log_content
-        assert 'Test sync started' in log_content
-        assert 'Processing repository details' in log_content
-        assert 'Rate limit approaching' in log_content
-        assert 'Sync failed for repository' in log_content
-        
-        # 各ログレベルが適切に記録されていることを確認
-        assert 'INFO' in log_content
-        assert 'DEBUG' in log_content
-        assert 'WARNING' in log_content
-        assert 'ERROR' in log_content
+    yield stream
     
-    def test_DatabaseManagerでログが適切に出力される(self, logging_config, temp_log_dir):
-        """正常系: DatabaseManagerのログが適切に出力されることを確認"""
-        setup_logging(logging_config)
-        
-        # DatabaseManagerのログ動作をシミュレート（実際のDBは使わない）
-        logger = logging.getLogger('src.data_layer.database_manager')
-        
-        # 典型的なデータベース操作のログ
-        logger.info("Database connection established")
-        logger.debug("Executing query: SELECT * FROM pull_requests")
-        logger.info("Retrieved 150 merged pull requests")
-        logger.warning("Connection pool nearly exhausted")
-        logger.error("Database query failed: connection timeout")
-        
-        # ログファイルの内容を確認
-        log_file_path = temp_log_dir / 'integration_test.log'
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-        
-        # データベース関連のログが記録されていることを確認
-        assert 'database_manager' in log_content
-        assert 'Database connection established' in log_content
-        assert 'Executing query' in log_content
-        assert 'Retrieved 150 merged pull requests' in log_content
-        assert 'Connection pool nearly exhausted' in log_content
-        assert 'Database query failed' in log_content
+    shutdown_logging()
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+@pytest.fixture
+def log_stream(shared_log_stream):
+    """前のテストの出力を消去した共有ログストリーム"""
+    shared_log_stream.seek(0)
+    shared_log_stream.truncate()
+    return shared_log_stream
+
+
+class TestLoggingIntegrationWithComponents:
+    """各コンポーネントでのログ統合テスト"""
     
-    def test_GitHubClientでAPI関連ログが出力される(self, logging_config, temp_log_dir):
-        """正常系: GitHubClientのAPI関連ログが適切に出力されることを確認"""
-        setup_logging(logging_config)
-        
-        # GitHubクライアントのログ動作をシミュレート
-        logger = logging.getLogger('src.data_layer.github_client')
+    @pytest.mark.parametrize('logger_name, messages, expected', COMPONENT_LOG_CASES)
+    def test_コンポーネントのログが適切に出力される(self, log_stream, logger_name, messages, expected):
+        """正常系: 各コンポーネントのロガーの出力が全レベルでログに記録されることを確認"""
+        logger = logging.getLogger(logger_name)
+        for level, message in messages:
+            logger.log(level, message)
         
-        # GitHub API関連の典型的なログ
-        logger.info("Fetching merged PRs for owner/repo from 2024-01-01 to 2024-12-31")
-        logger.debug("Getting repository object for owner/repo")
-        logger.debug("Successfully retrieved repository: owner/repo")
-        logger.info("Retrieved 25 merged PRs")
-        logger.warning("Rate limit approaching: 50 requests remaining")
-        logger.error("GitHub API error: Repository not found")
+        _flush_queued_logs()
         
-        # ログファイルの内容を確認
-        log_file_path = temp_log_dir / 'integration_test.log'
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-        
-        # GitHub API関連のログが記録されていることを確認
-        assert 'github_client' in log_content
-        assert 'Fetching merged PRs' in log_content
-        assert 'Getting repository object' in log_content
-        assert 'Successfully retrieved repository' in log_content
-        assert 'Retrieved 25 merged PRs' in log_content
-        assert 'Rate limit approaching' in log_content
-        assert 'GitHub API error' in log_content
+        # 期待されるログメッセージと各ログレベルが記録されていることを確認
+        missing = _missing_from(log_stream.getvalue(), expected)
+        assert not missing, missing
     
-    def test_複数コンポーネントのログが混在して記録される(self, logging_config, temp_log_dir):
+    def test_複数コンポーネントのログが混在して記録される(self, caplog):
         """正常系: 複数コンポーネントのログが適切に混在して記録されることを確認"""
-        setup_logging(logging_config)
+        caplog.set_level(logging.DEBUG)
         
         # 複数のコンポーネントのロガーを作成
         sync_logger = logging.getLogger('src.business_layer.sync_manager')
@@ -147,20 +195,42 @@ class TestLoggingIntegrationWithComponents:
         sync_logger.info("Data synchronization completed")
         main_logger.info("Application finished")
         
-        # ログファイルの内容を確認
-        log_file_path = temp_log_dir / 'integration_test.log'
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-        
-        # すべてのコンポーネントのログが混在して記録されていることを確認
-        assert '__main__' in log_content and 'Application started' in log_content
-        assert 'sync_manager' in log_content and 'Starting data synchronization' in log_content
-        assert 'github_client' in log_content and 'Connecting to GitHub API' in log_content
-        assert 'database_manager' in log_content and 'Initializing database connection' in log_content
+        # すべてのコンポーネントのログが出力順のまま混在して記録されていることを確認
+        component_names = {'__main__', sync_logger.name, db_logger.name, github_logger.name}
+        assert [record for record in caplog.record_tuples if record[0] in component_names] == [
+            ('__main__', logging.INFO, "Application started"),
+            ('src.business_layer.sync_manager', logging.INFO, "Starting data synchronization"),
+            ('src.data_layer.github_client', logging.INFO, "Connecting to GitHub API"),
+            ('src.data_layer.database_manager', logging.INFO, "Initializing database connection"),
+            ('src.business_layer.sync_manager', logging.DEBUG, "Processing repository 1/3"),
+            ('src.data_layer.github_client', logging.DEBUG, "API request: GET /repos/owner/repo/pulls"),
+            ('src.data_layer.database_manager', logging.DEBUG, "Inserting 10 new records"),
+            ('src.business_layer.sync_manager', logging.INFO, "Data synchronization completed"),
+            ('__main__', logging.INFO, "Application finished"),
+        ]
+    
+    def test_異なるログレベルでのフィルタリング(self, caplog):
+        """正常系: 異なるログレベル設定でのフィルタリングが動作することを確認"""
+        # WARNING以上のみ記録する設定
+        with caplog.at_level(logging.WARNING, logger='filter_test'):
+            # 各レベルでログ出力
+            logger = logging.getLogger('filter_test')
+            logger.debug('DEBUG message (should be filtered out)')
+            logger.info('INFO message (should be filtered out)')
+            logger.warning('WARNING message (should appear)')
+            logger.error('ERROR message (should appear)')
+            logger.critical('CRITICAL message (should appear)')
         
-        # ログの順序も確認（時系列順）
-        lines = log_content.strip().split('\n')
-        assert len(lines) >= 8  # 最低8行のログが記録される
+        # WARNING以上のみが記録されていることを確認
+        assert [(record.name, record.levelname) for record in caplog.records] == [
+            ('filter_test', 'WARNING'),
+            ('filter_test', 'ERROR'),
+            ('filter_test', 'CRITICAL'),
+        ]
+
+
+class TestLogRotationIntegration:
+    """実際のファイルへのログローテーションの統合テスト"""
     
     def test_ログローテーション設定が適用される(self, logging_config, temp_log_dir):
         """正常系: ログファイルのローテーション設定が適切に動作することを確認"""
@@ -170,50 +240,22 @@ class TestLoggingIntegrationWithComponents:
         
         setup_logging(logging_config)
         
-        # 大量のログを出力してローテーションを発生させる
+        # ローテーションを発生させる量のログを出力
         logger = logging.getLogger('rotation_test')
         
-        # 1KBを超える量のログを出力
-        for i in range(100):
+        # 1件約130バイトのため、30件（約4KB）で1KBのファイルが複数回ローテーションされる
+        for i in range(30):
             logger.info(f"This is a long test message for log rotation testing - message number {i:03d}")
         
+        shutdown_logging()  # キュー内のログを出力先へ書き出す
+        
         log_file_path = temp_log_dir / 'integration_test.log'
         
         # ログファイルが作成されていることを確認
         assert log_file_path.exists()
         
-        # ファイルサイズが設定値付近であることを確認（厳密ではなく、極端に大きくないことを確認）
-        file_size = log_file_path.stat().st_size
-        assert file_size < 5000  # 5KBより小さいことを確認（ローテーションが動作している）
-    
-    def test_異なるログレベルでのフィルタリング(self, temp_log_dir):
-        """正常系: 異なるログレベル設定でのフィルタリングが動作することを確認"""
-        # WARNING以上のみ記録する設定
-        config_warning = {
-            'logging': {
-                'level': 'WARNING',
-                'file': str(temp_log_dir / 'warning_only.log')
-            }
-        }
-        
-        setup_logging(config_warning)
-        
-        # 各レベルでログ出力
-        logger = logging.getLogger('filter_test')
-        logger.debug('DEBUG message (should be filtered out)')
-        logger.info('INFO message (should be filtered out)')  
-        logger.warning('WARNING message (should appear)')
-        logger.error('ERROR message (should appear)')
-        logger.critical('CRITICAL message (should appear)')
-        
-        # ログファイルの内容を確認
-        warning_log_file = temp_log_dir / 'warning_only.log'
-        with open(warning_log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # WARNING以上のみが記録されていることを確認
-        assert 'DEBUG message' not in content
-        assert 'INFO message' not in content
-        assert 'WARNING message' in content
-        assert 'ERROR message' in content
-        assert 'CRITICAL message' in content
\ No newline at end of file
+        # 現在のファイルは上限以下に保たれ、バックアップはbackup_count世代まで作られることを確認
+        assert log_file_path.stat().st_size <= 1024
+        assert (temp_log_dir / 'integration_test.log.1').exists()
+        assert (temp_log_dir / 'integration_test.log.2').exists()
+        assert not (temp_log_dir / 'integration_test.log.3').exists()
@@ -3,11 +3,32 @@ import pytest
 import os
 import tempfile
 import shutil
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from pathlib import Path
 
-# main.pyからインポートする必要があるクラス・関数をテストするため、
-# 実装後にインポートを追加予定
+import main
+
+
+@pytest.fixture
+def patched_main():
+    """create_app_componentsが生成するコンポーネントのクラスをまとめてモックに差し替える"""
+    with patch.multiple(
+        'main',
+        Path=DEFAULT,
+        ConfigLoader=DEFAULT,
+        TimezoneHandler=DEFAULT,
+        GitHubClient=DEFAULT,
+        DatabaseManager=DEFAULT,
+        ProductivityAggregator=DEFAULT
+    ) as mocks:
+        yield mocks
+
+
+@pytest.fixture
+def patched_services():
+    """create_servicesが生成するサービスのクラスをまとめてモックに差し替える"""
+    with patch.multiple('main', SyncManager=DEFAULT, MetricsService=DEFAULT, ProductivityVisualizer=DEFAULT) as mocks:
+        yield mocks
 
 
 class TestMainEntryPoint:
@@ -37,94 +58,53 @@ class TestMainEntryPoint:
     def test_create_app_components関数が定義されている(self):
         """正常系: create_app_components関数が定義されていることを確認"""
         # main.pyをインポートして関数の存在を確認
-        try:
-            import main
-            assert hasattr(main, 'create_app_components'), "create_app_components function is not defined"
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+        assert hasattr(main, 'create_app_components'), "create_app_components function is not defined"
     
-    def test_create_app_components関数が正しいコンポーネントを返す(self, mock_config_data):
+    def test_create_app_components関数が正しいコンポーネントを返す(self, mock_config_data, patched_main):
         """正常系: create_app_components関数が期待されるコンポーネント群を返すことを確認"""
-        try:
-            import main
-            
-            # 環境変数設定のモック
-            with patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}):
-                with patch('main.Path') as mock_path_class:
-                    # データディレクトリの存在をモック
-                    mock_path_class.return_value.mkdir.return_value = None
-                    
-                    # 各コンポーネントのモック
-                    with patch('main.ConfigLoader') as mock_config_loader, \
-                         patch('main.TimezoneHandler') as mock_timezone_handler, \
-                         patch('main.GitHubClient') as mock_github_client, \
-                         patch('main.DatabaseManager') as mock_db_manager, \
-                         patch('main.ProductivityAggregator') as mock_aggregator:
-                        
-                        mock_config_loader.return_value.load_config.return_value = mock_config_data
-                        
-                        components = main.create_app_components()
-                        
-                        # 期待されるコンポーネントが含まれることを確認
-                        assert 'timezone_handler' in components._asdict()
-                        assert 'github_client' in components._asdict()
-                        assert 'db_manager' in components._asdict()
-                        assert 'aggregator' in components._asdict()
-                        assert 'config' in components._asdict()
-                        
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
-        except AttributeError:
-            pytest.fail("create_app_components function is not properly implemented")
+        patched_main['ConfigLoader'].return_value.load_config.return_value = mock_config_data
+        
+        # 環境変数設定のモック
+        with patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}):
+            components = main.create_app_components()
+        
+        # 期待されるコンポーネントが含まれることを確認
+        assert isinstance(components, main.AppComponents)
+        assert components._fields == ('timezone_handler', 'github_client', 'db_manager', 'aggregator', 'config')
     
     def test_create_app_components関数で設定読み込みエラーが適切に処理される(self):
         """異常系: 設定読み込みエラーが適切に処理されることを確認"""
-        try:
-            import main
+        with patch('main.ConfigLoader') as mock_config_loader:
+            mock_config_loader.return_value.load_config.side_effect = Exception("Config file not found")
+            
+            with pytest.raises(Exception) as exc_info:
+                main.create_app_components()
+            
+            # エラーメッセージに設定関連の情報が含まれることを確認
+            assert "Config file not found" in str(exc_info.value)
             
-            with patch('main.ConfigLoader') as mock_config_loader:
-                mock_config_loader.return_value.load_config.side_effect = Exception("Config file not found")
-                
-                with pytest.raises(Exception) as exc_info:
-                    main.create_app_components()
-                
-                # エラーメッセージに設定関連の情報が含まれることを確認
-                assert "Config file not found" in str(exc_info.value)
-                
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
     
     def test_main関数が定義されている(self):
         """正常系: main関数が定義されていることを確認"""
-        try:
-            import main
-            assert hasattr(main, 'main'), "main function is not defined"
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+        assert hasattr(main, 'main'), "main function is not defined"
     
     def test_main関数が正常にCLIを実行する(self):
         """正常系: main関数が正常にCLIを実行することを確認"""
-        try:
-            import main
+        # CLIの実行をモック
+        with patch('main.cli') as mock_cli:
+            mock_cli.return_value = None
             
-            # CLIの実行をモック
-            with patch('main.cli') as mock_cli:
-                mock_cli.return_value = None
-                
-                # main関数を実行
-                result = main.main()
-                
-                # CLIが適切な依存関係と共に呼び出されたことを確認
-                mock_cli.assert_called_once()
-                # objパラメータが渡されていることを確認
-                call_args = mock_cli.call_args
-                assert 'obj' in call_args.kwargs
-                assert 'components' in call_args.kwargs['obj']
-                assert 'services' in call_args.kwargs['obj']
-                assert 'config' in call_args.kwargs['obj']
-                
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+            # main関数を実行
+            result = main.main()
+            
+            # CLIが適切な依存関係と共に呼び出されたことを確認
+            mock_cli.assert_called_once()
+            # objパラメータが渡されていることを確認
+            call_args = mock_cli.call_args
+            assert 'obj' in call_args.kwargs
+            assert 'components' in call_args.kwargs['obj']
+            assert 'services' in call_args.kwargs['obj']
+            assert 'config' in call_args.kwargs['obj']
 
 
 class TestDependencyInjection:
@@ -132,52 +112,40 @@ class TestDependencyInjection:
     
     def test_create_services関数が定義されている(self):
         """正常系: create_services関数が定義されていることを確認"""
-        try:
-            import main
-            assert hasattr(main, 'create_services'), "create_services function is not defined"
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+        assert hasattr(main, 'create_services'), "create_services function is not defined"
     
-    def test_create_services関数が正しいサービス群を返す(self):
+    def test_create_services関数が正しいサービス群を返す(self, patched_services):
         """正常系: create_services関数が期待されるサービス群を返すことを確認"""
-        try:
-            import main
-            
-            # モックコンポーネント作成
-            mock_components = Mock()
-            mock_components.timezone_handler = Mock()
-            mock_components.github_client = Mock()
-            mock_components.db_manager = Mock()
-            mock_components.aggregator = Mock()
-            mock_components.config = {'test': 'config'}
-            
-            with patch('main.SyncManager') as mock_sync_manager, \
-                 patch('main.MetricsService') as mock_metrics_service, \
-                 patch('main.ProductivityVisualizer') as mock_visualizer:
-                
-                services = main.create_services(mock_components)
-                
-                # 期待されるサービスが含まれることを確認
-                assert 'sync_manager' in services._asdict()
-                assert 'metrics_service' in services._asdict()
-                assert 'visualizer' in services._asdict()
-                
-                # 各サービスが適切な依存関係で作成されることを確認
-                mock_sync_manager.assert_called_once_with(
-                    mock_components.github_client, 
-                    mock_components.db_manager, 
-                    mock_components.aggregator
-                )
-                mock_metrics_service.assert_called_once_with(
-                    mock_components.db_manager, 
-                    mock_components.timezone_handler
-                )
-                mock_visualizer.assert_called_once_with(mock_components.timezone_handler)
-                
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
-        except AttributeError:
-            pytest.fail("create_services function is not properly implemented")
+        # モックコンポーネント作成（各サービスへ渡されることだけを確認するため、実際のAppComponentsに詰める）
+        mock_components = main.AppComponents(
+            timezone_handler=Mock(),
+            github_client=Mock(),
+            db_manager=Mock(),
+            aggregator=Mock(),
+            config={'test': 'config'}
+        )
+        
+        services = main.create_services(mock_components)
+        
+        mock_sync_manager = patched_services['SyncManager']
+        mock_metrics_service = patched_services['MetricsService']
+        mock_visualizer = patched_services['ProductivityVisualizer']
+        
+        # 期待されるサービスが含まれることを確認
+        assert isinstance(services, main.AppServices)
+        assert services._fields == ('sync_manager', 'metrics_service', 'visualizer')
+        
+        # 各サービスが適切な依存関係で作成されることを確認
+        mock_sync_manager.assert_called_once_with(
+            mock_components.github_client, 
+            mock_components.db_manager, 
+            mock_components.aggregator
+        )
+        mock_metrics_service.assert_called_once_with(
+            mock_components.db_manager, 
+            mock_components.timezone_handler
+        )
+        mock_visualizer.assert_called_once_with(mock_components.timezone_handler)
 
 
 class TestConfigurationIntegration:
@@ -185,50 +153,35 @@ class TestConfigurationIntegration:
     
     def test_load_and_validate_config関数が定義されている(self):
         """正常系: load_and_validate_config関数が定義されていることを確認"""
-        try:
-            import main
-            assert hasattr(main, 'load_and_validate_config'), "load_and_validate_config function is not defined"
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+        assert hasattr(main, 'load_and_validate_config'), "load_and_validate_config function is not defined"
     
     def test_load_and_validate_config関数が設定を正常に読み込む(self):
         """正常系: load_and_validate_config関数が設定を正常に読み込むことを確認"""
-        try:
-            import main
-            
-            mock_config = {
-                'github': {'repositories': ['test/repo']},
-                'database': {'name': 'test_db'},
-                'application': {'timezone': 'Asia/Tokyo'}
-            }
-            
-            with patch('main.ConfigLoader') as mock_config_loader:
-                mock_config_loader.return_value.load_config.return_value = mock_config
-                with patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}):
-                    
-                    config = main.load_and_validate_config()
-                    
-                    # 設定が正常に読み込まれることを確認
-                    assert config['github']['repositories'] == ['test/repo']
-                    assert config['github']['api_token'] == 'test_token'
-                    
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+        mock_config = {
+            'github': {'repositories': ['test/repo']},
+            'database': {'name': 'test_db'},
+            'application': {'timezone': 'Asia/Tokyo'}
+        }
+        
+        with patch('main.ConfigLoader') as mock_config_loader:
+            mock_config_loader.return_value.load_config.return_value = mock_config
+            with patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'}):
+                
+                config = main.load_and_validate_config()
+                
+                # 設定が正常に読み込まれることを確認
+                assert config['github']['repositories'] == ['test/repo']
+                assert config['github']['api_token'] == 'test_token'
+                
     
     def test_load_and_validate_config関数でGitHubトークンなしエラーが処理される(self):
         """異常系: GitHubトークンが設定されていない場合のエラー処理を確認"""
-        try:
-            import main
+        with patch.dict(os.environ, {}, clear=True):  # 環境変数をクリア
+            with pytest.raises(Exception) as exc_info:
+                main.load_and_validate_config()
             
-            with patch.dict(os.environ, {}, clear=True):  # 環境変数をクリア
-                with pytest.raises(Exception) as exc_info:
-                    main.load_and_validate_config()
-                
-                # GitHubトークン関連のエラーメッセージが含まれることを確認
-                assert "GITHUB_TOKEN" in str(exc_info.value) or "token" in str(exc_info.value).lower()
-                
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+            # GitHubトークン関連のエラーメッセージが含まれることを確認
+            assert "GITHUB_TOKEN" in str(exc_info.value) or "token" in str(exc_info.value).lower()
 
 
 class TestErrorHandling:
@@ -236,29 +189,19 @@ class TestErrorHandling:
     
     def test_setup_error_handling関数が定義されている(self):
         """正常系: setup_error_handling関数が定義されていることを確認"""
-        try:
-            import main
-            assert hasattr(main, 'setup_error_handling'), "setup_error_handling function is not defined"
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+        assert hasattr(main, 'setup_error_handling'), "setup_error_handling function is not defined"
     
     def test_アプリケーション初期化エラーが適切に処理される(self):
         """異常系: アプリケーション初期化エラーが適切に処理されることを確認"""
-        try:
-            import main
+        # コンポーネント作成でエラーが発生する場合をシミュレート
+        with patch('main.create_app_components') as mock_create_components:
+            mock_create_components.side_effect = Exception("Component initialization failed")
             
-            # コンポーネント作成でエラーが発生する場合をシミュレート
-            with patch('main.create_app_components') as mock_create_components:
-                mock_create_components.side_effect = Exception("Component initialization failed")
-                
-                with pytest.raises(SystemExit) as exc_info:
-                    main.main()
-                
-                # 適切な終了コードで終了することを確認
-                assert exc_info.value.code != 0
-                
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
+            with pytest.raises(SystemExit) as exc_info:
+                main.main()
+            
+            # 適切な終了コードで終了することを確認
+            assert exc_info.value.code != 0
 
 
 class TestIntegrationScenarios:
@@ -266,51 +209,40 @@ class TestIntegrationScenarios:
     
     def test_完全なアプリケーション起動シナリオ(self):
         """統合テスト: 完全なアプリケーション起動シナリオを確認"""
-        try:
-            import main
-            
-            # すべてのコンポーネントをモック
-            mock_config = {
-                'github': {'repositories': ['test/repo'], 'api_token': 'test_token'},
-                'database': {'name': 'test_db'},
-                'application': {'timezone': 'Asia/Tokyo'}
-            }
-            
-            # モックコンポーネントとサービスを設定
-            mock_components = Mock()
-            mock_components.timezone_handler = Mock()
-            mock_components.github_client = Mock()
-            mock_components.db_manager = Mock()
-            mock_components.aggregator = Mock()
-            mock_components.config = mock_config
-            
-            mock_services = Mock()
-            mock_services.sync_manager = Mock()
-            mock_services.metrics_service = Mock()
-            mock_services.visualizer = Mock()
+        # すべてのコンポーネントをモック
+        mock_config = {
+            'github': {'repositories': ['test/repo'], 'api_token': 'test_token'},
+            'database': {'name': 'test_db'},
+            'application': {'timezone': 'Asia/Tokyo'}
+        }
+        
+        # モックコンポーネントとサービスを設定
+        mock_components = main.AppComponents(
+            timezone_handler=Mock(),
+            github_client=Mock(),
+            db_manager=Mock(),
+            aggregator=Mock(),
+            config=mock_config
+        )
+        
+        mock_services = main.AppServices(sync_manager=Mock(), metrics_service=Mock(), visualizer=Mock())
+        
+        with patch.multiple('main', create_app_components=DEFAULT, create_services=DEFAULT, cli=DEFAULT) as mocks:
+            mocks['create_app_components'].return_value = mock_components
+            mocks['create_services'].return_value = mock_services
             
-            with patch('main.create_app_components') as mock_create_components, \
-                 patch('main.create_services') as mock_create_services, \
-                 patch('main.cli') as mock_cli:
-                
-                mock_create_components.return_value = mock_components
-                mock_create_services.return_value = mock_services
-                
-                # main関数を実行
-                main.main()
-                
-                # 各フェーズが順序通りに実行されることを確認
-                mock_create_components.assert_called_once()
-                mock_create_services.assert_called_once_with(mock_components)
-                mock_cli.assert_called_once()
-                
-                # CLIに適切な依存関係が渡されることを確認
-                call_args = mock_cli.call_args
-                assert 'obj' in call_args.kwargs
-                injected_obj = call_args.kwargs['obj']
-                assert 'components' in injected_obj
-                assert 'services' in injected_obj
-                assert 'config' in injected_obj
-                
-        except ImportError:
-            pytest.fail("main.py module could not be imported")
\ No newline at end of file
+            # main関数を実行
+            main.main()
+        
+        # 各フェーズが順序通りに実行されることを確認
+        mocks['create_app_components'].assert_called_once()
+        mocks['create_services'].assert_called_once_with(mock_components)
+        mocks['cli'].assert_called_once()
+        
+        # CLIに適切な依存関係が渡されることを確認
+        call_args = mocks['cli'].call_args
+        assert 'obj' in call_args.kwargs
+        injected_obj = call_args.kwargs['obj']
+        assert 'components' in injected_obj
+        assert 'services' in injected_obj
+        assert 'config' in injected_obj
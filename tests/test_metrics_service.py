@@ -8,6 +8,47 @@ from src.business_layer.metrics_service import MetricsService, MetricsServiceErr
 from src.data_layer.database_manager import DatabaseError
 
 
+# テストは読み取りのみのため、モジュール内で1回だけ生成して共有する
+@pytest.fixture(scope="module")
+def sample_pr_data():
+    """サンプルプルリクエストデータ"""
+    return [
+        {
+            'merged_at': datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
+            'author': 'user1',
+            'number': 1
+        },
+        {
+            'merged_at': datetime(2024, 1, 16, 10, 0, tzinfo=timezone.utc),
+            'author': 'user2',
+            'number': 2
+        },
+        {
+            'merged_at': datetime(2024, 1, 22, 10, 0, tzinfo=timezone.utc),
+            'author': 'user1',
+            'number': 3
+        }
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_weekly_metrics():
+    """サンプル週次メトリクス"""
+    return pd.DataFrame({
+        'week_start': [
+            datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc),
+            datetime(2024, 1, 22, 0, 0, tzinfo=timezone.utc)
+        ],
+        'week_end': [
+            datetime(2024, 1, 21, 23, 59, 59, tzinfo=timezone.utc),
+            datetime(2024, 1, 28, 23, 59, 59, tzinfo=timezone.utc)
+        ],
+        'pr_count': [2, 1],
+        'unique_authors': [2, 1],
+        'productivity': [1.0, 1.0]
+    })
+
+
 class TestMetricsService:
     """MetricsServiceクラスのテスト"""
     
@@ -26,44 +67,6 @@ class TestMetricsService:
         """MetricsServiceのフィクスチャ"""
         return MetricsService(mock_db_manager, mock_timezone_handler)
     
-    @pytest.fixture
-    def sample_pr_data(self):
-        """サンプルプルリクエストデータ"""
-        return [
-            {
-                'merged_at': datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
-                'author': 'user1',
-                'number': 1
-            },
-            {
-                'merged_at': datetime(2024, 1, 16, 10, 0, tzinfo=timezone.utc),
-                'author': 'user2',
-                'number': 2
-            },
-            {
-                'merged_at': datetime(2024, 1, 22, 10, 0, tzinfo=timezone.utc),
-                'author': 'user1',
-                'number': 3
-            }
-        ]
-    
-    @pytest.fixture
-    def sample_weekly_metrics(self):
-        """サンプル週次メトリクス"""
-        return pd.DataFrame({
-            'week_start': [
-                datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc),
-                datetime(2024, 1, 22, 0, 0, tzinfo=timezone.utc)
-            ],
-            'week_end': [
-                datetime(2024, 1, 21, 23, 59, 59, tzinfo=timezone.utc),
-                datetime(2024, 1, 28, 23, 59, 59, tzinfo=timezone.utc)
-            ],
-            'pr_count': [2, 1],
-            'unique_authors': [2, 1],
-            'productivity': [1.0, 1.0]
-        })
-    
     def test_MetricsServiceが正常に初期化される(self, mock_db_manager, mock_timezone_handler):
         """正常系: MetricsServiceが正常に初期化されることを確認"""
         service = MetricsService(mock_db_manager, mock_timezone_handler)
@@ -1,107 +1,222 @@
 """パフォーマンステスト - 大量データ処理時の性能検証"""
 import pytest
+import threading
 import time
-import psutil
-import os
-from datetime import datetime, timezone, timedelta
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import List, Dict, Any
-from unittest.mock import Mock, patch
-import tempfile
+from unittest.mock import MagicMock, Mock, patch
 import pandas as pd
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 from src.business_layer.sync_manager import SyncManager
 from src.data_layer.database_manager import DatabaseManager
+from src.data_layer.models import Base
 from src.business_layer.aggregator import ProductivityAggregator
+from src.business_layer.timezone_handler import TimezoneHandler
+from src.business_layer.batch_processor import BatchProcessor
+from src.business_layer.parallel_sync_manager import ParallelSyncManager
+from src.business_layer.chunked_aggregator import ChunkedAggregator
+from src.business_layer.memory_limited_processor import MemoryLimitedProcessor
+from src.data_layer.metrics_cache import MetricsCache
+from src.data_layer.optimized_queries import OptimizedQueries
 
 # テスト定数
 LARGE_DATASET_SIZE = 1000  # 大量データテストサイズ
 MAX_PROCESSING_TIME_SECONDS = 10  # 最大処理時間（秒）
+TIMING_REPEATS = 3  # 処理時間計測の繰り返し回数（最小値で判定）
+BENCHMARK_ROUNDS = 5  # pytest-benchmarkの計測ラウンド数
 MAX_MEMORY_USAGE_MB = 100  # 最大メモリ使用量（MB）
+MAX_SYNC_MEMORY_PEAK_MB = 50  # 同期処理中のメモリ割り当てピーク上限（MB、ORMオブジェクトを生成しない一括挿入前提）
+TRACEMALLOC_FRAMES = 1  # 割り当て元として記録するスタックフレーム数（行単位の集計には1で足りる）
 DEFAULT_PAGE_SIZE = 100  # デフォルトページサイズ
 DEFAULT_BATCH_SIZE = 50  # デフォルトバッチサイズ
 SAMPLE_USER_COUNT = 50  # サンプルユーザー数
 WEEKS_IN_YEAR = 52  # 年間週数
 
 
+@dataclass(frozen=True, slots=True)
+class _StubGithubClient:
+    """固定のPRデータを返すGitHubクライアントのスタブ（Mockの属性生成・呼び出し記録を計測に含めない）"""
+    prs: List[Dict[str, Any]]
+    requested_repos: List[str] = field(default_factory=list)
+    
+    def fetch_merged_prs(self, repo: str, since: datetime = None) -> List[Dict[str, Any]]:
+        """要求されたリポジトリを記録して固定のPRデータを返す"""
+        self.requested_repos.append(repo)
+        return self.prs
+
+
+@pytest.fixture(scope='class')
+def large_pr_data() -> List[Dict[str, Any]]:
+    """大量PRデータを生成（列単位で一括生成し、最後にレコード形式へ変換）"""
+    base_date = pd.Timestamp(datetime.now(timezone.utc))
+    
+    index = pd.RangeIndex(LARGE_DATASET_SIZE)
+    numbers = pd.Series(index + 1)
+    merged_at = base_date - pd.to_timedelta(index % 365, unit='D')
+    
+    return pd.DataFrame({
+        "number": numbers,
+        "author": "user_" + pd.Series(index % SAMPLE_USER_COUNT).astype(str),
+        "title": "Fix bug #" + numbers.astype(str),
+        "merged_at": merged_at,
+        "created_at": merged_at - pd.Timedelta(hours=1),
+        "updated_at": merged_at - pd.Timedelta(minutes=30)
+    }).to_dict('records')
+
+
+def _warm_up_database(db_manager: DatabaseManager) -> None:
+    """計測前にテーブルを一度読み込み、WALを空にしておく
+
+    最初の計測にページキャッシュの充填やチェックポイントの時間が混ざらないようにする
+    （インメモリDBではチェックポイントは何もしない）。
+    """
+    with db_manager.engine.connect() as connection:
+        for table in Base.metadata.sorted_tables:
+            connection.execute(select(func.count()).select_from(table)).scalar_one()
+        connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+@pytest.fixture(scope='class')
+def initialized_db_manager():
+    """テーブル作成済みのインメモリデータベースマネージャー（クラスで1回だけ作成）
+
+    ディスクI/Oを計測から外し、アプリケーションコードの処理時間だけを比較する。
+    DatabaseManagerはStaticPoolで単一の接続を共有するため、インメモリDBでも全セッションから同じデータが見える。
+    """
+    db_manager = DatabaseManager(":memory:", fast_mode=True)
+    db_manager.initialize_database()
+    _warm_up_database(db_manager)
+    
+    yield db_manager
+    
+    # クリーンアップ
+    db_manager.close()
+
+
+@pytest.fixture(scope='session')
+def sample_weekly_frame() -> pd.DataFrame:
+    """サンプル週次メトリクス（セッションで共有するため、変更する場合はコピーして使う）"""
+    dates = pd.date_range('2024-01-01', periods=WEEKS_IN_YEAR, freq='W')
+    return pd.DataFrame({
+        'week_start': dates,
+        'repo_name': ['test/repo'] * WEEKS_IN_YEAR,
+        'pr_count': [10, 15, 8, 12, 20] * 10 + [5, 7],
+        'unique_authors': [3, 4, 2, 3, 5] * 10 + [2, 3]
+    })
+
+
 class TestPerformanceLargePRData:
     """大量PRデータ処理のパフォーマンステスト"""
     
     @pytest.fixture
-    def large_pr_data(self) -> List[Dict[str, Any]]:
-        """大量PRデータを生成"""
-        base_date = datetime.now(timezone.utc)
-        
-        pr_data = []
-        for i in range(LARGE_DATASET_SIZE):
-            pr_data.append({
-                "number": i + 1,
-                "author": f"user_{i % SAMPLE_USER_COUNT}",
-                "title": f"Fix bug #{i + 1}",
-                "merged_at": base_date - timedelta(days=i % 365),
-                "created_at": base_date - timedelta(days=i % 365, hours=1),
-                "updated_at": base_date - timedelta(days=i % 365, minutes=30)
-            })
-        
-        return pr_data
-    
-    @pytest.fixture 
-    def temp_db_manager(self):
-        """テスト用データベースマネージャー"""
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as temp_db:
-            temp_db_path = temp_db.name
+    def temp_db_manager(self, initialized_db_manager):
+        """テスト用データベースマネージャー
+
+        セッションを外部トランザクションに参加させ、テスト終了時にロールバックして
+        DDLを再実行せずに次のテストへ空のテーブルを引き渡す。
+        """
+        db_manager = initialized_db_manager
+        connection = db_manager.engine.connect()
+        # isolation_level=NoneのpysqliteはBEGINを発行しないため、トランザクション開始を自前で発行する
+        event.listen(connection, "begin", lambda conn: conn.exec_driver_sql("BEGIN"))
+        trans = connection.begin()
         
-        db_manager = DatabaseManager(temp_db_path)
-        db_manager.initialize_database()
+        original_factory = db_manager.SessionFactory
+        db_manager.SessionFactory = scoped_session(
+            sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+        )
         
         yield db_manager
         
-        # クリーンアップ
-        db_manager.close()
-        os.unlink(temp_db_path)
+        db_manager.SessionFactory.remove()
+        db_manager.SessionFactory = original_factory
+        trans.rollback()
+        connection.close()
     
     def test_大量PRデータの処理時間が基準以内(self, large_pr_data, temp_db_manager):
         """正常系: 大量PRデータが指定時間以内で処理されることを確認"""
-        # Given: 大量のPRデータとモックされた依存関係
-        mock_github_client = Mock()
-        mock_github_client.fetch_merged_prs.return_value = large_pr_data
+        # Given: 大量のPRデータとスタブ化したGitHubクライアント
+        stub_github_client = _StubGithubClient(large_pr_data)
         
-        aggregator = ProductivityAggregator()
-        sync_manager = SyncManager(mock_github_client, temp_db_manager, aggregator)
+        aggregator = ProductivityAggregator(TimezoneHandler("UTC"))
+        sync_manager = SyncManager(stub_github_client, temp_db_manager, aggregator)
         
-        # When: 大量データの同期処理を実行
-        start_time = time.time()
-        result = sync_manager.initial_sync(["test/repo"], days_back=365, progress=False)
-        end_time = time.time()
+        # When: 大量データの同期処理を実行（外れ値を除くため、未登録のリポジトリで繰り返し最小値を採る）
+        repositories = [f"test/repo{i}" for i in range(TIMING_REPEATS)]
+        elapsed_seconds = []
+        with patch.object(temp_db_manager, 'bulk_insert_pull_requests',
+                          wraps=temp_db_manager.bulk_insert_pull_requests) as bulk_insert:
+            for repository in repositories:
+                start_ns = time.perf_counter_ns()
+                result = sync_manager.initial_sync([repository], days_back=365, progress=False)
+                elapsed_seconds.append((time.perf_counter_ns() - start_ns) / 1e9)
+                
+                assert result['status'] == 'success'
+                assert result['total_prs_fetched'] == LARGE_DATASET_SIZE
         
-        processing_time = end_time - start_time
+        processing_time = min(elapsed_seconds)
         
         # Then: 処理時間が基準以内であること
         assert processing_time < MAX_PROCESSING_TIME_SECONDS, f"処理時間が基準を超過: {processing_time:.2f}秒"
+        
+        # 1リポジトリにつき取得1回・一括挿入1回で処理されること
+        assert stub_github_client.requested_repos == repositories
+        assert bulk_insert.call_count == len(repositories)
+    
+    def test_大量PRデータの同期処理ベンチマーク(self, request, large_pr_data, temp_db_manager):
+        """計測: 大量PRデータの同期処理時間をpytest-benchmarkで記録（回帰判定は--benchmark-compare-failで行う）"""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+        
+        # Given: 大量のPRデータとスタブ化したGitHubクライアント
+        stub_github_client = _StubGithubClient(large_pr_data)
+        
+        aggregator = ProductivityAggregator(TimezoneHandler("UTC"))
+        sync_manager = SyncManager(stub_github_client, temp_db_manager, aggregator)
+        repositories = iter(f"bench/repo{i}" for i in range(BENCHMARK_ROUNDS))
+        
+        def next_round():
+            # 毎ラウンド未登録のリポジトリを同期し、INSERT OR IGNOREで挿入が省略されないようにする
+            return ([next(repositories)],), {'days_back': 365, 'progress': False}
+        
+        # When: ラウンドごとに同期処理を計測
+        result = benchmark.pedantic(sync_manager.initial_sync, setup=next_round,
+                                    rounds=BENCHMARK_ROUNDS, iterations=1)
+        
+        # Then: 計測対象の処理が正常に完了していること
         assert result['status'] == 'success'
         assert result['total_prs_fetched'] == LARGE_DATASET_SIZE
     
     def test_メモリ使用量が基準以内で処理される(self, large_pr_data, temp_db_manager):
         """正常系: 大量データ処理時のメモリ使用量が適切であることを確認"""
-        # Given: 大量のPRデータとモックされた依存関係
-        mock_github_client = Mock()
-        mock_github_client.fetch_merged_prs.return_value = large_pr_data
-        
-        aggregator = ProductivityAggregator()
-        sync_manager = SyncManager(mock_github_client, temp_db_manager, aggregator)
+        # Given: 大量のPRデータとスタブ化したGitHubクライアント
+        stub_github_client = _StubGithubClient(large_pr_data)
         
-        # プロセスのメモリ使用量を取得
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        aggregator = ProductivityAggregator(TimezoneHandler("UTC"))
+        sync_manager = SyncManager(stub_github_client, temp_db_manager, aggregator)
         
-        # When: 大量データの同期処理を実行
-        result = sync_manager.initial_sync(["test/repo"], days_back=365, progress=False)
-        
-        # プロセスのメモリ使用量を再度取得
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
-        memory_increase = final_memory - initial_memory
+        # 同期処理中のPythonオブジェクトの割り当てだけを追跡する
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        try:
+            # When: 大量データの同期処理を実行
+            result = sync_manager.initial_sync(["test/repo"], days_back=365, progress=False)
+            
+            _, peak = tracemalloc.get_traced_memory()
+            peak_mb = peak / 1024 / 1024
+            top_allocations = []
+            if peak_mb >= MAX_SYNC_MEMORY_PEAK_MB:
+                # 失敗時の原因調査のため、割り当ての多い箇所を記録する
+                top_allocations = tracemalloc.take_snapshot().statistics('lineno')[:10]
+        finally:
+            tracemalloc.stop()
         
-        # Then: メモリ使用量の増加が基準以内であること
-        assert memory_increase < MAX_MEMORY_USAGE_MB, f"メモリ使用量の増加が基準を超過: {memory_increase:.2f}MB"
+        # Then: メモリ使用量のピークが基準以内であること
+        allocation_report = "\n".join(str(stat) for stat in top_allocations)
+        assert peak_mb < MAX_SYNC_MEMORY_PEAK_MB, f"メモリ使用量のピークが基準を超過: {peak_mb:.2f}MB\n{allocation_report}"
         assert result['status'] == 'success'
         assert result['total_prs_fetched'] == LARGE_DATASET_SIZE
 
@@ -124,17 +239,11 @@ class TestBatchProcessingOptimization:
         batch_size = performance_config['batch_size']
         
         # When: バッチ処理クラスを初期化
-        try:
-            from src.business_layer.batch_processor import BatchProcessor
-            batch_processor = BatchProcessor(batch_size=batch_size)
-            
-            # Then: 適切な初期化が行われることを確認
-            assert batch_processor.get_batch_size() == batch_size
-            assert batch_processor.get_max_memory_mb() == performance_config['max_memory_mb']
-            
-        except ImportError:
-            # 依存関係が不足している場合はテストをスキップ
-            pytest.skip("BatchProcessor dependencies not available")
+        batch_processor = BatchProcessor(batch_size=batch_size)
+        
+        # Then: 適切な初期化が行われることを確認
+        assert batch_processor.get_batch_size() == batch_size
+        assert batch_processor.get_max_memory_mb() == performance_config['max_memory_mb']
     
     def test_複数リポジトリの並列処理が可能であること(self, performance_config):
         """正常系: 複数リポジトリの並列処理ができることを確認"""
@@ -143,61 +252,62 @@ class TestBatchProcessingOptimization:
         assert parallel_enabled is True
         
         # When: 並列処理マネージャーを使用
-        try:
-            from src.business_layer.parallel_sync_manager import ParallelSyncManager
-            parallel_manager = ParallelSyncManager(max_workers=4)
-            
-            # Then: 並列処理マネージャーが正常に初期化されることを確認
-            assert parallel_manager.get_max_workers() == 4
-            optimal_workers = parallel_manager.estimate_optimal_workers(repository_count=3)
-            assert optimal_workers <= 4
-            
-        except ImportError:
-            # 依存関係が不足している場合はテストをスキップ
-            pytest.skip("ParallelSyncManager dependencies not available")
-
+        parallel_manager = ParallelSyncManager(max_workers=4)
+        
+        # Then: 並列処理マネージャーが正常に初期化されることを確認
+        assert parallel_manager.get_max_workers() == 4
+        optimal_workers = parallel_manager.estimate_optimal_workers(repository_count=3)
+        assert optimal_workers <= 4
+        
+        # 4リポジトリの同期が並行して実行されること
+        repositories = [f"test/repo{i}" for i in range(4)]
+        
+        # 全リポジトリの取得が同時に待ち合わせできた場合のみ通過する
+        # （逐次実行ではタイムアウトしてBrokenBarrierErrorになる）
+        barrier = threading.Barrier(len(repositories), timeout=5)
+        returned_repos = []
+        
+        def fetch_with_barrier(repo, since):
+            barrier.wait()
+            returned_repos.append(repo)
+            return []
+        
+        mock_github_client = Mock()
+        mock_github_client.fetch_merged_prs.side_effect = fetch_with_barrier
+        sync_manager = SyncManager(mock_github_client, MagicMock(spec=DatabaseManager), Mock())
+        
+        result = parallel_manager.parallel_initial_sync(sync_manager, repositories)
+        
+        assert result.status == 'success'
+        assert result.successful_repositories == len(repositories)
+        assert mock_github_client.fetch_merged_prs.call_count == len(repositories)
+        assert sorted(returned_repos) == repositories
+        assert not barrier.broken
 
 class TestCachedWeeklyMetrics:
     """週次メトリクスキャッシュ機能のテスト"""
     
-    @pytest.fixture
-    def sample_cached_data(self) -> pd.DataFrame:
-        """サンプルキャッシュデータ"""
-        dates = pd.date_range('2024-01-01', periods=WEEKS_IN_YEAR, freq='W')
-        return pd.DataFrame({
-            'week_start': dates,
-            'repo_name': ['test/repo'] * WEEKS_IN_YEAR,
-            'pr_count': [10, 15, 8, 12, 20] * 10 + [5, 7],
-            'unique_authors': [3, 4, 2, 3, 5] * 10 + [2, 3]
-        })
-    
-    def test_キャッシュされた週次メトリクスが高速で取得される(self, sample_cached_data):
+    def test_キャッシュされた週次メトリクスが高速で取得される(self, sample_weekly_frame):
         """正常系: キャッシュされた週次メトリクスが高速で取得されることを確認"""
-        # Given: キャッシュされたデータとタイムゾーン設定
+        # Given: 週次メトリクスを計算済みのキャッシュとタイムゾーン設定
         repo_name = "test/repo"
         timezone_name = "Asia/Tokyo"
         
+        cache = MetricsCache()
+        with patch.object(cache, '_compute_weekly_metrics', return_value=sample_weekly_frame):
+            cache.get_cached_weekly_metrics(repo_name, timezone_name)
+        
         # When: キャッシュされた週次メトリクスを取得
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        result = cache.get_cached_weekly_metrics(repo_name, timezone_name)
+        retrieval_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        try:
-            from src.data_layer.metrics_cache import MetricsCache
-            cache = MetricsCache()
-            result = cache.get_cached_weekly_metrics(repo_name, timezone_name)
-            
-            end_time = time.time()
-            retrieval_time = end_time - start_time
-            
-            # Then: 基本的なキャッシュ機能が動作することを確認
-            assert result is not None
-            assert retrieval_time < 1.0  # 1秒以下で取得
-            
-            # キャッシュ機能の確認
-            assert cache.is_cached(repo_name, timezone_name) is True
-            
-        except ImportError:
-            # 依存関係が不足している場合はテストをスキップ
-            pytest.skip("MetricsCache dependencies not available")
+        # Then: 基本的なキャッシュ機能が動作することを確認
+        pd.testing.assert_frame_equal(result, sample_weekly_frame)
+        assert retrieval_time < 1.0  # 1秒以下で取得
+        
+        # キャッシュ機能の確認
+        assert cache.is_cached(repo_name, timezone_name) is True
     
     def test_キャッシュミス時は計算してキャッシュに保存される(self):
         """正常系: キャッシュミス時は新規計算してキャッシュに保存されることを確認"""
@@ -205,48 +315,98 @@ class TestCachedWeeklyMetrics:
         repo_name = "new/repo"
         timezone_name = "UTC"
         
-        try:
-            from src.data_layer.metrics_cache import MetricsCache
-            cache = MetricsCache()
-            
-            # キャッシュされていない状態を確認
-            assert cache.is_cached(repo_name, timezone_name) is False
-            
-            # When: 存在しないキャッシュデータを要求
-            result = cache.get_cached_weekly_metrics(repo_name, timezone_name)
-            
-            # Then: 新規計算が実行され、結果がキャッシュされることを確認
-            assert cache.is_cached(repo_name, timezone_name) is True
-            assert result is not None
-            
-        except ImportError:
-            # 依存関係が不足している場合はテストをスキップ
-            pytest.skip("MetricsCache dependencies not available")
+        cache = MetricsCache()
+        
+        # キャッシュされていない状態を確認
+        assert cache.is_cached(repo_name, timezone_name) is False
+        
+        # When: 存在しないキャッシュデータを要求
+        result = cache.get_cached_weekly_metrics(repo_name, timezone_name)
+        
+        # Then: 新規計算が実行され、結果がキャッシュされることを確認
+        assert cache.is_cached(repo_name, timezone_name) is True
+        assert result is not None
+    
+    def test_ディスクキャッシュが別インスタンスから再利用される(self, tmp_path):
+        """正常系: Parquetに保存された週次メトリクスがプロセス再起動後も再計算なしで取得されることを確認"""
+        # Given: ディスクキャッシュを有効にしたキャッシュで一度計算済み
+        pytest.importorskip("pyarrow")
+        repo_name = "test/repo"
+        timezone_name = "Asia/Tokyo"
+        
+        first_cache = MetricsCache(cache_dir=tmp_path)
+        expected = first_cache.get_cached_weekly_metrics(repo_name, timezone_name)
+        
+        # When: 新しいインスタンス（再起動後を想定）から取得
+        second_cache = MetricsCache(cache_dir=tmp_path)
+        with patch.object(second_cache, '_compute_weekly_metrics') as compute:
+            result = second_cache.get_cached_weekly_metrics(repo_name, timezone_name)
+        
+        # Then: 再計算されず、同じデータが返されること
+        compute.assert_not_called()
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+        assert second_cache.get_cache_stats()['cache_hit_ratio'] == 1.0
+    
+    def test_ディスクのみのキャッシュもクリア件数に含まれる(self, tmp_path):
+        """正常系: 再起動後にディスクにしかないエントリも削除され、件数に数えられることを確認"""
+        # Given: 別インスタンスでディスクに保存済み
+        pytest.importorskip("pyarrow")
+        MetricsCache(cache_dir=tmp_path).get_cached_weekly_metrics("test/repo", "Asia/Tokyo")
+        
+        # When: 新しいインスタンスから全クリア
+        cleared = MetricsCache(cache_dir=tmp_path).clear_all_cache()
+        
+        # Then: ディスクのエントリが数えられ、ファイルが残らないこと
+        assert cleared == 1
+        assert list(tmp_path.glob("*.parquet")) == []
 
 
 class TestDatabaseQueryOptimization:
     """データベースクエリ最適化のテスト"""
     
-    def test_ページネーション付きクエリが実装される(self):
-        """正常系: 大量データの取得時にページネーションが使用されることを確認"""
+    def test_ページネーション付きクエリが実装される(self, large_pr_data):
+        """正常系: 大量データの取得時にカーソルで続きのページを取得できることを確認"""
         # Given: 大量データが保存されたデータベース
         page_size = DEFAULT_PAGE_SIZE
-        page = 1
         
-        try:
-            from src.data_layer.database_manager import DatabaseManager
-            
-            # ページネーション機能が実装されていることを確認
-            db_manager = DatabaseManager(":memory:")
-            assert hasattr(db_manager, 'get_merged_pull_requests_paginated')
-            
-            # メソッドが呼び出し可能であることを確認
-            pagination_method = getattr(db_manager, 'get_merged_pull_requests_paginated')
-            assert callable(pagination_method)
-            
-        except ImportError:
-            # 依存関係が不足している場合はテストをスキップ
-            pytest.skip("DatabaseManager dependencies not available")
+        db_manager = DatabaseManager(":memory:")
+        db_manager.initialize_database()
+        db_manager.bulk_insert_pull_requests("test/repo", large_pr_data)
+        
+        # When: 先頭ページと、そのカーソルを使った次のページを取得
+        first_page = db_manager.get_merged_pull_requests_paginated(page_size=page_size)
+        second_page = db_manager.get_merged_pull_requests_paginated(
+            page_size=page_size, cursor=first_page['next_cursor']
+        )
+        
+        # Then: ページが重複せず、merged_at降順で連続していること
+        assert len(first_page['data']) == page_size
+        assert len(second_page['data']) == page_size
+        assert first_page['has_next_page'] is True
+        
+        first_numbers = {pr['number'] for pr in first_page['data']}
+        second_numbers = {pr['number'] for pr in second_page['data']}
+        assert first_numbers.isdisjoint(second_numbers)
+        
+        merged_dates = [pr['merged_at'] for pr in first_page['data'] + second_page['data']]
+        assert merged_dates == sorted(merged_dates, reverse=True)
+        
+        db_manager.close()
+        
+        # 境界値: 総件数がページサイズのちょうど倍数の場合、最終ページで次ページなしと判定されること
+        exact_db_manager = DatabaseManager(":memory:")
+        exact_db_manager.initialize_database()
+        exact_db_manager.bulk_insert_pull_requests("test/repo", large_pr_data[:page_size * 2])
+        
+        exact_first_page = exact_db_manager.get_merged_pull_requests_paginated(page_size=page_size)
+        exact_last_page = exact_db_manager.get_merged_pull_requests_paginated(
+            page_size=page_size, cursor=exact_first_page['next_cursor']
+        )
+        
+        assert (len(exact_first_page['data']), exact_first_page['has_next_page']) == (page_size, True)
+        assert (len(exact_last_page['data']), exact_last_page['has_next_page']) == (page_size, False)
+        
+        exact_db_manager.close()
     
     def test_インデックス最適化されたクエリが使用される(self):
         """正常系: 適切なインデックスが使用されたクエリが実行されることを確認"""
@@ -255,21 +415,13 @@ class TestDatabaseQueryOptimization:
         start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         end_date = datetime(2024, 12, 31, tzinfo=timezone.utc)
         
-        try:
-            from src.data_layer.optimized_queries import OptimizedQueries
-            from unittest.mock import Mock
-            
-            # モックセッションでOptimizedQueriesを初期化
-            mock_session = Mock()
-            optimizer = OptimizedQueries(mock_session)
-            
-            # 最適化クエリクラスが初期化されることを確認
-            assert optimizer is not None
-            assert hasattr(optimizer, 'get_prs_by_date_range_optimized')
-            
-        except ImportError:
-            # 依存関係が不足している場合はテストをスキップ
-            pytest.skip("OptimizedQueries dependencies not available")
+        # モックセッションでOptimizedQueriesを初期化
+        mock_session = Mock()
+        optimizer = OptimizedQueries(mock_session)
+        
+        # 最適化クエリクラスが初期化されることを確認
+        assert optimizer is not None
+        assert hasattr(optimizer, 'get_prs_by_date_range_optimized')
 
 
 class TestMemoryEfficientAggregation:
@@ -281,34 +433,38 @@ class TestMemoryEfficientAggregation:
         chunk_size = 500
         total_records = 2000
         
+        aggregator = ChunkedAggregator(chunk_size=chunk_size)
+        
+        # When: テスト側でPythonヒープの割り当てを追跡しながら集計する
+        tracemalloc.start(TRACEMALLOC_FRAMES)
         try:
-            from src.business_layer.chunked_aggregator import ChunkedAggregator
-            aggregator = ChunkedAggregator(chunk_size=chunk_size)
+            # 集計前に呼び出し側のピークを作っておく
+            preallocated = bytearray(10 * 1024 * 1024)
+            del preallocated
+            _, peak_before = tracemalloc.get_traced_memory()
             result = aggregator.calculate_weekly_metrics_chunked(total_records)
-            
-            # Then: チャンク処理が正常に完了することを確認
-            assert result['status'] == 'success'
-            assert result['chunks_processed'] == total_records // chunk_size
-            assert 'memory_peak_mb' in result
-            
-        except ImportError:
-            # 依存関係が不足している場合はテストをスキップ
-            pytest.skip("ChunkedAggregator dependencies not available")
+            _, peak_after = tracemalloc.get_traced_memory()
+            still_tracing = tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+        
+        # Then: チャンク処理が正常に完了することを確認
+        assert result['status'] == 'success'
+        assert result['chunks_processed'] == total_records // chunk_size
+        assert result['final_metrics_count'] == WEEKS_IN_YEAR
+        assert 0 <= result['memory_peak_mb'] < MAX_MEMORY_USAGE_MB
+        # 呼び出し側の追跡状態とピーク値を変更しないことを確認
+        assert still_tracing
+        assert peak_after >= peak_before
     
     def test_メモリ使用量がチャンク処理で制限される(self):
         """正常系: チャンク処理によりメモリ使用量が制限されることを確認"""
         # Given: メモリ制限設定
         memory_limit_mb = MAX_MEMORY_USAGE_MB
         
-        try:
-            from src.business_layer.memory_limited_processor import MemoryLimitedProcessor
-            processor = MemoryLimitedProcessor(memory_limit_mb=memory_limit_mb)
-            result = processor.process_large_dataset()
-            
-            # Then: メモリ使用量が制限内に収まることを確認
-            assert result['peak_memory_mb'] <= memory_limit_mb
-            assert result['status'] == 'success'
-            
-        except ImportError:
-            # 依存関係が不足している場合はテストをスキップ
-            pytest.skip("MemoryLimitedProcessor dependencies not available")
\ No newline at end of file
+        processor = MemoryLimitedProcessor(memory_limit_mb=memory_limit_mb)
+        result = processor.process_large_dataset()
+        
+        # Then: メモリ使用量が制限内に収まることを確認
+        assert result['peak_memory_mb'] <= memory_limit_mb
+        assert result['status'] == 'success'
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""PRDiskCacheのテスト"""
+import sqlite3
+
+import pytest
+
+from src.data_layer.pr_disk_cache import CachedPRs, PRDiskCache
+
+
+class TestPRDiskCache:
+    """PRDiskCacheクラスのテスト"""
+    
+    KEY = ("owner/repo", "2024-01-01T00:00:00+00:00", "")
+    RECORDS = [{"number": 1, "title": "PR 1", "author": "developer1"}]
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """テスト用のPRDiskCache"""
+        return PRDiskCache(tmp_path / "cache" / "prs.sqlite")
+    
+    def test_未登録のキーはNoneを返す(self, cache):
+        """正常系: キャッシュに存在しないキーはNoneになることを確認"""
+        assert cache.get(self.KEY) is None
+    
+    def test_保存したエントリを取得できる(self, cache):
+        """正常系: 保存したETagとレコードがそのまま取得できることを確認"""
+        cache.set(self.KEY, 'W/"abc"', self.RECORDS)
+        
+        assert cache.get(self.KEY) == CachedPRs(etag='W/"abc"', records=self.RECORDS)
+    
+    def test_同じキーへの保存は置き換えられる(self, cache):
+        """正常系: 同じキーに再保存すると最新の内容で置き換えられることを確認"""
+        cache.set(self.KEY, 'W/"abc"', self.RECORDS)
+        cache.set(self.KEY, 'W/"def"', [])
+        
+        assert cache.get(self.KEY) == CachedPRs(etag='W/"def"', records=[])
+    
+    def test_clearですべてのエントリが削除される(self, cache):
+        """正常系: clearで全エントリが削除され、削除件数が返ることを確認"""
+        cache.set(self.KEY, None, self.RECORDS)
+        cache.set(("owner/other", "2024-01-01T00:00:00+00:00", ""), None, [])
+        
+        assert cache.clear() == 2
+        assert cache.get(self.KEY) is None
+    
+    def test_WALモードで作成される(self, cache, tmp_path):
+        """正常系: SQLiteファイルがWALジャーナルモードで作成されることを確認"""
+        conn = sqlite3.connect(tmp_path / "cache" / "prs.sqlite")
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
@@ -6,72 +6,54 @@ import pytest
 from pathlib import Path
 
 
-class TestProjectStructure:
-    """プロジェクト構造のテストクラス"""
-    
-    def test_src_data_layer_ディレクトリが存在する(self):
-        """src/data_layer/ディレクトリが存在することを確認"""
-        assert Path("src/data_layer").exists()
-        assert Path("src/data_layer").is_dir()
-    
-    def test_src_business_layer_ディレクトリが存在する(self):
-        """src/business_layer/ディレクトリが存在することを確認"""
-        assert Path("src/business_layer").exists()
-        assert Path("src/business_layer").is_dir()
-    
-    def test_src_presentation_layer_ディレクトリが存在する(self):
-        """src/presentation_layer/ディレクトリが存在することを確認"""
-        assert Path("src/presentation_layer").exists()
-        assert Path("src/presentation_layer").is_dir()
-    
-    def test_tests_ディレクトリが存在する(self):
-        """tests/ディレクトリが存在することを確認"""
-        assert Path("tests").exists()
-        assert Path("tests").is_dir()
-    
-    def test_logs_ディレクトリが存在する(self):
-        """logs/ディレクトリが存在することを確認"""
-        assert Path("logs").exists()
-        assert Path("logs").is_dir()
-    
-    def test_data_ディレクトリが存在する(self):
-        """data/ディレクトリが存在することを確認"""
-        assert Path("data").exists()
-        assert Path("data").is_dir()
-    
-    def test_output_ディレクトリが存在する(self):
-        """output/ディレクトリが存在することを確認"""
-        assert Path("output").exists()
-        assert Path("output").is_dir()
+# プロジェクトに存在すべきパスとその種類
+EXPECTED_ENTRIES = [
+    ("src/data_layer", "dir"),
+    ("src/business_layer", "dir"),
+    ("src/presentation_layer", "dir"),
+    ("tests", "dir"),
+    ("logs", "dir"),
+    ("data", "dir"),
+    ("output", "dir"),
+    ("src/__init__.py", "file"),
+    ("src/data_layer/__init__.py", "file"),
+    ("src/business_layer/__init__.py", "file"),
+    ("src/presentation_layer/__init__.py", "file"),
+    ("tests/__init__.py", "file"),
+]
 
 
-class TestInitFiles:
-    """__init__.pyファイルの存在テスト"""
-    
-    def test_src_init_pyが存在する(self):
-        """src/__init__.pyが存在することを確認"""
-        assert Path("src/__init__.py").exists()
-        assert Path("src/__init__.py").is_file()
-    
-    def test_src_data_layer_init_pyが存在する(self):
-        """src/data_layer/__init__.pyが存在することを確認"""
-        assert Path("src/data_layer/__init__.py").exists()
-        assert Path("src/data_layer/__init__.py").is_file()
-    
-    def test_src_business_layer_init_pyが存在する(self):
-        """src/business_layer/__init__.pyが存在することを確認"""
-        assert Path("src/business_layer/__init__.py").exists()
-        assert Path("src/business_layer/__init__.py").is_file()
-    
-    def test_src_presentation_layer_init_pyが存在する(self):
-        """src/presentation_layer/__init__.pyが存在することを確認"""
-        assert Path("src/presentation_layer/__init__.py").exists()
-        assert Path("src/presentation_layer/__init__.py").is_file()
+@pytest.fixture(scope="session")
+def project_entries():
+    """期待パスの親ディレクトリを1回ずつscandirし、{パス: 種類}を返す"""
+    entries = {}
+    for parent in {os.path.dirname(path) or "." for path, _ in EXPECTED_ENTRIES}:
+        if not os.path.isdir(parent):
+            continue
+        with os.scandir(parent) as it:
+            for entry in it:
+                path = entry.name if parent == "." else f"{parent}/{entry.name}"
+                entries[path] = "dir" if entry.is_dir() else "file"
+    return entries
+
+
+# .gitignoreに含まれるべき除外設定
+REQUIRED_GITIGNORE_PATTERNS = frozenset({"__pycache__", "*.py[cod]", ".env", "logs/", "data/", "*.db"})
+
+
+@pytest.fixture(scope="session")
+def gitignore_content():
+    """.gitignoreの内容（テストセッションで1回だけ読み込む）"""
+    return Path(".gitignore").read_text(encoding="utf-8")
+
+
+class TestProjectStructure:
+    """プロジェクト構造（ディレクトリと__init__.py）のテストクラス"""
     
-    def test_tests_init_pyが存在する(self):
-        """tests/__init__.pyが存在することを確認"""
-        assert Path("tests/__init__.py").exists()
-        assert Path("tests/__init__.py").is_file()
+    @pytest.mark.parametrize("path,kind", EXPECTED_ENTRIES, ids=[path for path, _ in EXPECTED_ENTRIES])
+    def test_必要なパスが存在する(self, project_entries, path, kind):
+        """プロジェクトに必要なディレクトリ・ファイルが存在することを確認"""
+        assert project_entries.get(path) == kind
 
 
 class TestConfigFiles:
@@ -82,18 +64,11 @@ class TestConfigFiles:
         assert Path(".gitignore").exists()
         assert Path(".gitignore").is_file()
     
-    def test_gitignoreの内容が適切(self):
+    def test_gitignoreの内容が適切(self, gitignore_content):
         """.gitignoreの内容が適切であることを確認"""
-        with open(".gitignore", "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        # Python関連の除外設定があることを確認
-        assert "__pycache__" in content
-        assert "*.py[cod]" in content
-        assert ".env" in content
-        assert "logs/" in content
-        assert "data/" in content
-        assert "*.db" in content
+        # Python関連・ローカル生成物の除外設定がすべてあることを確認
+        missing = {pattern for pattern in REQUIRED_GITIGNORE_PATTERNS if pattern not in gitignore_content}
+        assert not missing, f".gitignoreに不足している除外設定: {sorted(missing)}"
     
     def test_requirements_txtが存在する(self):
         """requirements.txtが存在することを確認"""
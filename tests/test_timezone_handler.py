@@ -1,35 +1,67 @@
 """
 TimezoneHandlerクラスのテスト
 """
-import unittest
+import pytest
+import pandas as pd
 from datetime import datetime
 from zoneinfo import ZoneInfo  # Python 3.9+ の標準ライブラリ
 from src.business_layer.timezone_handler import TimezoneHandler
 
 
-class TestTimezoneHandler(unittest.TestCase):
+# テスト内で使うタイムゾーン（ZoneInfoの生成・キャッシュ参照を1回にまとめる）
+UTC = ZoneInfo("UTC")
+TOKYO = ZoneInfo("Asia/Tokyo")
+# 2024年1月15日（月）0:00 〜 1月21日（日）23:59:59.999999 の週
+WEEK_START = datetime(2024, 1, 15, 0, 0, 0, tzinfo=TOKYO)
+WEEK_END = datetime(2024, 1, 21, 23, 59, 59, 999999, tzinfo=TOKYO)
+
+
+@pytest.fixture(scope="module")
+def handler():
+    """デフォルト（Asia/Tokyo）のTimezoneHandler（状態を持たないためモジュール内で共有する）"""
+    return TimezoneHandler()
+
+
+class TestTimezoneHandler:
     """TimezoneHandlerクラスのテスト"""
 
-    def test_utc_to_local_conversion(self):
-        """UTCの日時を日本時間に変換できることを確認"""
+    @pytest.mark.parametrize("display_timezone,expected_hour", [
+        ("Asia/Tokyo", 19),  # UTC 10:30 は 日本時間 19:30
+        ("America/New_York", 5),  # UTC 10:30 は ニューヨーク時間 5:30
+    ])
+    def test_utc_to_local_conversion(self, display_timezone, expected_hour):
+        """UTCの日時を指定したタイムゾーンに変換できることを確認"""
         # Arrange
-        handler = TimezoneHandler()
-        utc_dt = datetime(2024, 1, 15, 10, 30, 0, tzinfo=ZoneInfo("UTC"))
+        handler = TimezoneHandler(display_timezone=display_timezone)
+        utc_dt = datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
         
         # Act
         local_dt = handler.utc_to_local(utc_dt)
         
         # Assert
-        # UTC 10:30 は 日本時間 19:30
-        assert local_dt.hour == 19
+        assert local_dt.hour == expected_hour
         assert local_dt.minute == 30
-        assert str(local_dt.tzinfo) == "Asia/Tokyo"
+        assert str(local_dt.tzinfo) == display_timezone
+    
+    def test_utc_to_local_series_conversion(self, handler):
+        """UTCの日時列を1件ずつの変換と同じ結果で一括変換できることを確認（タイムゾーンなしはUTC扱い）"""
+        # Arrange
+        values = pd.Series([
+            datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC),
+            datetime(2024, 1, 21, 20, 0, 0),
+        ])
+        
+        # Act
+        local_values = handler.utc_to_local_series(values)
+        
+        # Assert
+        assert local_values.tolist() == [handler.utc_to_local(dt) for dt in values]
+        assert str(local_values.dt.tz) == "Asia/Tokyo"
     
-    def test_local_to_utc_conversion(self):
+    def test_local_to_utc_conversion(self, handler):
         """日本時間の日時をUTCに変換できることを確認"""
         # Arrange
-        handler = TimezoneHandler()
-        local_dt = datetime(2024, 1, 15, 19, 30, 0, tzinfo=ZoneInfo("Asia/Tokyo"))
+        local_dt = datetime(2024, 1, 15, 19, 30, 0, tzinfo=TOKYO)
         
         # Act
         utc_dt = handler.local_to_utc(local_dt)
@@ -40,75 +72,18 @@ class TestTimezoneHandler(unittest.TestCase):
         assert utc_dt.minute == 30
         assert str(utc_dt.tzinfo) == "UTC"
     
-    def test_get_week_boundaries_monday_start(self):
-        """指定日付を含む週の開始・終了日時を取得できることを確認"""
-        # Arrange
-        handler = TimezoneHandler()
-        # 2024年1月15日（月曜日）の場合
-        target_date = datetime(2024, 1, 15, 12, 0, 0, tzinfo=ZoneInfo("Asia/Tokyo"))
-        
+    @pytest.mark.parametrize("target_date", [
+        datetime(2024, 1, 15, 12, 0, 0, tzinfo=TOKYO),  # 月曜日
+        datetime(2024, 1, 17, 15, 30, 0, tzinfo=TOKYO),  # 水曜日
+        datetime(2024, 1, 21, 23, 0, 0, tzinfo=TOKYO),  # 日曜日
+    ], ids=["monday", "midweek", "sunday"])
+    def test_get_week_boundaries(self, handler, target_date):
+        """指定日付を含む週の開始（月曜0:00）・終了（日曜23:59:59）日時を取得できることを確認"""
         # Act
         start, end = handler.get_week_boundaries(target_date)
         
         # Assert
-        # 週の開始は2024年1月15日（月）0:00
-        assert start.year == 2024
-        assert start.month == 1
-        assert start.day == 15
-        assert start.hour == 0
-        assert start.minute == 0
-        assert start.second == 0
+        assert start == WEEK_START
+        assert end == WEEK_END
         assert str(start.tzinfo) == "Asia/Tokyo"
-        
-        # 週の終了は2024年1月21日（日）23:59:59
-        assert end.year == 2024
-        assert end.month == 1
-        assert end.day == 21
-        assert end.hour == 23
-        assert end.minute == 59
-        assert end.second == 59
         assert str(end.tzinfo) == "Asia/Tokyo"
-    
-    def test_get_week_boundaries_midweek(self):
-        """週の途中の日付でも正しく週境界を取得できることを確認"""
-        # Arrange
-        handler = TimezoneHandler()
-        # 2024年1月17日（水曜日）の場合
-        target_date = datetime(2024, 1, 17, 15, 30, 0, tzinfo=ZoneInfo("Asia/Tokyo"))
-        
-        # Act
-        start, end = handler.get_week_boundaries(target_date)
-        
-        # Assert
-        # 週の開始は2024年1月15日（月）0:00
-        assert start.year == 2024
-        assert start.month == 1
-        assert start.day == 15
-        assert start.hour == 0
-        assert start.minute == 0
-        
-        # 週の終了は2024年1月21日（日）23:59:59
-        assert end.year == 2024
-        assert end.month == 1
-        assert end.day == 21
-        assert end.hour == 23
-        assert end.minute == 59
-    
-    def test_different_timezone_specification(self):
-        """デフォルト以外のタイムゾーンを指定できることを確認"""
-        # Arrange
-        handler = TimezoneHandler(display_timezone="America/New_York")
-        utc_dt = datetime(2024, 1, 15, 10, 30, 0, tzinfo=ZoneInfo("UTC"))
-        
-        # Act
-        local_dt = handler.utc_to_local(utc_dt)
-        
-        # Assert
-        # UTC 10:30 は ニューヨーク時間 5:30
-        assert local_dt.hour == 5
-        assert local_dt.minute == 30
-        assert str(local_dt.tzinfo) == "America/New_York"
-
-
-if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
@@ -1,14 +1,62 @@
 """ProductivityVisualizerのテスト"""
+import copy
+import sys
 import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
+import plotly.graph_objects as go
 from unittest.mock import Mock, patch
 
-from src.presentation_layer.visualizer import ProductivityVisualizer
+from src.presentation_layer.visualizer import ProductivityVisualizer, _BASE_LAYOUT
 from src.business_layer.timezone_handler import TimezoneHandler
 
 
+# グラフのHTMLに含まれるべき要素（小文字化したHTMLに対して確認する）
+_REQUIRED_MARKERS = ('<html>', '<div', 'plotly')
+
+
+def _render_figure(visualizer, weekly_data):
+    """HTML出力を差し替えてグラフを生成し、出力対象の図表とto_htmlの引数を返す"""
+    with patch.object(go.Figure, 'to_html', autospec=True,
+                      return_value='<html><div>Mock Chart</div></html>') as mock_to_html:
+        visualizer.create_productivity_chart(weekly_data)
+    
+    assert mock_to_html.called
+    args, kwargs = mock_to_html.call_args
+    return args[0], kwargs
+
+
+@pytest.fixture(scope="module")
+def sample_weekly_data():
+    """サンプル週次データ（週次データのフィクスチャはテストで変更しないためモジュール内で共有する）"""
+    return pd.DataFrame({
+        'week_start': pd.DatetimeIndex(['2024-01-15', '2024-01-22', '2024-01-29'], tz='UTC'),
+        'week_end': pd.DatetimeIndex(
+            ['2024-01-21 23:59:59', '2024-01-28 23:59:59', '2024-02-04 23:59:59'], tz='UTC'
+        ),
+        'pr_count': [5, 8, 3],
+        'unique_authors': [2, 4, 2],
+        'productivity': [2.5, 2.0, 1.5]
+    })
+
+
+@pytest.fixture(scope="module")
+def empty_weekly_data():
+    """空の週次データ"""
+    return pd.DataFrame(columns=['week_start', 'week_end', 'pr_count', 'unique_authors', 'productivity'])
+
+
+@pytest.fixture(scope="module")
+def large_weekly_data():
+    """plotly-resamplerで間引く点数の週次データ"""
+    point_count = ProductivityVisualizer.CHART_CONFIG['resample_min_points']
+    return pd.DataFrame({
+        'week_start': pd.date_range('1980-01-07', periods=point_count, freq='W-MON', tz='UTC'),
+        'productivity': np.linspace(1.0, 3.0, point_count)
+    })
+
+
 class TestProductivityVisualizer:
     """ProductivityVisualizerクラスのテスト"""
     
@@ -22,30 +70,6 @@ class TestProductivityVisualizer:
         """ProductivityVisualizerのフィクスチャ"""
         return ProductivityVisualizer(timezone_handler)
     
-    @pytest.fixture
-    def sample_weekly_data(self):
-        """サンプル週次データ"""
-        return pd.DataFrame({
-            'week_start': [
-                datetime(2024, 1, 15, 0, 0, tzinfo=timezone.utc),
-                datetime(2024, 1, 22, 0, 0, tzinfo=timezone.utc),
-                datetime(2024, 1, 29, 0, 0, tzinfo=timezone.utc)
-            ],
-            'week_end': [
-                datetime(2024, 1, 21, 23, 59, 59, tzinfo=timezone.utc),
-                datetime(2024, 1, 28, 23, 59, 59, tzinfo=timezone.utc),
-                datetime(2024, 2, 4, 23, 59, 59, tzinfo=timezone.utc)
-            ],
-            'pr_count': [5, 8, 3],
-            'unique_authors': [2, 4, 2],
-            'productivity': [2.5, 2.0, 1.5]
-        })
-    
-    @pytest.fixture
-    def empty_weekly_data(self):
-        """空の週次データ"""
-        return pd.DataFrame(columns=['week_start', 'week_end', 'pr_count', 'unique_authors', 'productivity'])
-    
     def test_ProductivityVisualizerが正常に初期化される(self, timezone_handler):
         """正常系: ProductivityVisualizerが正常に初期化されることを確認"""
         visualizer = ProductivityVisualizer(timezone_handler)
@@ -60,10 +84,10 @@ class TestProductivityVisualizer:
         assert isinstance(result, str)
         assert len(result) > 0
         
-        # 基本的なHTML構造があることを確認
-        assert '<html>' in result.lower()
-        assert '<div' in result.lower()
-        assert 'plotly' in result.lower()
+        # 基本的なHTML構造があることを確認（小文字化は1回だけ行う）
+        lowered = result.lower()
+        for marker in _REQUIRED_MARKERS:
+            assert marker in lowered
     
     def test_グラフタイトルが正しく設定される(self, visualizer, sample_weekly_data):
         """正常系: グラフのタイトルが正しく設定されることを確認"""
@@ -74,76 +98,77 @@ class TestProductivityVisualizer:
     
     def test_X軸に週の開始日が使用される(self, visualizer, sample_weekly_data):
         """正常系: X軸に週の開始日が使用されることを確認"""
-        with patch('plotly.graph_objects.Scatter') as mock_scatter:
-            mock_trace = Mock()
-            mock_scatter.return_value = mock_trace
-            with patch('plotly.graph_objects.Figure') as mock_figure_class:
-                mock_figure = Mock()
-                mock_figure.to_html.return_value = '<html><div>Mock Chart</div></html>'
-                mock_figure_class.return_value = mock_figure
-                
-                result = visualizer.create_productivity_chart(sample_weekly_data)
-                
-                # Scatterトレースが作成されたことを確認
-                assert mock_scatter.called
-                
-                # Scatterに渡された引数を確認
-                args, kwargs = mock_scatter.call_args
-                
-                # X軸データが日付形式であることを確認
-                assert 'x' in kwargs
-                x_data = kwargs['x']
-                assert len(x_data) == len(sample_weekly_data)
-                # 日付形式の文字列であることを確認
-                assert all(isinstance(date, str) and '-' in date for date in x_data)
+        fig, _ = _render_figure(visualizer, sample_weekly_data)
+        
+        # X軸データが日付形式であることを確認
+        x_data = fig._data[0]['x']
+        assert len(x_data) == len(sample_weekly_data)
+        # 日付形式の文字列であることを確認
+        assert all(isinstance(date, str) and '-' in date for date in x_data)
     
     def test_Y軸に生産性が使用される(self, visualizer, sample_weekly_data):
         """正常系: Y軸に生産性が使用されることを確認"""
-        with patch('plotly.graph_objects.Scatter') as mock_scatter:
-            mock_trace = Mock()
-            mock_scatter.return_value = mock_trace
-            with patch('plotly.graph_objects.Figure') as mock_figure_class:
-                mock_figure = Mock()
-                mock_figure.to_html.return_value = '<html><div>Mock Chart</div></html>'
-                mock_figure_class.return_value = mock_figure
-                
-                result = visualizer.create_productivity_chart(sample_weekly_data)
-                
-                # Scatterトレースが作成されたことを確認
-                assert mock_scatter.called
-                
-                # Scatterに渡された引数を確認
-                args, kwargs = mock_scatter.call_args
-                
-                # Y軸データが生産性データと一致することを確認
-                assert 'y' in kwargs
-                y_data = kwargs['y']
-                expected_y_data = sample_weekly_data['productivity'].tolist()
-                assert y_data == expected_y_data
+        fig, _ = _render_figure(visualizer, sample_weekly_data)
+        
+        # Y軸データが生産性データと一致することを確認
+        y_data = fig._data[0]['y']
+        expected_y_data = sample_weekly_data['productivity'].tolist()
+        assert y_data.tolist() == expected_y_data
+        # 要素ごとの変換を避けるためfloat64のndarrayで渡されることを確認
+        assert isinstance(y_data, np.ndarray) and y_data.dtype == np.float64
     
     def test_青色の線グラフが作成される(self, visualizer, sample_weekly_data):
         """正常系: 青色のマーカー付き線グラフが作成されることを確認"""
-        with patch('plotly.graph_objects.Scatter') as mock_scatter:
-            mock_scatter.return_value = Mock()
-            with patch('plotly.graph_objects.Figure') as mock_figure_class:
-                mock_figure = Mock()
-                mock_figure.to_html.return_value = '<html><div>Mock Chart</div></html>'
-                mock_figure_class.return_value = mock_figure
-                
-                result = visualizer.create_productivity_chart(sample_weekly_data)
-                
-                # Scatterトレースが作成されたことを確認
-                assert mock_scatter.called
-                
-                # 呼び出し引数を確認
-                args, kwargs = mock_scatter.call_args
-                
-                # 線+マーカーモードが指定されることを確認
-                assert 'mode' in kwargs
-                assert 'lines+markers' in kwargs['mode'] or 'markers+lines' in kwargs['mode']
-                
-                # 青色が指定されることを確認
-                assert 'line' in kwargs or 'marker' in kwargs
+        fig, _ = _render_figure(visualizer, sample_weekly_data)
+        trace = fig._data[0]
+        
+        # 線+マーカーモードが指定されることを確認（少数のデータはSVGで描画）
+        assert trace['type'] == 'scatter'
+        assert trace['mode'] in ('lines+markers', 'markers+lines')
+        
+        # 青色が指定されることを確認
+        assert trace['line']['color'] == 'blue'
+        assert trace['marker']['color'] == 'blue'
+    
+    def test_データ点数が多い場合はWebGLで描画される(self, visualizer):
+        """正常系: 点数が閾値以上の場合はscattergl、未満の場合はscatterで描画されることを確認"""
+        threshold = ProductivityVisualizer.CHART_CONFIG['webgl_min_points']
+        large_data = pd.DataFrame({
+            'week_start': pd.date_range('2020-01-06', periods=threshold, freq='W-MON', tz='UTC'),
+            'productivity': np.linspace(1.0, 3.0, threshold),
+            'moving_average': np.linspace(1.0, 3.0, threshold)
+        })
+        
+        large_fig, _ = _render_figure(visualizer, large_data)
+        small_fig, _ = _render_figure(visualizer, large_data.iloc[:threshold - 1])
+        
+        assert [trace['type'] for trace in large_fig._data] == ['scattergl', 'scattergl']
+        assert [trace['type'] for trace in small_fig._data] == ['scatter', 'scatter']
+    
+    def test_大量データはresamplerで間引かれる(self, visualizer, large_weekly_data):
+        """正常系: 点数が閾値以上の場合はFigureResamplerに高解像度データとして渡されることを確認"""
+        mock_resampler_class = Mock()
+        mock_resampler_class.return_value.to_html.return_value = '<html><div>Mock Chart</div></html>'
+        
+        with patch.dict(sys.modules, {'plotly_resampler': Mock(FigureResampler=mock_resampler_class)}):
+            result = visualizer.create_productivity_chart(large_weekly_data)
+        
+        assert result == '<html><div>Mock Chart</div></html>'
+        _, resampler_kwargs = mock_resampler_class.call_args
+        assert resampler_kwargs['default_n_shown_samples'] == ProductivityVisualizer.CHART_CONFIG['resampled_points']
+        
+        # x/yはトレース定義ではなくhf_x/hf_yとして渡されることを確認
+        (trace,), add_trace_kwargs = mock_resampler_class.return_value.add_trace.call_args
+        assert 'x' not in trace and 'y' not in trace
+        assert len(add_trace_kwargs['hf_x']) == len(large_weekly_data)
+        assert add_trace_kwargs['hf_y'].tolist() == large_weekly_data['productivity'].tolist()
+    
+    def test_resampler未導入時は全データを描画する(self, visualizer, large_weekly_data):
+        """正常系: plotly-resamplerが利用できない場合は全データを含む図表が作成されることを確認"""
+        with patch.dict(sys.modules, {'plotly_resampler': None}):
+            fig, _ = _render_figure(visualizer, large_weekly_data)
+        
+        assert len(fig._data[0]['x']) == len(large_weekly_data)
     
     def test_空データの適切な処理(self, visualizer, empty_weekly_data):
         """正常系: 空のデータが適切に処理されることを確認"""
@@ -154,8 +179,43 @@ class TestProductivityVisualizer:
         assert len(result) > 0
         
         # 基本的なHTML構造があることを確認
-        assert '<html>' in result.lower()
-        assert '<div' in result.lower()
+        lowered = result.lower()
+        assert '<html>' in lowered
+        assert '<div' in lowered
+    
+    def test_空データのHTMLは初回のみ生成される(self, visualizer, empty_weekly_data):
+        """正常系: 空のデータに対するHTMLは2回目以降Plotlyで生成せず同じものを返すことを確認"""
+        with patch.object(visualizer, '_create_figure', wraps=visualizer._create_figure) as mock_create_figure:
+            first = visualizer.create_productivity_chart(empty_weekly_data)
+            second = visualizer.create_productivity_chart(empty_weekly_data)
+        
+        assert first == second
+        mock_create_figure.assert_called_once()
+    
+    def test_chart_cache_hit_returns_identical_html(self, visualizer, sample_weekly_data):
+        """正常系: 同じ入力では生成済みのHTMLを返し、内容が変わった場合は再生成することを確認"""
+        changed_data = sample_weekly_data.assign(productivity=[2.5, 2.0, 1.0])
+        
+        with patch.object(visualizer, '_create_figure', wraps=visualizer._create_figure) as mock_create_figure:
+            first = visualizer.create_productivity_chart(sample_weekly_data)
+            second = visualizer.create_productivity_chart(sample_weekly_data.copy())
+            assert mock_create_figure.call_count == 1
+            
+            changed = visualizer.create_productivity_chart(changed_data)
+            assert mock_create_figure.call_count == 2
+        
+        assert first == second
+        assert changed != first
+    
+    def test_グラフのキャッシュは上限件数を超えると古いものから破棄される(self, visualizer, sample_weekly_data):
+        """正常系: キャッシュ件数が上限を超えた場合に最も古いエントリが破棄されることを確認"""
+        cache_size = ProductivityVisualizer.CHART_CONFIG['chart_cache_size']
+        for window in range(cache_size + 1):
+            visualizer.create_productivity_chart(sample_weekly_data, moving_average_window=window)
+        
+        assert len(visualizer._chart_cache) == cache_size
+        oldest_key = visualizer._generate_chart_cache_key(sample_weekly_data, 0)
+        assert oldest_key not in visualizer._chart_cache
     
     def test_日付フォーマットが適切に処理される(self, visualizer):
         """正常系: 日付フォーマットが適切に処理されることを確認"""
@@ -176,57 +236,47 @@ class TestProductivityVisualizer:
     
     def test_ローカルタイムゾーンでの日付表示(self, visualizer, sample_weekly_data):
         """正常系: 日付がローカルタイムゾーンで表示されることを確認"""
-        with patch.object(visualizer.timezone_handler, 'utc_to_local') as mock_convert:
-            # モックの戻り値を設定
-            mock_convert.side_effect = lambda dt: dt.replace(tzinfo=timezone.utc)
-            
-            result = visualizer.create_productivity_chart(sample_weekly_data)
-            
-            # timezone_handlerが呼び出されたことを確認
-            assert mock_convert.called
-            
-            # 各週の開始日に対してタイムゾーン変換が呼ばれることを確認
-            assert mock_convert.call_count >= len(sample_weekly_data)
+        handler = visualizer.timezone_handler
+        with patch.object(handler, 'utc_to_local_series', wraps=handler.utc_to_local_series) as mock_convert, \
+                patch.object(handler, 'utc_to_local') as mock_convert_one:
+            fig, _ = _render_figure(visualizer, sample_weekly_data)
+        
+        # 週の開始日は1件ずつではなく列単位で1回だけ変換されることを確認
+        mock_convert.assert_called_once()
+        mock_convert_one.assert_not_called()
+        
+        # X軸の日付がローカルタイムゾーン（Asia/Tokyo）での日付になっていることを確認
+        expected_dates = [handler.utc_to_local(dt).strftime('%Y-%m-%d') for dt in sample_weekly_data['week_start']]
+        assert fig._data[0]['x'].tolist() == expected_dates
     
     def test_グラフのレイアウト設定が正しく行われる(self, visualizer, sample_weekly_data):
         """正常系: グラフのレイアウトが正しく設定されることを確認"""
-        with patch('plotly.graph_objects.Figure') as mock_figure_class:
-            mock_figure = Mock()
-            mock_figure.to_html.return_value = '<html><div>Mock Chart</div></html>'
-            mock_figure_class.return_value = mock_figure
-            
-            result = visualizer.create_productivity_chart(sample_weekly_data)
-            
-            # update_layoutが呼ばれたことを確認
-            assert mock_figure.update_layout.called
-            
-            # レイアウト設定の確認
-            args, kwargs = mock_figure.update_layout.call_args
-            
-            # タイトルが設定されることを確認
-            assert 'title' in kwargs
-            
-            # X軸とY軸のラベルが設定されることを確認
-            assert 'xaxis_title' in kwargs or 'xaxis' in kwargs
-            assert 'yaxis_title' in kwargs or 'yaxis' in kwargs
+        fig, _ = _render_figure(visualizer, sample_weekly_data)
+        layout = fig._layout
+        
+        # タイトルが設定されることを確認
+        assert layout['title']['text'] == '週次生産性の推移'
+        
+        # X軸とY軸のラベルが設定されることを確認
+        assert layout['xaxis']['title']['text']
+        assert layout['yaxis']['title']['text']
+    
+    def test_共通レイアウトが呼び出し間で変更されない(self, visualizer, sample_weekly_data, empty_weekly_data):
+        """正常系: 注釈を追加する空データのグラフを作成しても共通レイアウトが変更されないことを確認"""
+        base_layout_before = copy.deepcopy(_BASE_LAYOUT)
+        
+        visualizer.create_productivity_chart(empty_weekly_data)
+        fig, _ = _render_figure(visualizer, sample_weekly_data)
+        
+        assert _BASE_LAYOUT == base_layout_before
+        assert 'annotations' not in fig._layout
     
     def test_HTML出力の設定が正しく行われる(self, visualizer, sample_weekly_data):
         """正常系: HTML出力の設定が正しく行われることを確認"""
-        with patch('plotly.graph_objects.Figure') as mock_figure_class:
-            mock_figure = Mock()
-            mock_figure.to_html.return_value = '<html><div>Mock Chart</div></html>'
-            mock_figure_class.return_value = mock_figure
-            
-            result = visualizer.create_productivity_chart(sample_weekly_data)
-            
-            # to_htmlが呼ばれたことを確認
-            assert mock_figure.to_html.called
-            
-            # HTML設定が含まれることを確認
-            args, kwargs = mock_figure.to_html.call_args
-            
-            # include_plotlyjsの設定確認（自己完結型HTML）
-            assert 'include_plotlyjs' in kwargs
+        _, kwargs = _render_figure(visualizer, sample_weekly_data)
+        
+        # plotly.jsはHTMLに埋め込まずCDNから読み込むことを確認
+        assert kwargs['include_plotlyjs'] == 'cdn'
     
     def test_不正なデータ型の処理(self, visualizer):
         """異常系: 不正なデータ型が渡された場合の処理を確認"""
@@ -284,39 +334,26 @@ class TestMovingAverageVisualization:
         assert isinstance(result, str)
         assert len(result) > 0
         
-        # 基本的なHTML構造があることを確認
-        assert '<html>' in result.lower()
-        assert '<div' in result.lower()
-        assert 'plotly' in result.lower()
+        # 基本的なHTML構造があることを確認（小文字化は1回だけ行う）
+        lowered = result.lower()
+        for marker in _REQUIRED_MARKERS:
+            assert marker in lowered
     
     def test_移動平均線が赤色の破線で表示される(self, visualizer, sample_data_with_moving_average):
         """正常系: 移動平均が赤色の破線で表示されることを確認"""
-        with patch('plotly.graph_objects.Scatter') as mock_scatter:
-            mock_scatter.return_value = Mock()
-            with patch('plotly.graph_objects.Figure') as mock_figure_class:
-                mock_figure = Mock()
-                mock_figure.to_html.return_value = '<html><div>Mock Chart</div></html>'
-                mock_figure_class.return_value = mock_figure
-                
-                result = visualizer.create_productivity_chart(sample_data_with_moving_average)
-                
-                # Scatterが2回呼ばれることを確認（生産性と移動平均）
-                assert mock_scatter.call_count == 2
-                
-                # 2回目の呼び出し（移動平均）の引数を確認
-                second_call_args, second_call_kwargs = mock_scatter.call_args_list[1]
-                
-                # 移動平均の名前が設定されることを確認
-                assert 'name' in second_call_kwargs
-                assert '移動平均' in second_call_kwargs['name']
-                
-                # 赤色の破線が設定されることを確認
-                assert 'line' in second_call_kwargs
-                line_config = second_call_kwargs['line']
-                assert 'color' in line_config
-                assert line_config['color'] == 'red'
-                assert 'dash' in line_config
-                assert line_config['dash'] == 'dash'
+        fig, _ = _render_figure(visualizer, sample_data_with_moving_average)
+        
+        # トレースが2本作成されることを確認（生産性と移動平均）
+        assert len(fig._data) == 2
+        moving_average_trace = fig._data[1]
+        
+        # 移動平均の名前が設定されることを確認
+        assert '移動平均' in moving_average_trace['name']
+        
+        # 赤色の破線が設定されることを確認
+        line_config = moving_average_trace['line']
+        assert line_config['color'] == 'red'
+        assert line_config['dash'] == 'dash'
     
     def test_移動平均なしデータでも正常動作する(self, visualizer):
         """正常系: 移動平均カラムがないデータでも正常動作することを確認"""
@@ -335,21 +372,11 @@ class TestMovingAverageVisualization:
         assert len(result) > 0
     
     def test_凡例が適切に設定される(self, visualizer, sample_data_with_moving_average):
-        """正常系: 凡例が適切に設定されることを確認"""  
-        with patch('plotly.graph_objects.Figure') as mock_figure_class:
-            mock_figure = Mock()
-            mock_figure.to_html.return_value = '<html><div>Mock Chart</div></html>'
-            mock_figure_class.return_value = mock_figure
-            
-            result = visualizer.create_productivity_chart(sample_data_with_moving_average)
-            
-            # update_layoutが呼ばれることを確認
-            assert mock_figure.update_layout.called
-            
-            # レイアウト設定に凡例の設定が含まれることを確認
-            args, kwargs = mock_figure.update_layout.call_args
-            assert 'showlegend' in kwargs
-            assert kwargs['showlegend'] is True
+        """正常系: 凡例が適切に設定されることを確認"""
+        fig, _ = _render_figure(visualizer, sample_data_with_moving_average)
+        
+        # レイアウト設定に凡例の設定が含まれることを確認
+        assert fig._layout['showlegend'] is True
 
 
 class TestStatisticsCalculation:
@@ -507,10 +534,7 @@ class TestHtmlReportGeneration:
             ['repo1']
         )
         
-        # Plotlyグラフの存在を確認
-        assert 'plotly' in result.lower()
-        assert '<div' in result
-        
-        # 基本的なHTML構造を確認
-        assert '<html>' in result.lower()
-        assert '</html>' in result.lower()
\ No newline at end of file
+        # Plotlyグラフと基本的なHTML構造の存在を確認
+        lowered = result.lower()
+        for marker in _REQUIRED_MARKERS + ('</html>',):
+            assert marker in lowered
\ No newline at end of file